@@ -9,9 +9,6 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QLocale
 from PyQt6.QtGui import QFont, QColor, QPixmap, QPainter, QPen
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 
 
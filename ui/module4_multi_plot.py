@@ -30,12 +30,107 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QKeyEvent, QKeySequence
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+import numpy as np
 from ui.bh_settings_dialog import BHSettingsDialog
 
 
+# Matplotlib is imported on first plot/export (see _ensure_mpl) to keep startup fast
+mpl = None
+Figure = None
+FigureCanvas = None
+Rectangle = None
+Line2D = None
+PatchCollection = None
+LineCollection = None
+
+
+def _ensure_mpl():
+    """Import matplotlib on first use and bind it to the module-level names"""
+    global mpl, Figure, FigureCanvas, Rectangle, Line2D, PatchCollection, LineCollection
+    if mpl is not None:
+        return
+
+    import matplotlib
+    from matplotlib.figure import Figure as _Figure
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+    from matplotlib.patches import Rectangle as _Rectangle
+    from matplotlib.lines import Line2D as _Line2D
+    from matplotlib.collections import PatchCollection as _PatchCollection
+    from matplotlib.collections import LineCollection as _LineCollection
+
+    mpl = matplotlib
+    Figure = _Figure
+    FigureCanvas = FigureCanvasQTAgg
+    Rectangle = _Rectangle
+    Line2D = _Line2D
+    PatchCollection = _PatchCollection
+    LineCollection = _LineCollection
+
+
+# Sand dot pattern: number of dots and fixed RNG seed per consistency.
+# Seeds are fixed (not hash()-based) so the pattern is identical across runs.
+SAND_DOT_COUNTS = {
+    'Loose': 30,
+    'Loose to Medium': 50,
+    'Medium Dense': 80,
+    'Dense': 120,
+    'Very Dense': 180,
+}
+_CONS_SEED = {
+    'Loose': 1,
+    'Loose to Medium': 2,
+    'Medium Dense': 3,
+    'Dense': 4,
+    'Very Dense': 5,
+}
+
+# Clay line pattern: number of horizontal lines per consistency
+CLAY_LINE_COUNTS = {
+    'Very Soft': 3,
+    'Soft': 5,
+    'Medium': 7,
+    'Stiff': 10,
+    'Very Stiff': 15,
+    'Hard': 20,
+}
+
+# Numeric parameters stored per borehole in plot_series
+PLOT_PARAM_KEYS = ('gamma_sat', 'spt', 'su', 'phi', 'e_modulus', 'k0')
+
+# Default scatter colors for boreholes without display settings
+BH_DEFAULT_COLORS = ("#007BFF7B", "#5EC7348B", '#FF9F0A', "#FF3A308F", "#5856D68D", "#AF52DE90")
+
+# Cache of dot positions in the unit square, keyed by consistency
+_unit_dots_cache = {}
+
+
+def _get_unit_sand_dots(consistency):
+    """Return cached (x, y) dot positions in the unit square for a sand consistency"""
+    dots = _unit_dots_cache.get(consistency)
+    if dots is None:
+        num_dots = SAND_DOT_COUNTS.get(consistency, 50)
+        rng = np.random.default_rng(_CONS_SEED.get(consistency, 0))
+        dots = rng.uniform(0.0, 1.0, size=(2, num_dots))
+        _unit_dots_cache[consistency] = dots
+    return dots
+
+
+def _module3_signature(results, bh_settings):
+    """Return a hashable snapshot of the Module 3 values that Module 4 plots"""
+    return (
+        tuple(
+            (bh_name, tuple(
+                (result['depth'], result.get('gamma_sat'), result.get('n_value'), result.get('su'),
+                 result.get('phi'), result.get('e_modulus'), result.get('k0'),
+                 result.get('classification', ''))
+                for result in bh_results
+            ))
+            for bh_name, bh_results in results.items()
+        ),
+        tuple((bh_name, tuple(sorted(settings.items()))) for bh_name, settings in bh_settings.items()),
+    )
+
+
 class CustomTableWidget(QTableWidget):
     """Custom table widget with Enter key navigation and paste support"""
 
@@ -114,9 +209,13 @@ class Module4MultiPlot(QWidget):
 
         # Data storage
         self.plot_data = {}  # {BH_name: {depth: {param: value}}}
+        self.plot_series = {}  # {BH_name: {'depth': array, param: array}} sorted by depth
         self.bh_names = []
         self.bh_settings = {}  # {BH_name: {'surface_elev': 100.0}}
         self.bh_display_settings = {}  # {BH_name: {'symbol', 'label', 'size', 'color'}}
+        self._bh_style_cache = {}  # {BH_name: (rgba, marker, size^2)} - cleared when BHs/settings change
+        self._module3_signature = None  # Signature of the last Module 3 results loaded
+        self._figure_pool = {}  # {plot_key: (canvas, ax)} - at most one Figure per plot
 
         # Parameters to plot
         self.parameters = {
@@ -127,6 +226,8 @@ class Module4MultiPlot(QWidget):
             'e_modulus': {'label': "E/E'", 'unit': '(kN/m²)', 'enabled': True},
             'k0': {'label': 'K0', 'unit': '', 'enabled': True},
         }
+        self._param_label_text = {}  # {param_key: 'label unit'} - rebuilt with parameters
+        self._refresh_param_labels()
 
         # Axis limits for each parameter
         self.axis_limits = {
@@ -796,23 +897,7 @@ class Module4MultiPlot(QWidget):
             return
 
         # Convert Module 3 results to plot data
-        self.plot_data = {}
-        self.bh_names = list(results.keys())
-        self.bh_settings = bh_settings  # Store surface elevation data
-
-        for bh_name, bh_results in results.items():
-            self.plot_data[bh_name] = {}
-            for result in bh_results:
-                depth = result['depth']
-                self.plot_data[bh_name][depth] = {
-                    'gamma_sat': result.get('gamma_sat'),
-                    'spt': result.get('n_value'),
-                    'su': result.get('su'),
-                    'phi': result.get('phi'),
-                    'e_modulus': result.get('e_modulus'),
-                    'k0': result.get('k0'),
-                    'classification': result.get('classification', '')
-                }
+        self._set_module3_results(results, bh_settings)
 
         # Update plots
         self.update_plots()
@@ -820,7 +905,8 @@ class Module4MultiPlot(QWidget):
 
     def refresh_from_module3(self):
         """Auto-refresh: called whenever Module 3 emits results_updated.
-        Always does a full silent reload — works on first calculation too."""
+        Silent reload — works on first calculation too. Skipped when the
+        plotted values are unchanged since the last load."""
         if not self.module3:
             return
 
@@ -833,10 +919,23 @@ class Module4MultiPlot(QWidget):
         if not results:
             return
 
+        # Nothing to redraw if the plotted values did not change
+        if _module3_signature(results, bh_settings) == self._module3_signature:
+            return
+
         # Full reload (silent — no message boxes)
+        self._set_module3_results(results, bh_settings)
+
+        self.update_plots()
+        self.info_label.setText(f"Loaded data for {len(self.bh_names)} borehole(s) from Module 3")
+
+    def _set_module3_results(self, results, bh_settings):
+        """Convert Module 3 results to plot_data and rebuild the derived arrays"""
         self.plot_data = {}
         self.bh_names = list(results.keys())
-        self.bh_settings = bh_settings
+        self.bh_settings = bh_settings  # Store surface elevation data
+        self._bh_style_cache = {}
+        self._module3_signature = _module3_signature(results, bh_settings)
 
         for bh_name, bh_results in results.items():
             self.plot_data[bh_name] = {}
@@ -851,23 +950,68 @@ class Module4MultiPlot(QWidget):
                     'k0': result.get('k0'),
                     'classification': result.get('classification', '')
                 }
+        self._rebuild_plot_series()
+
+    def _rebuild_plot_series(self):
+        """Rebuild depth-sorted arrays from plot_data (missing values become NaN)"""
+        self.plot_series = {}
+        for bh_name, depth_data in self.plot_data.items():
+            depths = sorted(depth_data, key=float)
+            series = {'depth': np.array(depths, dtype=float)}
+            for param_key in PLOT_PARAM_KEYS:
+                series[param_key] = np.array(
+                    [depth_data[depth].get(param_key) for depth in depths], dtype=float
+                )
+            self.plot_series[bh_name] = series
+
+    def _get_bh_series(self, bh_name, param_key, surface_elev, use_elevation):
+        """Return (values, y_values) arrays for one borehole, skipping missing values"""
+        series = self.plot_series.get(bh_name)
+        if series is None or param_key not in series:
+            return np.empty(0), np.empty(0)
+
+        values = series[param_key]
+        has_value = ~np.isnan(values)
+        depths = series['depth'][has_value]
+        # Elevation = Surface - Depth
+        y_values = surface_elev - depths if use_elevation else depths
+        return values[has_value], y_values
+
+    def _refresh_param_labels(self):
+        """Precompute x-axis label text for each parameter"""
+        self._param_label_text = {
+            param_key: f"{param_info['label']} {param_info['unit']}".strip()
+            for param_key, param_info in self.parameters.items()
+        }
 
-        self.update_plots()
-        self.info_label.setText(f"Loaded data for {len(self.bh_names)} borehole(s) from Module 3")
+    def _get_bh_style(self, index, bh_name):
+        """Return cached (rgba, marker, size) scatter style for a borehole"""
+        style = self._bh_style_cache.get(bh_name)
+        if style is None:
+            default_color = BH_DEFAULT_COLORS[index % len(BH_DEFAULT_COLORS)]
+            settings = self.bh_display_settings.get(bh_name, {})
+            style = (
+                mpl.colors.to_rgba(settings.get('color', default_color)),
+                settings.get('symbol', 'o'),
+                settings.get('size', 5) ** 2,  # scatter uses size^2, default=5
+            )
+            self._bh_style_cache[bh_name] = style
+        return style
 
     def update_plots(self):
         """Update all parameter plots (horizontal layout)"""
-        # Clear existing plots
+        # Detach existing plots (canvases stay in the figure pool for reuse)
         while self.plot_layout.count():
             child = self.plot_layout.takeAt(0)
             if child.widget():
-                child.widget().deleteLater()
+                child.widget().hide()
 
         # Add Soil Profile plot first if checkbox is checked
         if self.soil_profile_checkbox.isChecked():
             soil_profile_widget = self._create_soil_profile_plot()
             if soil_profile_widget:
                 self.plot_layout.addWidget(soil_profile_widget, stretch=1)
+                soil_profile_widget.show()
 
         if not self.plot_data:
             return
@@ -877,10 +1021,38 @@ class Module4MultiPlot(QWidget):
             if param_info['enabled']:
                 plot_widget = self._create_parameter_plot(param_key, param_info)
                 self.plot_layout.addWidget(plot_widget, stretch=1)  # Equal distribution
+                plot_widget.show()
+
+    def _get_pooled_figure(self, plot_key):
+        """Return (canvas, ax) for a plot, reusing the pooled Figure when available"""
+        pooled = self._figure_pool.get(plot_key)
+        if pooled is not None:
+            canvas, ax = pooled
+            # Apply Apple-style theme before clearing so the reset axes pick it up
+            self._apply_plot_style()
+            ax.clear()
+            return pooled
 
-    def _create_soil_profile_plot(self):
-        """Create Soil Profile plot based on Parameters Selected table"""
-        # Read data from line_table
+        _ensure_mpl()
+
+        # Create figure and canvas - reduced width to show y-axis labels
+        figure = Figure(figsize=(4, 7), dpi=80)
+        canvas = FigureCanvas(figure)
+        # No min/max width - allow graphs to compress and fit within container
+
+        # Apply Apple-style theme
+        self._apply_plot_style()
+
+        # Create axes with adjusted left margin for y-axis labels
+        ax = figure.add_subplot(111)
+        figure.subplots_adjust(left=0.2, right=0.95, top=0.92, bottom=0.08)
+
+        pooled = (canvas, ax)
+        self._figure_pool[plot_key] = pooled
+        return pooled
+
+    def _get_soil_layers(self):
+        """Read soil layers (rows with Soil Type and Consistency) from the Parameters Selected table"""
         layers = []
         for row in range(self.line_table.rowCount()):
             try:
@@ -908,296 +1080,150 @@ class Module4MultiPlot(QWidget):
             except (ValueError, AttributeError):
                 continue
 
+        return layers
+
+    def _create_soil_profile_plot(self):
+        """Create Soil Profile plot based on Parameters Selected table"""
+        layers = self._get_soil_layers()
         if not layers:
             return None
 
-        # Create figure and canvas
-        figure = Figure(figsize=(4, 7), dpi=80)
-        canvas = FigureCanvas(figure)
-
-        # Apply plot style
-        self._apply_plot_style()
-
-        # Create axes
-        ax = figure.add_subplot(111)
-
-        # Get Y-axis mode
-        y_axis_mode = self.y_axis_combo.currentText()
-        use_elevation = (y_axis_mode == "Elevation")
-
-        # Get axis limits for Soil Profile
-        soil_limits = self.axis_limits.get('soil', {'ymin': 100, 'ymax': 70})
-        y_top = soil_limits['ymin']     # Top of the profile (e.g., 100)
-        y_bottom = soil_limits['ymax']  # Bottom of the profile (e.g., 70)
-
-        for layer in layers:
-            y_start = layer['from']
-            y_end = layer['to']
-
-            # Draw layer rectangle
-            ax.add_patch(plt.Rectangle((0, min(y_start, y_end)), 1, abs(y_start - y_end),
-                                      facecolor='white', edgecolor='black', linewidth=1))
-
-            # Draw pattern based on consistency
-            self._draw_soil_pattern(ax, 0, 1, min(y_start, y_end), max(y_start, y_end),
-                                   layer['soil_type'], layer['consistency'])
-
-            # Add text label
-            mid_y = (y_start + y_end) / 2
-            ax.text(0.5, mid_y, f"{layer['consistency']}\n{layer['soil_type']}",
-                   ha='center', va='center', fontsize=8, fontweight='bold')
-
-        # Set axis properties
-        ax.set_xlim(0, 1)
-        ax.set_ylim(y_bottom, y_top)  # y_bottom at bottom, y_top at top (e.g., 70 to 100)
-        ax.set_xlabel('', fontsize=9)
-        y_label = 'Elevation (m)' if use_elevation else 'Depth (m)'
-        ax.set_ylabel(y_label, fontsize=9, fontweight='bold')
-        ax.set_title('Soil Profile', fontsize=11, fontweight='bold', pad=15)
-        ax.set_xticks([])
-        ax.grid(True, alpha=0.7, axis='y')
-
-        # Adjust subplot
-        figure.subplots_adjust(left=0.2, right=0.95, top=0.92, bottom=0.08)
+        canvas, ax = self._get_pooled_figure('soil')
+        self._plot_soil_profile_on_axis(ax, layers)
+        canvas.draw_idle()
 
         return canvas
 
-    def _draw_soil_pattern(self, ax, x_start, x_end, y_start, y_end, soil_type, consistency):
-        """Draw soil pattern based on soil type and consistency"""
-        import numpy as np
-
+    def _get_soil_pattern(self, x_start, x_end, y_start, y_end, soil_type, consistency):
+        """Return the soil pattern for one layer as (dot_x, dot_y, line_segments)
+        Sand uses dots (density varies by consistency), Clay uses horizontal lines.
+        """
         if soil_type == "Sand":
-            # Draw dots pattern (density varies by consistency)
-            if consistency == "Loose":
-                num_dots = 30
-            elif consistency == "Loose to Medium":
-                num_dots = 50
-            elif consistency == "Medium Dense":
-                num_dots = 80
-            elif consistency == "Dense":
-                num_dots = 120
-            elif consistency == "Very Dense":
-                num_dots = 180
-            else:
-                num_dots = 50
+            unit_x, unit_y = _get_unit_sand_dots(consistency)
+            x_dots = x_start + unit_x * (x_end - x_start)
+            y_dots = y_start + unit_y * (y_end - y_start)
+            return x_dots, y_dots, []
 
-            # Random dots
-            np.random.seed(hash(consistency) % 1000)
-            x_dots = np.random.uniform(x_start, x_end, num_dots)
-            y_dots = np.random.uniform(y_start, y_end, num_dots)
-            ax.scatter(x_dots, y_dots, s=1, c='black', alpha=0.6)
-
-        elif soil_type == "Clay":
-            # Draw horizontal lines pattern (density varies by consistency)
-            if consistency == "Very Soft":
-                num_lines = 3
-            elif consistency == "Soft":
-                num_lines = 5
-            elif consistency == "Medium":
-                num_lines = 7
-            elif consistency == "Stiff":
-                num_lines = 10
-            elif consistency == "Very Stiff":
-                num_lines = 15
-            elif consistency == "Hard":
-                num_lines = 20
-            else:
-                num_lines = 7
+        if soil_type == "Clay":
+            # Horizontal lines (density varies by consistency)
+            num_lines = CLAY_LINE_COUNTS.get(consistency, 7)
+            y_positions = y_start + (np.arange(num_lines) + 0.5) * (y_end - y_start) / num_lines
+            segments = [((x_start, y_pos), (x_end, y_pos)) for y_pos in y_positions]
+            return None, None, segments
 
-            # Horizontal lines
-            for i in range(num_lines):
-                y_pos = y_start + (i + 0.5) * (y_end - y_start) / num_lines
-                ax.plot([x_start, x_end], [y_pos, y_pos], 'k-', linewidth=0.5, alpha=0.6)
+        return None, None, []
 
     def _create_parameter_plot(self, param_key, param_info):
         """Create a single parameter plot"""
-        # Create figure and canvas - reduced width to show y-axis labels
-        figure = Figure(figsize=(4, 7), dpi=80)
-        canvas = FigureCanvas(figure)
-        # No min/max width - allow graphs to compress and fit within container
-
-        # Apply Apple-style theme
-        self._apply_plot_style()
-
-        # Create axes with adjusted left margin for y-axis labels
-        ax = figure.add_subplot(111)
-
-        # Get Y-axis mode (Depth or Elevation)
-        y_axis_mode = self.y_axis_combo.currentText()
-        use_elevation = (y_axis_mode == "Elevation")
-
-        # Colors for each borehole
-        colors = ["#007BFF7B", "#5EC7348B", '#FF9F0A', "#FF3A308F", "#5856D68D", "#AF52DE90"]
-
-        # Plot each borehole
-        for i, bh_name in enumerate(self.bh_names):
-            y_values = []
-            values = []
-
-            # Get surface elevation for this borehole
-            settings = self.bh_settings.get(bh_name, {'surface_elev': 100.0, 'water_level': 0.0})
-            surface_elev = settings['surface_elev']
-
-            # Sort by depth
-            for depth, data in sorted(self.plot_data[bh_name].items()):
-                value = data.get(param_key)
-                if value is not None:
-                    # Ensure depth is float (should already be after loading)
-                    depth_float = float(depth) if isinstance(depth, str) else depth
-
-                    # Calculate Y value based on mode
-                    if use_elevation:
-                        y_values.append(surface_elev - depth_float)  # Elevation = Surface - Depth
-                    else:
-                        y_values.append(depth_float)
-                    values.append(value)
-
-            if y_values:
-                # Get display settings for this borehole
-                if bh_name in self.bh_display_settings:
-                    settings = self.bh_display_settings[bh_name]
-                    color = settings.get('color', colors[i % len(colors)])
-                    marker = settings.get('symbol', 'o')
-                    size = settings.get('size', 5) ** 2  # scatter uses size^2, default=5
-                else:
-                    color = colors[i % len(colors)]
-                    marker = 'o'
-                    size = 25  # 5^2 (default size=5)
-
-                # Use bh_name directly as label (no custom label column)
-                label = bh_name
-
-                ax.scatter(values, y_values, c=color, s=size, alpha=1.0,
-                          label=label, marker=marker, zorder=3)
-
-        # Plot lines from X,Y - Line table
-        self._plot_lines_on_axis(ax, param_key)
-
-        # Invert y-axis only if using Depth mode (depth increases downward)
-        # For Elevation mode, higher values should be at top (natural orientation)
-        if not use_elevation:
-            ax.invert_yaxis()
-
-        # Set axis labels
-        label_text = f"{param_info['label']} {param_info['unit']}".strip()
-        ax.set_xlabel(label_text, fontsize=9, fontweight='bold')
-        y_label = 'Elevation (m)' if use_elevation else 'Depth (m)'
-        ax.set_ylabel(y_label, fontsize=9, fontweight='bold')
-        title_suffix = 'Elevation' if use_elevation else 'Depth'
-        ax.set_title(f"{param_info['label']} vs {title_suffix}", fontsize=11, fontweight='bold', pad=15)
-
-        # Set axis limits
-        limits = self.axis_limits.get(param_key, {'xmin': 0, 'xmax': 100, 'ymin': 0, 'ymax': 30})
-        ax.set_xlim(limits['xmin'], limits['xmax'])
-        ax.set_ylim(limits['ymax'], limits['ymin'])
-
-        # Grid
-        ax.grid(True, alpha=0.7)
-
-        # Legend
-        if len(self.bh_names) > 1:
-            ax.legend(loc='best', framealpha=0.9, fontsize=9)
-
-        # Adjust subplot to ensure y-axis labels are visible
-        figure.subplots_adjust(left=0.2, right=0.95, top=0.92, bottom=0.08)
+        canvas, ax = self._get_pooled_figure(param_key)
+        self._plot_parameter_on_axis(ax, param_key, param_info)
+        canvas.draw_idle()
 
         return canvas
 
-    def _plot_soil_profile_on_axis(self, ax):
-        """Plot soil profile on a given axis (for PDF export)"""
-        layers = []
-        for row in range(self.line_table.rowCount()):
-            try:
-                from_item = self.line_table.item(row, 0)
-                to_item = self.line_table.item(row, 1)
-                soil_type_combo = self.line_table.cellWidget(row, 8)
-                consistency_item = self.line_table.item(row, 9)
-
-                if not from_item or not to_item or not from_item.text().strip() or not to_item.text().strip():
-                    continue
-
-                from_depth = float(from_item.text().strip())
-                to_depth = float(to_item.text().strip())
-                soil_type = soil_type_combo.currentText() if soil_type_combo else ""
-                consistency = consistency_item.text() if consistency_item else ""
-
-                if soil_type and consistency:
-                    layers.append({
-                        'from': from_depth, 'to': to_depth,
-                        'soil_type': soil_type, 'consistency': consistency
-                    })
-            except (ValueError, AttributeError):
-                continue
+    def _plot_soil_profile_on_axis(self, ax, layers=None):
+        """Plot soil profile on a given axis (preview and PDF export)
+        Layer rectangles, dots and lines are each drawn as a single collection.
+        """
+        if layers is None:
+            layers = self._get_soil_layers()
 
         if not layers:
             ax.text(0.5, 0.5, 'No data', ha='center', va='center', transform=ax.transAxes)
             return
 
+        _ensure_mpl()
+
         y_axis_mode = self.y_axis_combo.currentText()
         use_elevation = (y_axis_mode == "Elevation")
         soil_limits = self.axis_limits.get('soil', {'ymin': 100, 'ymax': 70})
 
+        rects = []
+        dot_xs, dot_ys = [], []
+        line_segments = []
+        for layer in layers:
+            y_low = min(layer['from'], layer['to'])
+            y_high = max(layer['from'], layer['to'])
+            rects.append(Rectangle((0, y_low), 1, y_high - y_low))
+
+            x_dots, y_dots, segments = self._get_soil_pattern(
+                0, 1, y_low, y_high, layer['soil_type'], layer['consistency'])
+            if x_dots is not None:
+                dot_xs.append(x_dots)
+                dot_ys.append(y_dots)
+            line_segments.extend(segments)
+
+        # Layer rectangles
+        ax.add_collection(PatchCollection(rects, facecolors='white', edgecolors='black', linewidths=1))
+
+        # Soil patterns
+        if dot_xs:
+            ax.scatter(np.concatenate(dot_xs), np.concatenate(dot_ys), s=1, c='black', alpha=0.6)
+        if line_segments:
+            ax.add_collection(LineCollection(line_segments, colors='black', linewidths=0.5, alpha=0.6))
+
+        # Layer labels
         for layer in layers:
-            y_start = layer['from']
-            y_end = layer['to']
-            ax.add_patch(plt.Rectangle((0, min(y_start, y_end)), 1, abs(y_start - y_end),
-                                       facecolor='white', edgecolor='black', linewidth=1))
-            self._draw_soil_pattern(ax, 0, 1, min(y_start, y_end), max(y_start, y_end),
-                                    layer['soil_type'], layer['consistency'])
-            mid_y = (y_start + y_end) / 2
+            mid_y = (layer['from'] + layer['to']) / 2
             ax.text(0.5, mid_y, f"{layer['consistency']}\n{layer['soil_type']}",
                     ha='center', va='center', fontsize=8, fontweight='bold')
 
         ax.set_xlim(0, 1)
-        ax.set_ylim(soil_limits['ymax'], soil_limits['ymin'])
+        ax.set_ylim(soil_limits['ymax'], soil_limits['ymin'])  # e.g. 70 at bottom, 100 at top
         ax.set_ylabel('Elevation (m)' if use_elevation else 'Depth (m)', fontsize=9, fontweight='bold')
         ax.set_title('Soil Profile', fontsize=11, fontweight='bold', pad=15)
         ax.set_xticks([])
         ax.grid(True, alpha=0.7, axis='y')
 
-    def _plot_parameter_on_axis(self, ax, param_key, param_info):
-        """Plot a single parameter on a given axis (for PDF export)"""
-        y_axis_mode = self.y_axis_combo.currentText()
-        use_elevation = (y_axis_mode == "Elevation")
-        colors = ["#007BFF7B", "#5EC7348B", '#FF9F0A', "#FF3A308F", "#5856D68D", "#AF52DE90"]
+    def _scatter_boreholes(self, ax, param_key, use_elevation):
+        """Scatter all boreholes for one parameter with one scatter call per marker.
+        Returns legend handles, one per borehole that has data.
+        """
+        groups = {}  # {marker: ([x arrays], [y arrays], [rgba arrays], [size arrays])}
+        legend_handles = []
 
         for i, bh_name in enumerate(self.bh_names):
-            y_values = []
-            values = []
             settings = self.bh_settings.get(bh_name, {'surface_elev': 100.0, 'water_level': 0.0})
             surface_elev = settings['surface_elev']
+            values, y_values = self._get_bh_series(bh_name, param_key, surface_elev, use_elevation)
+            if not y_values.size:
+                continue
 
-            for depth, data in sorted(self.plot_data[bh_name].items()):
-                value = data.get(param_key)
-                if value is not None:
-                    depth_float = float(depth) if isinstance(depth, str) else depth
-                    if use_elevation:
-                        y_values.append(surface_elev - depth_float)
-                    else:
-                        y_values.append(depth_float)
-                    values.append(value)
-
-            if y_values:
-                if bh_name in self.bh_display_settings:
-                    s = self.bh_display_settings[bh_name]
-                    color = s.get('color', colors[i % len(colors)])
-                    marker = s.get('symbol', 'o')
-                    size = s.get('size', 5) ** 2
-                else:
-                    color = colors[i % len(colors)]
-                    marker = 'o'
-                    size = 25
+            color, marker, size = self._get_bh_style(i, bh_name)
+            xs, ys, colors, sizes = groups.setdefault(marker, ([], [], [], []))
+            xs.append(values)
+            ys.append(y_values)
+            colors.append(np.broadcast_to(color, (values.size, 4)))
+            sizes.append(np.full(values.size, size, dtype=float))
+
+            # Use bh_name directly as label (no custom label column)
+            legend_handles.append(Line2D([], [], linestyle='none', marker=marker, color=color,
+                                         alpha=1.0, markersize=size ** 0.5, label=bh_name))
 
-                ax.scatter(values, y_values, c=color, s=size, alpha=1.0,
-                          label=bh_name, marker=marker, zorder=3)
+        for marker, (xs, ys, colors, sizes) in groups.items():
+            ax.scatter(np.concatenate(xs), np.concatenate(ys), c=np.concatenate(colors),
+                       s=np.concatenate(sizes), alpha=1.0, marker=marker, zorder=3)
 
+        return legend_handles
+
+    def _plot_parameter_on_axis(self, ax, param_key, param_info):
+        """Plot a single parameter on a given axis (preview and PDF export)"""
+        # Get Y-axis mode (Depth or Elevation)
+        y_axis_mode = self.y_axis_combo.currentText()
+        use_elevation = (y_axis_mode == "Elevation")
+
+        # Plot all boreholes
+        legend_handles = self._scatter_boreholes(ax, param_key, use_elevation)
+
+        # Plot lines from X,Y - Line table
         self._plot_lines_on_axis(ax, param_key)
 
+        # Invert y-axis only if using Depth mode (depth increases downward)
+        # For Elevation mode, higher values should be at top (natural orientation)
         if not use_elevation:
             ax.invert_yaxis()
 
-        label_text = f"{param_info['label']} {param_info['unit']}".strip()
-        ax.set_xlabel(label_text, fontsize=9, fontweight='bold')
+        ax.set_xlabel(self._param_label_text.get(param_key, ''), fontsize=9, fontweight='bold')
         ax.set_ylabel('Elevation (m)' if use_elevation else 'Depth (m)', fontsize=9, fontweight='bold')
         title_suffix = 'Elevation' if use_elevation else 'Depth'
         ax.set_title(f"{param_info['label']} vs {title_suffix}", fontsize=11, fontweight='bold', pad=15)
@@ -1207,12 +1233,12 @@ class Module4MultiPlot(QWidget):
         ax.set_ylim(limits['ymax'], limits['ymin'])
         ax.grid(True, alpha=0.7)
 
-        if len(self.bh_names) > 1:
-            ax.legend(loc='best', framealpha=0.9, fontsize=9)
+        if len(self.bh_names) > 1 and legend_handles:
+            ax.legend(handles=legend_handles, loc='best', framealpha=0.9, fontsize=9)
 
     def _apply_plot_style(self):
         """Apply Apple-style theme to matplotlib plots"""
-        plt.rcParams.update({
+        mpl.rcParams.update({
             'font.family': 'sans-serif',
             'font.sans-serif': ['SF Pro Display', 'Arial', 'Helvetica'],
             'font.size': 8,
@@ -1259,6 +1285,7 @@ class Module4MultiPlot(QWidget):
             return
 
         try:
+            _ensure_mpl()
             from matplotlib.backends.backend_pdf import PdfPages
 
             # Count total plots
@@ -1337,14 +1364,18 @@ class Module4MultiPlot(QWidget):
                 for depth_str, depth_data in depths_data.items():
                     # Convert depth key to float
                     self.plot_data[bh_name][float(depth_str)] = depth_data
+            self._rebuild_plot_series()
+            self._module3_signature = None  # Plot data now comes from the project file
 
             self.bh_names = data.get('bh_names', [])
             self.bh_settings = data.get('bh_settings', {})
 
             # Load BH display settings with backward compatibility
             self.bh_display_settings = data.get('bh_display_settings', {})
+            self._bh_style_cache = {}
 
             self.parameters = data.get('parameters', self.parameters)
+            self._refresh_param_labels()
 
             # Load axis_limits with backward compatibility
             loaded_axis_limits = data.get('axis_limits', {})
@@ -1459,5 +1490,6 @@ class Module4MultiPlot(QWidget):
         if dialog.exec():
             # User clicked OK - apply settings
             self.bh_display_settings = dialog.get_settings()
+            self._bh_style_cache = {}
             # Refresh plots with new settings
             self.update_plots()
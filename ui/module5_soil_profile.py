@@ -8,13 +8,48 @@ from PyQt6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
     QFileDialog, QMessageBox, QLineEdit, QSplitter, QGroupBox
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
-from matplotlib.figure import Figure
-from matplotlib.patches import Rectangle
-import matplotlib.patches as mpatches
+from PyQt6.QtCore import Qt, QTimer, QPointF, QRectF
+from PyQt6.QtGui import QFont, QPixmap, QPainter, QColor, QPen
 import numpy as np
+import functools
+import io
+import random
+
+
+# Matplotlib is imported when the profile is first drawn or exported (see _ensure_mpl)
+mpl = None
+FigureCanvasQTAgg = None
+FigureCanvasAgg = None
+Figure = None
+Rectangle = None
+LineCollection = None
+PatchCollection = None
+mpatches = None
+
+
+def _ensure_mpl():
+    """Import matplotlib on first use and bind it to the module-level names"""
+    global mpl, FigureCanvasQTAgg, FigureCanvasAgg, Figure, Rectangle, LineCollection, PatchCollection, mpatches
+    if Figure is not None:
+        return
+
+    import matplotlib
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as _FigureCanvasQTAgg
+    from matplotlib.backends.backend_agg import FigureCanvasAgg as _FigureCanvasAgg
+    from matplotlib.figure import Figure as _Figure
+    from matplotlib.patches import Rectangle as _Rectangle
+    from matplotlib.collections import LineCollection as _LineCollection
+    from matplotlib.collections import PatchCollection as _PatchCollection
+    import matplotlib.patches as _mpatches
+
+    mpl = matplotlib
+    FigureCanvasQTAgg = _FigureCanvasQTAgg
+    FigureCanvasAgg = _FigureCanvasAgg
+    Figure = _Figure
+    Rectangle = _Rectangle
+    LineCollection = _LineCollection
+    PatchCollection = _PatchCollection
+    mpatches = _mpatches
 
 
 # Soil types configuration
@@ -91,116 +126,607 @@ SOIL_TYPES = {
     }
 }
 
+# Soil type names in display order (shared by every layer row combo)
+_SOIL_TYPE_NAMES = tuple(SOIL_TYPES.keys())
+
+# Soil colors parsed to RGBA once, instead of matplotlib/Qt re-parsing hex on every draw
+_SOIL_RGB = {name: QColor(config['color']).getRgbF() for name, config in SOIL_TYPES.items()}
+_UNKNOWN_SOIL_RGB = QColor('#CCCCCC').getRgbF()
+
+# (RGBA color, pattern) per soil type, looked up once per layer by the exports
+_SOIL_STYLE = {name: (_SOIL_RGB[name], config['pattern']) for name, config in SOIL_TYPES.items()}
+
+
+def _horizontal_segments(x, y, width, height, num_lines):
+    """Return (num_lines, 2, 2) segments for evenly spaced horizontal lines in a rectangle"""
+    y_pos = y + (np.arange(num_lines) + 0.5) * height / num_lines
+    segments = np.empty((num_lines, 2, 2))
+    segments[:, 0, 0] = x
+    segments[:, 1, 0] = x + width
+    segments[:, :, 1] = y_pos[:, None]
+    return segments
+
+
+def _vertical_segments(x, y, width, height, num_lines):
+    """Return (num_lines, 2, 2) segments for evenly spaced vertical lines in a rectangle"""
+    x_pos = x + (np.arange(num_lines) + 0.5) * width / num_lines
+    segments = np.empty((num_lines, 2, 2))
+    segments[:, :, 0] = x_pos[:, None]
+    segments[:, 0, 1] = y
+    segments[:, 1, 1] = y + height
+    return segments
+
+
+def _diagonal_segments(x, y, width, height, spacing):
+    """Return (N, 2, 2) diagonal hatch segments clipped to a rectangle"""
+    num_lines = int((height + width) / spacing) + 2
+    offset = np.arange(num_lines) * spacing - width
+    x1 = np.full(num_lines, float(x))
+    y1 = y + offset
+    x2 = np.full(num_lines, float(x + width))
+    y2 = y + height + offset
+
+    # Clip the start to the bottom edge and the end to the top edge
+    below = y1 < y
+    x1[below] = x + (y - y1[below])
+    y1[below] = y
+    above = y2 > y + height
+    x2[above] -= y2[above] - (y + height)
+    y2[above] = y + height
+
+    keep = (x1 >= x) & (x2 <= x + width) & (y1 <= y2)
+    return np.stack([np.column_stack([x1, y1]), np.column_stack([x2, y2])], axis=1)[keep]
+
+
+def _vertical_lines_at(x_positions):
+    """Return (N, 2, 2) unit-height vertical segments at the given x positions"""
+    x_pos = np.asarray(x_positions, dtype=float)
+    segments = np.empty((x_pos.size, 2, 2))
+    segments[:, :, 0] = x_pos[:, None]
+    segments[:, 0, 1] = 0
+    segments[:, 1, 1] = 1
+    return segments
+
+
+# Upper bound on lines/circles/waves per layer in exports; past this the overlay reads
+# as solid shading anyway, so thick layers keep a bounded draw cost
+MAX_PATTERN_ELEMENTS = 64
+
+# Export line patterns: (lines per metre, line width, alpha)
+EXPORT_LINE_PATTERNS = {
+    'horizontal_lines': (2, 0.5, 0.6),
+    'horizontal_dense': (4, 0.5, 0.6),
+    'horizontal_thick': (2, 1.2, 0.7),
+    'horizontal_vertical': (2, 1.2, 0.7),
+    'diagonal': (4, 0.5, 0.6),
+    'crosshatch': (4, 0.5, 0.6),
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _export_line_segments(pattern, num_lines):
+    """Return read-only unit-layer (x, y in 0..1) segments for an export line pattern"""
+    if pattern in ('diagonal', 'crosshatch'):
+        # Short rising strokes, one per band; crosshatch adds the falling stroke
+        y_low = np.arange(num_lines) / max(num_lines, 1)
+        y_high = y_low + 1 / max(num_lines, 1)
+        segments = np.empty((num_lines, 2, 2))
+        segments[:, 0, 0] = 0
+        segments[:, 1, 0] = 1
+        segments[:, 0, 1] = y_low
+        segments[:, 1, 1] = y_high
+        if pattern == 'crosshatch':
+            falling = segments.copy()
+            falling[:, 0, 1] = y_high
+            falling[:, 1, 1] = y_low
+            segments = np.concatenate([segments, falling])
+    else:
+        segments = _horizontal_segments(0, 0, 1, 1, num_lines)
+        if pattern == 'horizontal_vertical':
+            segments = np.concatenate([segments, _vertical_lines_at((0.25, 0.5, 0.75))])
+    segments.flags.writeable = False
+    return segments
+
+
+# Deterministic pool of uniform [0, 1) samples for dot/circle patterns, sliced per
+# pattern instead of reseeding the global NumPy RNG on every draw
+_POOL_SIZE = 100_000
+_RNG = np.random.default_rng(42)
+_POOL_X = _RNG.random(_POOL_SIZE)
+_POOL_Y = _RNG.random(_POOL_SIZE)
+
+# Pool offsets, so different patterns do not reuse the same samples
+POOL_CIRCLES = 25_000
+POOL_DOTS_ON_DARK = 50_000
+POOL_RADII = 75_000
+
+
+def _pool_take(pool, offset, num):
+    """Return num samples from a random pool starting at offset (wraps around)"""
+    if offset + num <= _POOL_SIZE:
+        return pool[offset:offset + num]
+    return np.take(pool, np.arange(offset, offset + num), mode='wrap')
+
+
+# Dot pattern styles: (marker size, color, alpha, pool offset)
+DOTS_BLACK = (1, 'black', 0.4, 0)
+DOTS_WHITE = (2, 'white', 0.6, POOL_DOTS_ON_DARK)
+
+# Per-layer label styles; Text artists of each style are pooled and reused across redraws
+LABEL_STYLES = {
+    'bold': dict(ha='center', va='center', fontsize=7, fontweight='bold'),
+    'description': dict(ha='left', va='center', fontsize=7, style='italic', color='#333333'),
+    'elevation': dict(ha='right', va='center', fontsize=7),
+}
+
+# Export label styles (all-borehole figures)
+EXPORT_LABEL_STYLES = {
+    'depth': dict(ha='right', va='center', fontsize=8),
+    'soil': dict(ha='center', va='center', fontsize=7, weight='bold'),
+    'n_value': dict(ha='left', va='center', fontsize=7),
+}
+
+# PNG exports: fast zlib level without Pillow's optimize pass (profiles are flat color blocks)
+PNG_PIL_KWARGS = {'compress_level': 3, 'optimize': False}
+
+
+def _write_png(save, file_path, **kwargs):
+    """Render a 300 dpi PNG with save (savefig/print_figure) into memory, then write it in one go"""
+    buf = io.BytesIO()
+    save(buf, format='png', dpi=300, pil_kwargs=PNG_PIL_KWARGS, **kwargs)
+    with open(file_path, 'wb') as f:
+        f.write(buf.getbuffer())
+
+
+# Wavy pattern: one sine period table across a unit-width layer, shared by every wave
+WAVE_X = np.linspace(0, 1, 20)
+WAVE_SIN = np.sin(WAVE_X * 20)
+# Export wave shape (half the frequency, amplitude in metres), translated per wave
+EXPORT_WAVE_Y = 0.05 * np.sin(WAVE_X * 10)
 
-class SoilProfileCanvas(FigureCanvasQTAgg):
-    """Canvas for drawing soil profile with matplotlib"""
+# Resolution of the pre-rendered PNG export pattern tiles
+PATTERN_TILE_DPI = 300
+# Metres covered by one tile: the random dot/circle layout repeats only once per span
+PATTERN_TILE_METRES = 10
+
+
+def _draw_export_pattern(ax, pattern, y_start, height, sample=0):
+    """
+    Draw an export pattern overlay as vectors (one collection per line/circle set)
+
+    sample shifts the window taken from the random pools, so calls with different
+    samples lay out their dots/circles differently.
+    """
+    if pattern in EXPORT_LINE_PATTERNS:
+        lines_per_m, line_width, alpha = EXPORT_LINE_PATTERNS[pattern]
+        # Unit-layer segments are cached per (pattern, line count); scale them to this layer
+        num_lines = min(int(height * lines_per_m), MAX_PATTERN_ELEMENTS)
+        unit_segments = _export_line_segments(pattern, num_lines)
+        segments = unit_segments * (1, height) + (0, y_start)
+        # zorder 2 keeps the lines above the layer rectangles, as separate Line2Ds were
+        ax.add_collection(LineCollection(segments, colors='k', linewidths=line_width,
+                                         alpha=alpha, zorder=2))
+    elif pattern == 'stipple_light' or pattern == 'stipple_medium' or pattern == 'stipple_dense' or pattern == 'stipple_heavy':
+        density = {'stipple_light': 30, 'stipple_medium': 50,
+                  'stipple_dense': 70, 'stipple_heavy': 100}.get(pattern, 50)
+        num_dots = int(height * density)
+        x_dots = _pool_take(_POOL_X, sample, num_dots)
+        y_dots = y_start + _pool_take(_POOL_Y, sample, num_dots) * height
+        ax.scatter(x_dots, y_dots, s=1, c='black', alpha=0.5)
+    elif pattern == 'circles':
+        num_circles = min(int(height * 3), MAX_PATTERN_ELEMENTS)
+        x_pos = 0.1 + 0.8 * _pool_take(_POOL_X, POOL_CIRCLES + sample, num_circles)
+        y_pos = y_start + 0.1 + (height - 0.2) * _pool_take(_POOL_Y, POOL_CIRCLES + sample, num_circles)
+        circles = [mpatches.Circle((x, y), 0.03) for x, y in zip(x_pos, y_pos)]
+        ax.add_collection(PatchCollection(circles, facecolor='none', edgecolor='black', linewidth=0.5))
+    elif pattern == 'dots_on_dark':
+        num_dots = int(height * 20)
+        x_dots = _pool_take(_POOL_X, POOL_DOTS_ON_DARK + sample, num_dots)
+        y_dots = y_start + _pool_take(_POOL_Y, POOL_DOTS_ON_DARK + sample, num_dots) * height
+        ax.scatter(x_dots, y_dots, s=1, c='white', alpha=0.9)
+    elif pattern == 'wavy_dots':
+        num_waves = min(int(height * 2), MAX_PATTERN_ELEMENTS)
+        y_pos = y_start + (np.arange(num_waves) + 0.5) * height / num_waves
+        waves = np.empty((num_waves, WAVE_X.size, 2))
+        waves[:, :, 0] = WAVE_X
+        waves[:, :, 1] = y_pos[:, None] + EXPORT_WAVE_Y
+        ax.add_collection(LineCollection(waves, colors='k', linewidths=0.5, alpha=0.6, zorder=2))
+
+
+@functools.lru_cache(maxsize=16)
+def _export_pattern_tile(pattern, width_in, metre_in):
+    """
+    Render PATTERN_TILE_METRES of an export pattern across the unit layer width (cached)
+
+    width_in is the layer width and metre_in the height of one metre, in inches on
+    the target axis. Returns a read-only RGBA array with rows bottom-up (elevation
+    0 at row 0), or None for patterns that draw nothing.
+    """
+    _ensure_mpl()
+    fig = Figure(figsize=(width_in, metre_in * PATTERN_TILE_METRES), dpi=PATTERN_TILE_DPI)
+    fig.patch.set_alpha(0)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.set_axis_off()
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, PATTERN_TILE_METRES)
+    # One metre at a time, each from its own pool window (100 samples covers the densest
+    # stipple): every metre keeps the per-metre density without repeating its neighbour
+    for metre in range(PATTERN_TILE_METRES):
+        _draw_export_pattern(ax, pattern, float(metre), 1.0, sample=metre * 100)
+    if not ax.collections:
+        return None
+    canvas.draw()
+    tile = np.asarray(canvas.buffer_rgba())[::-1].copy()
+    tile.flags.writeable = False
+    return tile
+
+
+@functools.lru_cache(maxsize=None)
+def _pattern_pixmap(color, pattern, width=50, height=25):
+    """Paint a legend swatch for an RGBA soil color/pattern (cached, painted once)"""
+    pixmap = QPixmap(width, height)
+    pixmap.fill(QColor.fromRgbF(*color))
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    def point(x, y):
+        # Swatch coordinates run 0..1 with y up, as in the matplotlib profile
+        return QPointF(x * width, (1 - y) * height)
+
+    def set_pen(pen_color, line_width, alpha):
+        qcolor = QColor(pen_color)
+        qcolor.setAlphaF(alpha)
+        pen = QPen(qcolor)
+        pen.setWidthF(line_width)
+        painter.setPen(pen)
+
+    def draw_hlines(num_lines, line_width, alpha):
+        set_pen('black', line_width, alpha)
+        for i in range(num_lines):
+            y_pos = (i + 0.5) / num_lines
+            painter.drawLine(point(0, y_pos), point(1, y_pos))
+
+    def draw_dots(num_dots, dot_color, alpha):
+        rng = random.Random(42)
+        set_pen(dot_color, 1.0, alpha)
+        for _ in range(num_dots):
+            painter.drawPoint(point(rng.random(), rng.random()))
+
+    # Add simplified pattern preview
+    if pattern == 'horizontal_sparse':
+        draw_hlines(3, 0.5, 0.6)
+    elif pattern == 'horizontal_dense':
+        draw_hlines(5, 0.5, 0.7)
+    elif pattern == 'horizontal_thick':
+        draw_hlines(3, 1.5, 0.8)
+    elif pattern == 'crosshatch':
+        draw_hlines(3, 1.5, 0.8)
+        set_pen('black', 0.8, 0.6)
+        for i in range(5):
+            x_pos = (i + 0.5) / 5
+            painter.drawLine(point(x_pos, 0), point(x_pos, 1))
+    elif 'stipple' in pattern:
+        density_map = {'stipple_light': 10, 'stipple_medium': 20, 'stipple_dense': 30, 'stipple_heavy': 50}
+        draw_dots(density_map.get(pattern, 20), 'black', 0.4)
+    elif pattern == 'circles':
+        rng = random.Random(42)
+        set_pen('black', 0.5, 0.7)
+        for _ in range(3):
+            center = point(rng.uniform(0.2, 0.8), rng.uniform(0.2, 0.8))
+            painter.drawEllipse(center, 0.08 * width, 0.08 * height)
+    elif pattern == 'diagonal':
+        set_pen('black', 0.5, 0.6)
+        for i in range(5):
+            offset = i * 0.3 - 0.6
+            painter.drawLine(point(0, offset), point(1, 1 + offset))
+    elif pattern == 'dots_on_dark':
+        draw_dots(20, 'white', 0.9)
+    elif pattern == 'wavy_dots':
+        set_pen('black', 0.5, 0.6)
+        x_wave = np.linspace(0, 1, 20)
+        for y_pos in (0.3, 0.7):
+            y_wave = y_pos + 0.05 * np.sin(x_wave * 10)
+            painter.drawPolyline([point(x, y) for x, y in zip(x_wave, y_wave)])
+        draw_dots(15, 'black', 0.4)
+
+    # Border
+    set_pen('black', 1.0, 1.0)
+    painter.drawRect(QRectF(0.5, 0.5, width - 1, height - 1))
+    painter.end()
+    return pixmap
+
+
+class SoilProfileCanvas(QWidget):
+    """
+    Widget for drawing soil profile with matplotlib
+
+    The matplotlib figure and canvas are created the first time the widget is
+    shown (or saved); profiles plotted before that are kept and drawn then.
+    """
 
     def __init__(self, parent=None, width=6, height=10):
-        self.fig = Figure(figsize=(width, height), facecolor='white')
+        super().__init__(parent)
+        self._figsize = (width, height)
+        self.fig = None
+        self.ax = None
+        self.canvas = None
+        self._pending_profile = None  # (layers, water_level, ground_elevation)
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+        # Persistent artists, created with the canvas and updated in place by plot_profile
+        self._rect_collection = None
+        self._title_texts = ()
+        self._empty_text = None
+        self._pattern_artists = []  # Rebuilt per plot (pattern collections and dot scatters)
+
+        # Water level artists are animated: drawn over a cached background (blit)
+        self._wl_line = None
+        self._wl_text = None
+        self._elev_range = None  # (min_elev, max_elev) of the plotted profile, None when empty
+        self._ground_elevation = 100.0
+        self._background = None
+        self._saving = False  # savefig renders the WL artists itself; _on_draw must not repaint them
+        self._dot_regions = {}  # {dot style: [(x, y, width, height, num_dots)]}
+        self._circle_regions = []  # [(x, y, width, height, num_circles)]
+        self._label_pool = {style: [] for style in LABEL_STYLES}  # {style: [Text]}
+        self._label_count = dict.fromkeys(LABEL_STYLES, 0)
+
+    def _ensure_canvas(self):
+        """Create the matplotlib figure/canvas and draw any pending profile"""
+        if self.canvas is not None:
+            return
+
+        _ensure_mpl()
+        # Constrained layout is solved on draw, so plot_profile needs no tight_layout() pass
+        self.fig = Figure(figsize=self._figsize, facecolor='white', layout='constrained')
         self.ax = self.fig.add_subplot(111)
-        super().__init__(self.fig)
+        self.canvas = FigureCanvasQTAgg(self.fig)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.layout().addWidget(self.canvas)
+        self._init_axes()
+
+        if self._pending_profile is not None:
+            pending, self._pending_profile = self._pending_profile, None
+            self.plot_profile(*pending)
+
+    def _init_axes(self):
+        """Create the persistent profile artists and the fixed axes styling"""
+        self.ax.set_xlim(-0.5, 3.5)  # Extended for description text
+
+        # Layer rectangles: one collection whose paths/colors are replaced per plot
+        self._rect_collection = PatchCollection([], edgecolors='black', linewidths=1.5)
+        self.ax.add_collection(self._rect_collection, autolim=False)
+
+        # Water level (animated, so it can later move without a full redraw)
+        self._wl_line = self.ax.axhline(y=0, color='blue', linestyle='--',
+                                        linewidth=2, alpha=0.7, animated=True)
+        # Add WL label above the line
+        self._wl_text = self.ax.text(1.8, 0, '',
+                                     ha='left', va='bottom', animated=True,
+                                     fontsize=9, color='blue', fontweight='bold')
+
+        # Labels - Place title above the plot area
+        self.ax.set_ylabel('Elevation (m)', fontsize=10, fontweight='bold')
+        self._title_texts = (
+            self.ax.text(0.5, 0, 'Soil Profile',
+                         ha='center', va='bottom', fontsize=12, fontweight='bold'),
+            self.ax.text(1.5, 0, 'SPT-N',
+                         ha='center', va='bottom', fontsize=10, fontweight='bold'),
+        )
+        self._empty_text = self.ax.text(0.5, 0.5, 'No layers defined\nAdd rows to create profile',
+                                        ha='center', va='center', fontsize=12, color='gray',
+                                        transform=self.ax.transAxes)
+
+        # Remove top and right spines
+        self.ax.spines['top'].set_visible(False)
+        self.ax.spines['right'].set_visible(False)
+        self.ax.spines['bottom'].set_visible(False)
+
+        # Remove x-axis ticks
+        self.ax.set_xticks([])
+
+    def showEvent(self, event):
+        """Build the canvas when the profile first becomes visible"""
+        super().showEvent(event)
+        self._ensure_canvas()
 
     def plot_profile(self, layers, water_level=None, ground_elevation=100.0):
-        """Plot soil profile"""
-        self.ax.clear()
+        """
+        Plot soil profile
+
+        layers holds one column per field: 'from_elev'/'to_elev' arrays and
+        'soil_type'/'n_value'/'description' lists (see _do_update_profile).
+        """
+        if self.canvas is None:
+            # Not shown yet: remember the latest profile and draw it in _ensure_canvas
+            self._pending_profile = (layers, water_level, ground_elevation)
+            return
 
-        if not layers:
-            self.ax.text(0.5, 0.5, 'No layers defined\nAdd rows to create profile',
-                        ha='center', va='center', fontsize=12, color='gray')
-            self.draw()
+        self._background = None
+        for artist in self._pattern_artists:
+            artist.remove()
+        self._pattern_artists = []
+
+        # Dot and circle patterns are collected across all layers and drawn in one go
+        self._dot_regions = {}
+        self._circle_regions = []
+        self._label_count = dict.fromkeys(LABEL_STYLES, 0)
+
+        has_layers = len(layers['soil_type']) > 0
+        self._empty_text.set_visible(not has_layers)
+        self.ax.yaxis.set_visible(has_layers)
+        self.ax.spines['left'].set_visible(has_layers)
+        self._rect_collection.set_visible(has_layers)
+        for title in self._title_texts:
+            title.set_visible(has_layers)
+
+        if not has_layers:
+            self._elev_range = None
+            self._set_water_level_artists(None)
+            self._hide_unused_labels()
+            self.canvas.draw_idle()
             return
 
+        from_elevs = layers['from_elev']
+        to_elevs = layers['to_elev']
+        heights = from_elevs - to_elevs
+        mid_elevs = (from_elevs + to_elevs) / 2
+
         # Setup axes
-        min_elev = min([layer['to_elev'] for layer in layers])
+        min_elev = to_elevs.min()
         max_elev = 100.0  # Fixed to 100 as requested
 
         # Add some margin
         elev_range = max_elev - min_elev
         margin = elev_range * 0.05
 
-        self.ax.set_xlim(-0.5, 3.5)  # Extended for description text
-        self.ax.set_ylim(min_elev - margin, max_elev + margin)
+        bottom, top = min_elev - margin, max_elev + margin
+        self.ax.set_ylim(bottom, top)
 
-        # Draw layers
-        for layer in layers:
-            from_elev = layer['from_elev']
-            to_elev = layer['to_elev']
-            soil_type = layer['soil_type']
-            n_value = layer.get('n_value', '-')
-            height = from_elev - to_elev
-
-            if height <= 0:
-                continue
+        # Zero/negative thickness rows and layers entirely outside the view (e.g. above
+        # the fixed top when the ground level is raised) are skipped
+        drawn = np.flatnonzero((heights > 0) & (to_elevs < top) & (from_elevs > bottom))
+        soil_types = [layers['soil_type'][i] for i in drawn]
+        soil_configs = [SOIL_TYPES.get(soil_type, {
+            'color': '#CCCCCC',
+            'pattern': 'none'
+        }) for soil_type in soil_types]
 
-            # Get soil config
-            soil_config = SOIL_TYPES.get(soil_type, {
-                'color': '#CCCCCC',
-                'pattern': 'none'
-            })
+        # Layer rectangles: swap the paths and colors of the persistent collection
+        rects = [Rectangle((0, to_elevs[i]), 1, heights[i]) for i in drawn]
+        self._rect_collection.set_paths(rects)
+        self._rect_collection.set_facecolor([_SOIL_RGB.get(soil_type, _UNKNOWN_SOIL_RGB)
+                                             for soil_type in soil_types])
 
-            # Draw layer rectangle
-            rect = Rectangle((0, to_elev), 1, height,
-                           facecolor=soil_config['color'],
-                           edgecolor='black',
-                           linewidth=1.5)
-            self.ax.add_patch(rect)
+        # Draw layers
+        for i, soil_type, soil_config in zip(drawn, soil_types, soil_configs):
+            from_elev = from_elevs[i]
+            to_elev = to_elevs[i]
+            mid_elev = mid_elevs[i]
+            n_value = layers['n_value'][i]
 
             # Add pattern
-            self._add_pattern(soil_config['pattern'], 0, to_elev, 1, height)
+            self._add_pattern(soil_config['pattern'], 0, to_elev, 1, heights[i])
 
             # Add soil type label without background box
-            mid_elev = (from_elev + to_elev) / 2
-            self.ax.text(0.5, mid_elev, soil_type,
-                        ha='center', va='center',
-                        fontsize=7, fontweight='bold')
+            self._add_label('bold', 0.5, mid_elev, soil_type)
 
             # Add N-value on right side
             n_text = str(n_value) if n_value not in [None, '-', ''] else '-'
-            self.ax.text(1.5, mid_elev, n_text,
-                        ha='center', va='center',
-                        fontsize=7, fontweight='bold')
+            self._add_label('bold', 1.5, mid_elev, n_text)
 
             # Add description on far right
-            description = layer.get('description', '')
+            description = layers['description'][i]
             if description:
-                self.ax.text(2.1, mid_elev, description,
-                            ha='left', va='center',
-                            fontsize=7, style='italic', color='#333333')
+                self._add_label('description', 2.1, mid_elev, description)
 
             # Add elevation labels
-            self.ax.text(-0.1, from_elev, f"{from_elev:.2f}",
-                        ha='right', va='center', fontsize=7)
-            self.ax.text(-0.1, to_elev, f"{to_elev:.2f}",
-                        ha='right', va='center', fontsize=7)
-
-        # Draw water level
-        if water_level is not None:
-            water_elev = ground_elevation + water_level  # water_level is negative
-            if min_elev <= water_elev <= max_elev:
-                self.ax.axhline(y=water_elev, color='blue', linestyle='--',
-                              linewidth=2, alpha=0.7)
-                # Add WL label above the line
-                self.ax.text(1.8, water_elev, f'WL. {water_level:.2f}',
-                           ha='left', va='bottom',
-                           fontsize=9, color='blue', fontweight='bold')
-
-        # Labels - Place title above the plot area
-        self.ax.set_ylabel('Elevation (m)', fontsize=10, fontweight='bold')
-        self.ax.text(0.5, max_elev + margin*0.8, 'Soil Profile',
-                    ha='center', va='bottom', fontsize=12, fontweight='bold')
-        self.ax.text(1.5, max_elev + margin*0.8, 'SPT-N',
-                    ha='center', va='bottom', fontsize=10, fontweight='bold')
+            self._add_label('elevation', -0.1, from_elev, f"{from_elev:.2f}")
+            self._add_label('elevation', -0.1, to_elev, f"{to_elev:.2f}")
+
+        self._hide_unused_labels()
+        self._draw_dot_regions()
+        self._draw_circle_regions()
+        # Everything in ax.collections apart from the rectangles was added for this plot
+        self._pattern_artists = [collection for collection in self.ax.collections
+                                 if collection is not self._rect_collection]
+
+        # Water level
+        self._elev_range = (min_elev, max_elev)
+        self._ground_elevation = ground_elevation
+        self._set_water_level_artists(water_level)
+
+        for title in self._title_texts:
+            title.set_y(max_elev + margin*0.8)
+
+        self.canvas.draw_idle()
+
+    def _add_label(self, style, x, y, text):
+        """Place a layer label, reusing a pooled Text artist of the same style"""
+        pool = self._label_pool[style]
+        index = self._label_count[style]
+        self._label_count[style] = index + 1
+        if index < len(pool):
+            label = pool[index]
+            label.set_text(text)
+            label.set_position((x, y))
+            label.set_visible(True)
+        else:
+            label = self.ax.text(x, y, text, **LABEL_STYLES[style])
+            pool.append(label)
+
+    def _hide_unused_labels(self):
+        """Hide pooled labels not used by the current plot"""
+        for style, pool in self._label_pool.items():
+            for label in pool[self._label_count[style]:]:
+                label.set_visible(False)
+
+    def _set_water_level_artists(self, water_level):
+        """Position the WL line and label; hide them when outside the profile"""
+        if water_level is None or self._elev_range is None:
+            self._wl_line.set_visible(False)
+            self._wl_text.set_visible(False)
+            return
 
-        # Remove top and right spines
-        self.ax.spines['top'].set_visible(False)
-        self.ax.spines['right'].set_visible(False)
-        self.ax.spines['bottom'].set_visible(False)
+        water_elev = self._ground_elevation + water_level  # water_level is negative
+        min_elev, max_elev = self._elev_range
+        visible = min_elev <= water_elev <= max_elev
+        self._wl_line.set_ydata([water_elev, water_elev])
+        self._wl_line.set_visible(visible)
+        self._wl_text.set_position((1.8, water_elev))
+        self._wl_text.set_text(f'WL. {water_level:.2f}')
+        self._wl_text.set_visible(visible)
+
+    def _on_draw(self, event):
+        """Cache the static background after a full draw, then paint the WL artists"""
+        if self._saving or (event is not None and event.canvas is not self.canvas):
+            return
+        if self._wl_line is None:
+            self._background = None
+            return
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.ax.draw_artist(self._wl_line)
+        self.ax.draw_artist(self._wl_text)
+
+    def update_water_level(self, water_level):
+        """Move the water level line by blitting over the cached background"""
+        if self._pending_profile is not None:
+            layers, _, ground_elevation = self._pending_profile
+            self._pending_profile = (layers, water_level, ground_elevation)
+            return
+        if self._elev_range is None:
+            return
 
-        # Remove x-axis ticks
-        self.ax.set_xticks([])
+        self._set_water_level_artists(water_level)
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
 
-        self.fig.tight_layout()
-        self.draw()
+        self.canvas.restore_region(self._background)
+        self.ax.draw_artist(self._wl_line)
+        self.ax.draw_artist(self._wl_text)
+        self.canvas.blit(self.fig.bbox)
+
+    def save_figure(self, file_path, **kwargs):
+        """Save the figure, including the animated water level artists"""
+        self._ensure_canvas()
+        animated = [artist for artist in (self._wl_line, self._wl_text) if artist is not None]
+        for artist in animated:
+            artist.set_animated(False)
+        self._saving = True
+        try:
+            self.fig.savefig(file_path, **kwargs)
+        finally:
+            self._saving = False
+            for artist in animated:
+                artist.set_animated(True)
+            # savefig re-renders at export dpi; recapture the background on the next draw
+            self._background = None
+            self.canvas.draw_idle()
 
     def _add_pattern(self, pattern_type, x, y, width, height):
         """Add pattern overlay to layer"""
@@ -209,36 +735,26 @@ class SoilProfileCanvas(FigureCanvasQTAgg):
 
         elif pattern_type == 'horizontal_sparse':
             num_lines = max(3, int(height * 2))
-            for i in range(num_lines):
-                y_pos = y + (i + 0.5) * height / num_lines
-                self.ax.plot([x, x + width], [y_pos, y_pos],
-                           'k-', linewidth=0.5, alpha=0.6)
+            segments = _horizontal_segments(x, y, width, height, num_lines)
+            self.ax.add_collection(LineCollection(segments, colors='k', linewidths=0.5, alpha=0.6))
 
         elif pattern_type == 'horizontal_dense':
             num_lines = max(5, int(height * 4))
-            for i in range(num_lines):
-                y_pos = y + (i + 0.5) * height / num_lines
-                self.ax.plot([x, x + width], [y_pos, y_pos],
-                           'k-', linewidth=0.5, alpha=0.7)
+            segments = _horizontal_segments(x, y, width, height, num_lines)
+            self.ax.add_collection(LineCollection(segments, colors='k', linewidths=0.5, alpha=0.7))
 
         elif pattern_type == 'horizontal_thick':
             num_lines = max(3, int(height * 2))
-            for i in range(num_lines):
-                y_pos = y + (i + 0.5) * height / num_lines
-                self.ax.plot([x, x + width], [y_pos, y_pos],
-                           'k-', linewidth=1.5, alpha=0.8)
+            segments = _horizontal_segments(x, y, width, height, num_lines)
+            self.ax.add_collection(LineCollection(segments, colors='k', linewidths=1.5, alpha=0.8))
 
         elif pattern_type == 'crosshatch':
             num_lines = max(3, int(height * 2))
-            for i in range(num_lines):
-                y_pos = y + (i + 0.5) * height / num_lines
-                self.ax.plot([x, x + width], [y_pos, y_pos],
-                           'k-', linewidth=1.5, alpha=0.8)
+            segments = _horizontal_segments(x, y, width, height, num_lines)
+            self.ax.add_collection(LineCollection(segments, colors='k', linewidths=1.5, alpha=0.8))
             num_v_lines = max(2, int(width * 10))
-            for i in range(num_v_lines):
-                x_pos = x + (i + 0.5) * width / num_v_lines
-                self.ax.plot([x_pos, x_pos], [y, y + height],
-                           'k-', linewidth=0.8, alpha=0.6)
+            segments = _vertical_segments(x, y, width, height, num_v_lines)
+            self.ax.add_collection(LineCollection(segments, colors='k', linewidths=0.8, alpha=0.6))
 
         elif pattern_type in ['stipple_light', 'stipple_medium', 'stipple_dense', 'stipple_heavy']:
             density_map = {
@@ -248,57 +764,74 @@ class SoilProfileCanvas(FigureCanvasQTAgg):
                 'stipple_heavy': 100
             }
             num_dots = int(width * height * density_map[pattern_type])
-            np.random.seed(42)
-            x_dots = np.random.uniform(x, x + width, num_dots)
-            y_dots = np.random.uniform(y, y + height, num_dots)
-            self.ax.scatter(x_dots, y_dots, s=1, c='black', alpha=0.4)
+            self._add_dot_region(DOTS_BLACK, x, y, width, height, num_dots)
 
         elif pattern_type == 'circles':
             num_circles = max(3, int(height * 5))
-            for i in range(num_circles):
-                y_pos = y + np.random.uniform(0.1, 0.9) * height
-                x_pos = x + np.random.uniform(0.2, 0.8) * width
-                radius = np.random.uniform(0.03, 0.08)
-                circle = mpatches.Circle((x_pos, y_pos), radius,
-                                       facecolor='none', edgecolor='black',
-                                       linewidth=1, alpha=0.7)
-                self.ax.add_patch(circle)
+            self._circle_regions.append((x, y, width, height, num_circles))
 
         elif pattern_type == 'diagonal':
-            spacing = 0.15
-            num_lines = int((height + width) / spacing) + 2
-            for i in range(num_lines):
-                offset = i * spacing - width
-                x1, y1 = x, y + offset
-                x2, y2 = x + width, y + height + offset
-                if y1 < y:
-                    x1 = x + (y - y1)
-                    y1 = y
-                if y2 > y + height:
-                    x2 = x2 - (y2 - (y + height))
-                    y2 = y + height
-                if x1 >= x and x2 <= x + width and y1 <= y2:
-                    self.ax.plot([x1, x2], [y1, y2], 'k-', linewidth=1, alpha=0.6, clip_on=True)
+            segments = _diagonal_segments(x, y, width, height, 0.15)
+            self.ax.add_collection(LineCollection(segments, colors='k', linewidths=1, alpha=0.6))
 
         elif pattern_type == 'dots_on_dark':
             num_dots = int(width * height * 50)
-            np.random.seed(42)
-            x_dots = np.random.uniform(x, x + width, num_dots)
-            y_dots = np.random.uniform(y, y + height, num_dots)
-            self.ax.scatter(x_dots, y_dots, s=2, c='white', alpha=0.6)
+            self._add_dot_region(DOTS_WHITE, x, y, width, height, num_dots)
 
         elif pattern_type == 'wavy_dots':
             num_waves = max(2, int(height * 2))
-            for i in range(num_waves):
-                y_pos = y + (i + 0.5) * height / num_waves
-                x_wave = np.linspace(x, x + width, 20)
-                y_wave = y_pos + 0.05 * np.sin(x_wave * 20)
-                self.ax.plot(x_wave, y_wave, 'k-', linewidth=0.8, alpha=0.6)
+            y_pos = y + (np.arange(num_waves) + 0.5) * height / num_waves
+            waves = np.empty((num_waves, WAVE_X.size, 2))
+            waves[:, :, 0] = x + WAVE_X * width
+            waves[:, :, 1] = y_pos[:, None] + 0.05 * WAVE_SIN
+            self.ax.add_collection(LineCollection(waves, colors='k', linewidths=0.8, alpha=0.6))
             num_dots = int(width * height * 30)
-            np.random.seed(43)
-            x_dots = np.random.uniform(x, x + width, num_dots)
-            y_dots = np.random.uniform(y, y + height, num_dots)
-            self.ax.scatter(x_dots, y_dots, s=1, c='black', alpha=0.4)
+            self._add_dot_region(DOTS_BLACK, x, y, width, height, num_dots)
+
+    def _add_dot_region(self, style, x, y, width, height, num_dots):
+        """Queue random dots in a rectangle; drawn later by _draw_dot_regions"""
+        if num_dots > 0:
+            self._dot_regions.setdefault(style, []).append((x, y, width, height, num_dots))
+
+    def _draw_dot_regions(self):
+        """Scatter all queued dot regions with one scatter call per dot style"""
+        for (size, color, alpha, offset), regions in self._dot_regions.items():
+            regions = np.array(regions)
+            counts = regions[:, 4].astype(int)
+            x0, y0, widths, heights = (np.repeat(regions[:, col], counts) for col in range(4))
+            x_dots = x0 + _pool_take(_POOL_X, offset, x0.size) * widths
+            y_dots = y0 + _pool_take(_POOL_Y, offset, y0.size) * heights
+            self.ax.scatter(x_dots, y_dots, s=size, c=color, alpha=alpha)
+        self._dot_regions = {}
+
+    def _draw_circle_regions(self):
+        """Draw all queued gravel circles as a single PatchCollection"""
+        if not self._circle_regions:
+            return
+        regions = np.array(self._circle_regions)
+        counts = regions[:, 4].astype(int)
+        x0, y0, widths, heights = (np.repeat(regions[:, col], counts) for col in range(4))
+        x_pos = x0 + (0.2 + 0.6 * _pool_take(_POOL_X, POOL_CIRCLES, x0.size)) * widths
+        y_pos = y0 + (0.1 + 0.8 * _pool_take(_POOL_Y, POOL_CIRCLES, y0.size)) * heights
+        radii = 0.03 + 0.05 * _pool_take(_POOL_X, POOL_RADII, x0.size)
+        circles = [mpatches.Circle((cx, cy), r) for cx, cy, r in zip(x_pos, y_pos, radii)]
+        self.ax.add_collection(PatchCollection(circles, facecolor='none', edgecolor='black',
+                                               linewidth=1, alpha=0.7))
+        self._circle_regions = []
+
+
+def _borehole_signature(bh_names, borehole_data):
+    """Snapshot of the all-borehole export inputs (compared to reuse the last figure)"""
+    signature = []
+    for bh_name in bh_names:
+        bh_data = borehole_data.get(bh_name, {})
+        signature.append((
+            bh_name,
+            bh_data.get('ground_level'),
+            bh_data.get('water_level'),
+            tuple(tuple(layer.items()) for layer in bh_data.get('layers', [])),
+        ))
+    return tuple(signature)
 
 
 class Module5SoilProfile(QWidget):
@@ -319,6 +852,30 @@ class Module5SoilProfile(QWidget):
         self.borehole_data = {}  # {bh_name: {'water_level': float, 'ground_level': float, 'layers': []}}
         self.bh_display_settings = {}  # {bh_name: {'symbol', 'label', 'size', 'color'}}
 
+        # Debounce profile redraws so rapid edits render once after the user pauses
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(50)
+        self._update_timer.timeout.connect(self._do_update_profile)
+
+        # Level inputs apply 150 ms after the last keystroke, or at once on editingFinished
+        self._gl_timer = QTimer(self)
+        self._gl_timer.setSingleShot(True)
+        self._gl_timer.setInterval(150)
+        self._gl_timer.timeout.connect(self.on_ground_level_changed)
+        self._wl_timer = QTimer(self)
+        self._wl_timer.setSingleShot(True)
+        self._wl_timer.setInterval(150)
+        self._wl_timer.timeout.connect(self.on_water_level_changed)
+
+        # Parsed layer rows, parallel to layer_table: (depth, soil_type, n_value, description),
+        # depth None for an invalid row; None marks a row to re-read on the next update
+        self._row_cache = []
+
+        # Last all-borehole export figure per raster_patterns flag:
+        # {raster_patterns: (borehole signature, Agg canvas, tight bbox)}
+        self._export_figures = {}
+
         self._setup_ui()
 
         # Load initial data from Module 1 if available
@@ -388,7 +945,8 @@ class Module5SoilProfile(QWidget):
         self.gl_input.setText("100.00")
         self.gl_input.setMaximumWidth(100)
         self.gl_input.setFont(QFont("Arial", 12))
-        self.gl_input.textChanged.connect(self.on_ground_level_changed)
+        self.gl_input.textChanged.connect(self._gl_timer.start)
+        self.gl_input.editingFinished.connect(self._flush_level_inputs)
         layout.addWidget(self.gl_input)
 
         layout.addStretch()
@@ -434,7 +992,8 @@ class Module5SoilProfile(QWidget):
         self.wl_input.setText("-2.00")
         self.wl_input.setMaximumWidth(100)
         self.wl_input.setFont(QFont("SF Pro Display", 12))
-        self.wl_input.textChanged.connect(self.on_water_level_changed)
+        self.wl_input.textChanged.connect(self._wl_timer.start)
+        self.wl_input.editingFinished.connect(self._flush_level_inputs)
         wl_layout.addWidget(self.wl_input)
         wl_layout.addStretch()
         layout.addLayout(wl_layout)
@@ -514,8 +1073,8 @@ class Module5SoilProfile(QWidget):
         # Populate legend
         row = 0
         for soil_type, config in SOIL_TYPES.items():
-            pattern_canvas = self._create_pattern_preview(config['color'], config['pattern'])
-            self.legend_table.setCellWidget(row, 0, pattern_canvas)
+            pattern_preview = self._create_pattern_preview(_SOIL_RGB[soil_type], config['pattern'])
+            self.legend_table.setCellWidget(row, 0, pattern_preview)
 
             name_item = QTableWidgetItem(soil_type)
             name_item.setFont(QFont("SF Pro Display", 9))
@@ -531,80 +1090,11 @@ class Module5SoilProfile(QWidget):
         return widget
 
     def _create_pattern_preview(self, color, pattern):
-        """Create pattern preview canvas"""
-        from matplotlib.figure import Figure
-        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
-
-        fig = Figure(figsize=(0.5, 0.3), facecolor='white')
-        ax = fig.add_subplot(111)
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        ax.axis('off')
-
-        rect = Rectangle((0, 0), 1, 1, facecolor=color, edgecolor='black', linewidth=1)
-        ax.add_patch(rect)
-
-        # Add simplified pattern preview
-        if pattern == 'horizontal_sparse':
-            for i in range(3):
-                y_pos = (i + 0.5) / 3
-                ax.plot([0, 1], [y_pos, y_pos], 'k-', linewidth=0.5, alpha=0.6)
-        elif pattern == 'horizontal_dense':
-            for i in range(5):
-                y_pos = (i + 0.5) / 5
-                ax.plot([0, 1], [y_pos, y_pos], 'k-', linewidth=0.5, alpha=0.7)
-        elif pattern == 'horizontal_thick':
-            for i in range(3):
-                y_pos = (i + 0.5) / 3
-                ax.plot([0, 1], [y_pos, y_pos], 'k-', linewidth=1.5, alpha=0.8)
-        elif pattern == 'crosshatch':
-            for i in range(3):
-                y_pos = (i + 0.5) / 3
-                ax.plot([0, 1], [y_pos, y_pos], 'k-', linewidth=1.5, alpha=0.8)
-            for i in range(5):
-                x_pos = (i + 0.5) / 5
-                ax.plot([x_pos, x_pos], [0, 1], 'k-', linewidth=0.8, alpha=0.6)
-        elif 'stipple' in pattern:
-            density_map = {'stipple_light': 10, 'stipple_medium': 20, 'stipple_dense': 30, 'stipple_heavy': 50}
-            num_dots = density_map.get(pattern, 20)
-            np.random.seed(42)
-            x_dots = np.random.uniform(0, 1, num_dots)
-            y_dots = np.random.uniform(0, 1, num_dots)
-            ax.scatter(x_dots, y_dots, s=0.5, c='black', alpha=0.4)
-        elif pattern == 'circles':
-            for i in range(3):
-                y_pos = np.random.uniform(0.2, 0.8)
-                x_pos = np.random.uniform(0.2, 0.8)
-                circle = mpatches.Circle((x_pos, y_pos), 0.08,
-                                       facecolor='none', edgecolor='black',
-                                       linewidth=0.5, alpha=0.7)
-                ax.add_patch(circle)
-        elif pattern == 'diagonal':
-            for i in range(5):
-                offset = i * 0.3 - 0.6
-                ax.plot([0, 1], [offset, 1 + offset], 'k-', linewidth=0.5, alpha=0.6, clip_on=True)
-        elif pattern == 'dots_on_dark':
-            num_dots = 20
-            np.random.seed(42)
-            x_dots = np.random.uniform(0, 1, num_dots)
-            y_dots = np.random.uniform(0, 1, num_dots)
-            ax.scatter(x_dots, y_dots, s=1, c='white', alpha=0.9)
-        elif pattern == 'wavy_dots':
-            for i in range(2):
-                y_pos = 0.3 + i * 0.4
-                x_wave = np.linspace(0, 1, 20)
-                y_wave = y_pos + 0.05 * np.sin(x_wave * 10)
-                ax.plot(x_wave, y_wave, 'k-', linewidth=0.5, alpha=0.6)
-            num_dots = 15
-            np.random.seed(42)
-            x_dots = np.random.uniform(0, 1, num_dots)
-            y_dots = np.random.uniform(0, 1, num_dots)
-            ax.scatter(x_dots, y_dots, s=0.5, c='black', alpha=0.4)
-
-        fig.tight_layout(pad=0)
-        canvas = FigureCanvasQTAgg(fig)
-        canvas.setFixedSize(50, 25)
-        return canvas
+        """Create pattern preview swatch (cached pixmap, no matplotlib canvas)"""
+        label = QLabel()
+        label.setPixmap(_pattern_pixmap(color, pattern))
+        label.setFixedSize(50, 25)
+        return label
 
     def _sync_from_module1(self):
         """Sync borehole count and names from Module 1"""
@@ -656,6 +1146,15 @@ class Module5SoilProfile(QWidget):
         except ValueError:
             pass
 
+    def _flush_level_inputs(self):
+        """Apply ground/water level edits still waiting on their throttle timers"""
+        if self._gl_timer.isActive():
+            self._gl_timer.stop()
+            self.on_ground_level_changed()
+        if self._wl_timer.isActive():
+            self._wl_timer.stop()
+            self.on_water_level_changed()
+
     def on_bh_changed(self, index):
         """Handle borehole selection change"""
         if index < 0:
@@ -678,6 +1177,7 @@ class Module5SoilProfile(QWidget):
 
     def _save_current_bh(self):
         """Save current borehole data"""
+        self._flush_level_inputs()
         layers = []
         for row in range(self.layer_table.rowCount()):
             try:
@@ -706,9 +1206,6 @@ class Module5SoilProfile(QWidget):
 
     def _load_borehole(self, index):
         """Load borehole data"""
-        # Clear table
-        self.layer_table.setRowCount(0)
-
         # Get BH name
         bh_name = self._get_bh_name_by_index(index)
 
@@ -717,137 +1214,193 @@ class Module5SoilProfile(QWidget):
             data = self.borehole_data[bh_name]
             self.water_level = data.get('water_level', -2.0)
             self.ground_elevation = data.get('ground_level', 100.0)
-            self.wl_input.setText(f"{self.water_level:.2f}")
-            self.gl_input.setText(f"{self.ground_elevation:.2f}")
-
-            for layer_data in data.get('layers', []):
-                self._add_layer_from_data(layer_data)
+            layers = data.get('layers', [])
         else:
             # Default water level and ground level
             self.water_level = -2.0
             self.ground_elevation = 100.0
-            self.wl_input.setText("-2.00")
-            self.gl_input.setText("100.00")
+            layers = []
+
+        # Values are applied directly; don't let the inputs schedule their own updates
+        self._gl_timer.stop()
+        self._wl_timer.stop()
+        for line_edit, value in ((self.wl_input, self.water_level), (self.gl_input, self.ground_elevation)):
+            line_edit.blockSignals(True)
+            line_edit.setText(f"{value:.2f}")
+            line_edit.blockSignals(False)
+
+        # Reuse the existing rows (items and soil type combos) instead of clearing the
+        # table; only the rows beyond the new layer count are dropped
+        self.layer_table.blockSignals(True)
+        try:
+            self.layer_table.setRowCount(len(layers))
+            for row, layer_data in enumerate(layers):
+                self._set_layer_row(row, layer_data)
+        finally:
+            self.layer_table.blockSignals(False)
+        self._row_cache = [None] * len(layers)
 
         self.update_profile()
 
-    def _add_layer_from_data(self, layer_data):
-        """Add layer row from saved data"""
-        row = self.layer_table.rowCount()
-        self.layer_table.insertRow(row)
+    def _set_table_text(self, row, column, text, centered=True):
+        """Set cell text, reusing the existing item when there is one"""
+        item = self.layer_table.item(row, column)
+        if item is None:
+            item = QTableWidgetItem(text)
+            if centered:
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.layer_table.setItem(row, column, item)
+        else:
+            item.setText(text)
 
+    def _set_layer_row(self, row, layer_data):
+        """Fill a layer row from saved data (row must already exist)"""
         # Layer number
-        item = QTableWidgetItem(str(row + 1))
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 0, item)
+        self._set_table_text(row, 0, str(row + 1))
 
         # Depth
-        item = QTableWidgetItem(layer_data.get('depth', '1.0'))
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 1, item)
+        self._set_table_text(row, 1, layer_data.get('depth', '1.0'))
 
         # Soil type combo
-        combo = QComboBox()
-        combo.addItems(list(SOIL_TYPES.keys()))
+        combo = self.layer_table.cellWidget(row, 2)
+        if combo is None:
+            combo = QComboBox()
+            combo.addItems(_SOIL_TYPE_NAMES)
+            combo.currentTextChanged.connect(self.on_soil_type_changed)
+            self.layer_table.setCellWidget(row, 2, combo)
+        combo.blockSignals(True)
         combo.setCurrentText(layer_data.get('soil_type', 'Fill'))
-        combo.currentTextChanged.connect(self.on_table_changed)
-        self.layer_table.setCellWidget(row, 2, combo)
+        combo.blockSignals(False)
 
         # N-value
-        item = QTableWidgetItem(layer_data.get('n_value', ''))
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 3, item)
+        self._set_table_text(row, 3, layer_data.get('n_value', ''))
 
         # Description
-        item = QTableWidgetItem(layer_data.get('description', ''))
-        self.layer_table.setItem(row, 4, item)
+        self._set_table_text(row, 4, layer_data.get('description', ''), centered=False)
 
     def on_water_level_changed(self):
         """Handle water level change"""
         try:
             self.water_level = float(self.wl_input.text())
-            self.update_profile()
         except ValueError:
-            pass
+            return
 
-    def on_table_changed(self):
-        """Handle table change"""
+        # A pending full redraw already picks up the new water level
+        if self._update_timer.isActive():
+            return
+        self.profile_canvas.update_water_level(self.water_level)
+
+    def on_table_changed(self, row, column):
+        """Handle table change (only the edited row is re-read)"""
+        if 0 <= row < len(self._row_cache):
+            self._row_cache[row] = None
+        self.update_profile()
+
+    def on_soil_type_changed(self, soil_type):
+        """Handle soil type combo change"""
+        combo = self.sender()
+        for row in range(min(self.layer_table.rowCount(), len(self._row_cache))):
+            if self.layer_table.cellWidget(row, 2) is combo:
+                self._row_cache[row] = None
+                break
         self.update_profile()
 
     def add_layer_row(self):
         """Add new layer row"""
-        row = self.layer_table.rowCount()
-        self.layer_table.insertRow(row)
-
-        # Layer number
-        item = QTableWidgetItem(str(row + 1))
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 0, item)
-
-        # Depth
-        item = QTableWidgetItem("1.0")
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 1, item)
-
-        # Soil type combo
-        combo = QComboBox()
-        combo.addItems(list(SOIL_TYPES.keys()))
-        combo.currentTextChanged.connect(self.on_table_changed)
-        self.layer_table.setCellWidget(row, 2, combo)
-
-        # N-value
-        item = QTableWidgetItem("")
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 3, item)
-
-        # Description
-        item = QTableWidgetItem("")
-        self.layer_table.setItem(row, 4, item)
-
+        # Populate the row with signals blocked, then redraw once
+        self.layer_table.blockSignals(True)
+        try:
+            row = self.layer_table.rowCount()
+            self.layer_table.insertRow(row)
+            self._set_layer_row(row, {})
+        finally:
+            self.layer_table.blockSignals(False)
+        self._row_cache.insert(row, None)
         self.update_profile()
 
     def remove_layer_row(self):
         """Remove selected layer row"""
         current_row = self.layer_table.currentRow()
         if current_row >= 0:
-            self.layer_table.removeRow(current_row)
-            # Update layer numbers
-            for row in range(self.layer_table.rowCount()):
-                item = self.layer_table.item(row, 0)
-                if item:
-                    item.setText(str(row + 1))
+            self.layer_table.blockSignals(True)
+            try:
+                self.layer_table.removeRow(current_row)
+                # Update layer numbers
+                for row in range(self.layer_table.rowCount()):
+                    item = self.layer_table.item(row, 0)
+                    if item:
+                        item.setText(str(row + 1))
+            finally:
+                self.layer_table.blockSignals(False)
+            del self._row_cache[current_row:current_row + 1]
             self.update_profile()
 
     def update_profile(self):
-        """Update soil profile visualization"""
-        layers = []
-        current_elev = self.ground_elevation
+        """Schedule a soil profile redraw (coalesces rapid edits)"""
+        self._update_timer.start()
+
+    def _flush_profile_update(self):
+        """Run a pending profile redraw now (before reading the figure)"""
+        self._flush_level_inputs()
+        if self._update_timer.isActive():
+            self._update_timer.stop()
+            self._do_update_profile()
+
+    def _read_layer_row(self, row):
+        """Parse one layer_table row into (depth, soil_type, n_value, description)"""
+        depth_item = self.layer_table.item(row, 1)
+        combo = self.layer_table.cellWidget(row, 2)
+        n_item = self.layer_table.item(row, 3)
+        desc_item = self.layer_table.item(row, 4)
+
+        if not depth_item or not combo:
+            return (None, '', '', '')
 
-        for row in range(self.layer_table.rowCount()):
-            try:
-                depth_item = self.layer_table.item(row, 1)
-                combo = self.layer_table.cellWidget(row, 2)
-                n_item = self.layer_table.item(row, 3)
-                desc_item = self.layer_table.item(row, 4)
+        try:
+            depth = float(depth_item.text())
+        except ValueError:
+            depth = None
+        return (depth,
+                combo.currentText(),
+                n_item.text() if n_item else '-',
+                desc_item.text() if desc_item else '')
 
-                if not depth_item or not combo:
-                    continue
-
-                depth = float(depth_item.text())
-                from_elev = current_elev
-                to_elev = current_elev - depth
-                current_elev = to_elev
-
-                layers.append({
-                    'from_elev': from_elev,
-                    'to_elev': to_elev,
-                    'soil_type': combo.currentText(),
-                    'n_value': n_item.text() if n_item else '-',
-                    'description': desc_item.text() if desc_item else ''
-                })
-            except ValueError:
+    def _do_update_profile(self):
+        """Update soil profile visualization"""
+        depths = []
+        soil_types = []
+        n_values = []
+        descriptions = []
+
+        # Keep the cache in step with the table, then re-read only the rows marked stale
+        row_count = self.layer_table.rowCount()
+        if len(self._row_cache) != row_count:
+            self._row_cache = [None] * row_count
+        for row in range(row_count):
+            cached = self._row_cache[row]
+            if cached is None:
+                cached = self._row_cache[row] = self._read_layer_row(row)
+            depth, soil_type, n_value, description = cached
+            if depth is None:
                 continue
 
+            depths.append(depth)
+            soil_types.append(soil_type)
+            n_values.append(n_value)
+            descriptions.append(description)
+
+        # Layers are stacked down from the ground level: column arrays, one entry per layer
+        depths = np.asarray(depths, dtype=float)
+        to_elevs = self.ground_elevation - np.cumsum(depths)
+        from_elevs = to_elevs + depths
+        layers = {
+            'from_elev': from_elevs,
+            'to_elev': to_elevs,
+            'soil_type': soil_types,
+            'n_value': n_values,
+            'description': descriptions,
+        }
+
         self.profile_canvas.plot_profile(layers, self.water_level, self.ground_elevation)
 
     def export_png(self):
@@ -856,7 +1409,8 @@ class Module5SoilProfile(QWidget):
             self, "Export PNG", "", "PNG Files (*.png)"
         )
         if file_path:
-            self.profile_canvas.fig.savefig(file_path, format='png', dpi=300, bbox_inches='tight')
+            self._flush_profile_update()
+            _write_png(self.profile_canvas.save_figure, file_path, bbox_inches='tight')
             QMessageBox.information(self, "Success", f"Exported to {file_path}")
 
     def export_pdf(self):
@@ -865,7 +1419,8 @@ class Module5SoilProfile(QWidget):
             self, "Export PDF", "", "PDF Files (*.pdf)"
         )
         if file_path:
-            self.profile_canvas.fig.savefig(file_path, format='pdf', bbox_inches='tight')
+            self._flush_profile_update()
+            self.profile_canvas.save_figure(file_path, format='pdf', bbox_inches='tight')
             QMessageBox.information(self, "Success", f"Exported to {file_path}")
 
     def export_all_png(self):
@@ -880,39 +1435,8 @@ class Module5SoilProfile(QWidget):
         if not file_path:
             return
 
-        # Save current borehole state
-        self._save_current_bh()
-
-        # Get BH names from Module 1
-        bh_names = []
-        if self.module1 and hasattr(self.module1, 'bh_names'):
-            bh_names = self.module1.bh_names
-        else:
-            # Fallback to generated names
-            bh_names = [f"BH-{i+1:02d}" for i in range(self.num_boreholes)]
-
-        # Create figure with subplots for all boreholes
-        fig = Figure(figsize=(4 * len(bh_names), 10))
-
-        for i, bh_name in enumerate(bh_names):
-            ax = fig.add_subplot(1, len(bh_names), i + 1)
-
-            # Get borehole data
-            if bh_name in self.borehole_data:
-                bh_data = self.borehole_data[bh_name]
-                ground_level = bh_data.get('ground_level', 100.0)
-                water_level = bh_data.get('water_level', -2.0)
-                layers = bh_data.get('layers', [])
-            else:
-                ground_level = 100.0
-                water_level = -2.0
-                layers = []
-
-            # Draw the profile for this borehole
-            self._draw_profile_on_axis(ax, bh_name, ground_level, water_level, layers)
-
-        fig.tight_layout()
-        fig.savefig(file_path, format='png', dpi=300, bbox_inches='tight')
+        canvas, bbox = self._build_all_figure(raster_patterns=True)
+        _write_png(canvas.print_figure, file_path, bbox_inches=bbox)
         QMessageBox.information(self, "Success", f"Exported all boreholes to {file_path}")
 
     def export_all_pdf(self):
@@ -927,190 +1451,187 @@ class Module5SoilProfile(QWidget):
         if not file_path:
             return
 
+        canvas, bbox = self._build_all_figure(raster_patterns=False)
+        canvas.print_figure(file_path, format='pdf', bbox_inches=bbox)
+        QMessageBox.information(self, "Success", f"Exported all boreholes to {file_path}")
+
+    def _get_export_bh_names(self):
+        """BH names for the all-borehole exports (Module 1 order)"""
+        if self.module1 and hasattr(self.module1, 'bh_names'):
+            return list(self.module1.bh_names)
+        # Fallback to generated names
+        return [f"BH-{i+1:02d}" for i in range(self.num_boreholes)]
+
+    def _collect_export_records(self, bh_names):
+        """Resolve (bh_name, ground_level, water_level, layers) per borehole, with defaults"""
+        records = []
+        for bh_name in bh_names:
+            bh_data = self.borehole_data.get(bh_name, {})
+            records.append((bh_name,
+                            bh_data.get('ground_level', 100.0),
+                            bh_data.get('water_level', -2.0),
+                            bh_data.get('layers', [])))
+        return records
+
+    def _build_all_figure(self, raster_patterns):
+        """
+        Build the side-by-side figure of all boreholes
+
+        raster_patterns draws the layer patterns as cached image tiles (PNG export);
+        otherwise they stay vector collections (PDF export). Returns (Agg canvas, tight
+        bbox in inches). The last figure of each kind and its bbox are kept and reused
+        while the borehole data is unchanged, so repeated exports skip rebuilding the
+        profiles and the get_tightbbox measurement. print_figure still runs its own
+        (non-rendering) layout draw on every save, as the figure uses constrained layout.
+        """
         # Save current borehole state
         self._save_current_bh()
+        bh_names = self._get_export_bh_names()
 
-        # Get BH names from Module 1
-        bh_names = []
-        if self.module1 and hasattr(self.module1, 'bh_names'):
-            bh_names = self.module1.bh_names
-        else:
-            # Fallback to generated names
-            bh_names = [f"BH-{i+1:02d}" for i in range(self.num_boreholes)]
+        signature = _borehole_signature(bh_names, self.borehole_data)
+        cached = self._export_figures.get(raster_patterns)
+        if cached is not None and cached[0] == signature:
+            return cached[1:]
 
         # Create figure with subplots for all boreholes
-        fig = Figure(figsize=(4 * len(bh_names), 10))
+        _ensure_mpl()
+        fig = Figure(figsize=(4 * len(bh_names), 10), layout='constrained')
+        # Off-screen figure: render with plain Agg, no Qt canvas involved
+        canvas = FigureCanvasAgg(fig)
+        axes = fig.subplots(1, len(bh_names), squeeze=False)[0]
+
+        pattern_spans = [[] if raster_patterns else None for _ in axes]
+        for ax, record, spans in zip(axes, self._collect_export_records(bh_names), pattern_spans):
+            # Draw the profile for this borehole
+            self._draw_profile_on_axis(ax, *record, pattern_spans=spans)
+
+        if raster_patterns:
+            # Tiles are sized from the axes, so solve the constrained layout first;
+            # the images stay inside their axes and do not move it
+            fig.get_layout_engine().execute(fig)
+            for ax, spans in zip(axes, pattern_spans):
+                for pattern, y_start, height in spans:
+                    self._add_pattern_to_axis(ax, pattern, y_start, height)
+
+        # Measure the tight bbox once (same as bbox_inches='tight'); saves pass it explicitly
+        fig.draw_without_rendering()
+        bbox = fig.get_tightbbox(canvas.get_renderer()).padded(mpl.rcParams['savefig.pad_inches'])
+
+        self._export_figures[raster_patterns] = (signature, canvas, bbox)
+        return canvas, bbox
+
+    def _draw_profile_on_axis(self, ax, bh_name, ground_level, water_level, layers,
+                              pattern_spans=None):
+        """
+        Draw soil profile on a given (fresh) axis
+
+        Layer patterns are drawn as vectors, unless pattern_spans is a list: then
+        (pattern, y_start, height) is appended per layer for _add_pattern_to_axis
+        to rasterize once the figure layout is final.
+        """
+        # One validating pass into columns; rows with an unparseable depth are skipped
+        depths = []
+        soil_types = []
+        n_values = []
+        for layer in layers:
+            try:
+                depth = float(layer.get('depth', 0))
+            except (TypeError, ValueError):
+                continue
+            depths.append(depth)
+            soil_types.append(layer.get('soil_type', 'Fill'))
+            n_values.append(layer.get('n_value', '-'))
 
-        for i, bh_name in enumerate(bh_names):
-            ax = fig.add_subplot(1, len(bh_names), i + 1)
+        ax.set_title(bh_name, fontsize=12, weight='bold', pad=10)
+        if not depths:
+            # Nothing to scale: no limits, spines, ticks or grid, just the placeholder
+            ax.set_axis_off()
+            ax.text(0.5, 0.5, 'No layers', transform=ax.transAxes,
+                    ha='center', va='center', fontsize=10, color='gray')
+            return
 
-            # Get borehole data
-            if bh_name in self.borehole_data:
-                bh_data = self.borehole_data[bh_name]
-                ground_level = bh_data.get('ground_level', 100.0)
-                water_level = bh_data.get('water_level', -2.0)
-                layers = bh_data.get('layers', [])
-            else:
-                ground_level = 100.0
-                water_level = -2.0
-                layers = []
+        # Layers are stacked down from the ground level
+        depths = np.asarray(depths, dtype=float)
+        to_elevs = ground_level - np.cumsum(depths)
+        from_elevs = np.concatenate(([ground_level], to_elevs[:-1]))
+        min_elev = float(to_elevs.min())
+        max_elev = ground_level
+        ax.set_xlim(0, 1)
+        ax.set_ylim(min_elev - 2, max_elev + 2)
+        # Limits are fixed; skip autoscale bookkeeping for every patch/collection added
+        ax.set_autoscale_on(False)
 
-            # Draw the profile for this borehole
-            self._draw_profile_on_axis(ax, bh_name, ground_level, water_level, layers)
+        # Labels are collected as (x, y, text) and added per style after the loop
+        depth_labels = []
+        soil_labels = []
+        n_labels = []
 
-        fig.tight_layout()
-        fig.savefig(file_path, format='pdf', bbox_inches='tight')
-        QMessageBox.information(self, "Success", f"Exported all boreholes to {file_path}")
+        # Draw layers
+        for from_elev, to_elev, soil_type, n_value in zip(
+                from_elevs.tolist(), to_elevs.tolist(), soil_types, n_values):
+            # Get soil properties
+            color, pattern = _SOIL_STYLE.get(soil_type, _SOIL_STYLE['Fill'])
 
-    def _draw_profile_on_axis(self, ax, bh_name, ground_level, water_level, layers):
-        """Draw soil profile on a given axis"""
-        ax.clear()
-        ax.set_xlim(0, 1)
+            # Draw layer rectangle
+            height = from_elev - to_elev
+            rect = Rectangle((0, to_elev), 1, height,
+                             facecolor=color, edgecolor='black', linewidth=1)
+            ax.add_patch(rect)
 
-        if not layers:
-            ax.set_ylim(ground_level - 10, ground_level + 2)
-            ax.text(0.5, ground_level - 5, 'No layers',
-                   ha='center', va='center', fontsize=10, color='gray')
-        else:
-            # Calculate elevation ranges
-            current_elev = ground_level
-            layer_elevations = []
-
-            for layer in layers:
-                try:
-                    depth = float(layer.get('depth', 0))
-                    from_elev = current_elev
-                    to_elev = current_elev - depth
-                    layer_elevations.append({
-                        'from_elev': from_elev,
-                        'to_elev': to_elev,
-                        'soil_type': layer.get('soil_type', 'Fill'),
-                        'n_value': layer.get('n_value', '-')
-                    })
-                    current_elev = to_elev
-                except:
-                    continue
-
-            if layer_elevations:
-                min_elev = min(l['to_elev'] for l in layer_elevations)
-                max_elev = ground_level
-                ax.set_ylim(min_elev - 2, max_elev + 2)
-
-                # Draw layers
-                for layer in layer_elevations:
-                    from_elev = layer['from_elev']
-                    to_elev = layer['to_elev']
-                    soil_type = layer['soil_type']
-                    n_value = layer['n_value']
-
-                    # Get soil properties
-                    soil_props = SOIL_TYPES.get(soil_type, SOIL_TYPES['Fill'])
-                    color = soil_props['color']
-                    pattern = soil_props['pattern']
-
-                    # Draw layer rectangle
-                    height = from_elev - to_elev
-                    rect = Rectangle((0, to_elev), 1, height,
-                                   facecolor=color, edgecolor='black', linewidth=1)
-                    ax.add_patch(rect)
-
-                    # Add pattern
-                    self._add_pattern_to_axis(ax, pattern, to_elev, height)
-
-                    # Add depth labels
-                    ax.text(-0.05, from_elev, f'{from_elev:.2f}',
-                           ha='right', va='center', fontsize=8)
-
-                    # Add soil type and N-value
-                    mid_elev = (from_elev + to_elev) / 2
-                    ax.text(0.5, mid_elev, soil_type,
-                           ha='center', va='center', fontsize=7, weight='bold')
-                    if n_value and n_value != '-':
-                        ax.text(1.05, mid_elev, f'N={n_value}',
-                               ha='left', va='center', fontsize=7)
-
-                # Draw water level
-                if water_level is not None:
-                    wl_elev = ground_level + water_level
-                    if min_elev <= wl_elev <= max_elev:
-                        ax.axhline(y=wl_elev, color='blue', linestyle='--',
-                                  linewidth=2, alpha=0.7, label='Water Level')
-                        ax.text(1.05, wl_elev, 'WL', ha='left', va='center',
-                               fontsize=8, color='blue', weight='bold')
+            # Add pattern
+            if pattern_spans is None:
+                _draw_export_pattern(ax, pattern, to_elev, height)
             else:
-                ax.set_ylim(ground_level - 10, ground_level + 2)
+                pattern_spans.append((pattern, to_elev, height))
 
-        # Set title and labels
-        ax.set_title(bh_name, fontsize=12, weight='bold', pad=10)
+            # Depth label, soil type and N-value
+            depth_labels.append((-0.05, from_elev, f'{from_elev:.2f}'))
+            mid_elev = (from_elev + to_elev) / 2
+            soil_labels.append((0.5, mid_elev, soil_type))
+            if n_value and n_value != '-':
+                n_labels.append((1.05, mid_elev, f'N={n_value}'))
+
+        for style, labels in (('depth', depth_labels), ('soil', soil_labels),
+                              ('n_value', n_labels)):
+            text_kwargs = EXPORT_LABEL_STYLES[style]
+            for x, y, text in labels:
+                ax.text(x, y, text, **text_kwargs)
+
+        # Draw water level
+        if water_level is not None:
+            wl_elev = ground_level + water_level
+            if min_elev <= wl_elev <= max_elev:
+                ax.axhline(y=wl_elev, color='blue', linestyle='--',
+                           linewidth=2, alpha=0.7, label='Water Level')
+                ax.text(1.05, wl_elev, 'WL', ha='left', va='center',
+                        fontsize=8, color='blue', weight='bold')
+
+        # Axis labels
         ax.set_ylabel('Elevation (m)', fontsize=10)
         ax.set_xticks([])
         ax.grid(True, axis='y', alpha=0.3)
 
     def _add_pattern_to_axis(self, ax, pattern, y_start, height):
-        """Add pattern overlay to axis"""
-        if pattern == 'horizontal_lines':
-            num_lines = int(height * 2)
-            for i in range(num_lines):
-                y = y_start + (i + 0.5) * height / num_lines
-                ax.plot([0, 1], [y, y], 'k-', linewidth=0.5, alpha=0.6)
-        elif pattern == 'horizontal_dense':
-            num_lines = int(height * 4)
-            for i in range(num_lines):
-                y = y_start + (i + 0.5) * height / num_lines
-                ax.plot([0, 1], [y, y], 'k-', linewidth=0.5, alpha=0.6)
-        elif pattern == 'horizontal_thick':
-            num_lines = int(height * 2)
-            for i in range(num_lines):
-                y = y_start + (i + 0.5) * height / num_lines
-                ax.plot([0, 1], [y, y], 'k-', linewidth=1.2, alpha=0.7)
-        elif pattern == 'horizontal_vertical':
-            num_h_lines = int(height * 2)
-            for i in range(num_h_lines):
-                y = y_start + (i + 0.5) * height / num_h_lines
-                ax.plot([0, 1], [y, y], 'k-', linewidth=1.2, alpha=0.7)
-            for i in range(3):
-                x = 0.25 + i * 0.25
-                ax.plot([x, x], [y_start, y_start + height], 'k-', linewidth=1.2, alpha=0.7)
-        elif pattern == 'stipple_light' or pattern == 'stipple_medium' or pattern == 'stipple_dense' or pattern == 'stipple_heavy':
-            density = {'stipple_light': 30, 'stipple_medium': 50,
-                      'stipple_dense': 70, 'stipple_heavy': 100}.get(pattern, 50)
-            num_dots = int(height * density)
-            np.random.seed(42)
-            x_dots = np.random.uniform(0, 1, num_dots)
-            y_dots = np.random.uniform(y_start, y_start + height, num_dots)
-            ax.scatter(x_dots, y_dots, s=1, c='black', alpha=0.5)
-        elif pattern == 'circles':
-            num_circles = int(height * 3)
-            np.random.seed(42)
-            for i in range(num_circles):
-                x = np.random.uniform(0.1, 0.9)
-                y = np.random.uniform(y_start + 0.1, y_start + height - 0.1)
-                circle = mpatches.Circle((x, y), 0.03, fill=False, edgecolor='black', linewidth=0.5)
-                ax.add_patch(circle)
-        elif pattern == 'diagonal':
-            num_lines = int(height * 4)
-            for i in range(num_lines):
-                y = y_start + i * height / num_lines
-                ax.plot([0, 1], [y, y + height/num_lines], 'k-', linewidth=0.5, alpha=0.6)
-        elif pattern == 'crosshatch':
-            num_lines = int(height * 4)
-            for i in range(num_lines):
-                y = y_start + i * height / num_lines
-                ax.plot([0, 1], [y, y + height/num_lines], 'k-', linewidth=0.5, alpha=0.6)
-                ax.plot([0, 1], [y + height/num_lines, y], 'k-', linewidth=0.5, alpha=0.6)
-        elif pattern == 'dots_on_dark':
-            num_dots = int(height * 20)
-            np.random.seed(42)
-            x_dots = np.random.uniform(0, 1, num_dots)
-            y_dots = np.random.uniform(y_start, y_start + height, num_dots)
-            ax.scatter(x_dots, y_dots, s=1, c='white', alpha=0.9)
-        elif pattern == 'wavy_dots':
-            num_waves = int(height * 2)
-            for i in range(num_waves):
-                y_pos = y_start + (i + 0.5) * height / num_waves
-                x_wave = np.linspace(0, 1, 20)
-                y_wave = y_pos + 0.05 * np.sin(x_wave * 10)
-                ax.plot(x_wave, y_wave, 'k-', linewidth=0.5, alpha=0.6)
+        """Add a PNG export pattern overlay as one image cut from the pattern's tile"""
+        # Tile pixels follow this axis' final (post-layout) scale so line widths and dot
+        # sizes stay as drawn; rows are picked by absolute elevation, so stacked layers
+        # continue the tile instead of restarting it at each layer top
+        if height <= 0:
+            return
+        fig_dpi = ax.figure.dpi
+        y_min, y_max = ax.get_ylim()
+        tile = _export_pattern_tile(pattern,
+                                    max(round(ax.bbox.width / fig_dpi, 1), 0.1),
+                                    max(round(ax.bbox.height / fig_dpi / (y_max - y_min), 2), 0.01))
+        if tile is None:
+            return
+        rows_per_m = tile.shape[0] / PATTERN_TILE_METRES
+        first_row = round(y_start * rows_per_m)
+        num_rows = max(1, round(height * rows_per_m))
+        image = np.take(tile, np.arange(first_row, first_row + num_rows), axis=0, mode='wrap')
+        # zorder 1.9 keeps the overlay above the layer rectangles and below the WL line and labels
+        ax.imshow(image, extent=(0, 1, y_start, y_start + height), origin='lower',
+                  aspect='auto', interpolation='nearest', zorder=1.9)
 
     def get_project_data(self):
         """Get data for saving"""
@@ -12,48 +12,78 @@ Features:
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QTableWidget, QTableWidgetItem, QFileDialog,
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFileDialog,
     QMessageBox, QSplitter, QComboBox, QLineEdit,
-    QGroupBox, QTextEdit, QTreeWidget, QTreeWidgetItem,
+    QGroupBox, QPlainTextEdit, QTreeWidget, QTreeWidgetItem,
     QDialog, QDialogButtonBox, QAbstractItemView,
-    QTabWidget
+    QTabWidget, QTableView, QTreeView, QStyledItemDelegate,
+    QStyle, QStyleOptionComboBox, QApplication, QHeaderView
+)
+from PyQt6.QtCore import (
+    Qt, QEvent, QTimer, QAbstractTableModel, QAbstractItemModel, QModelIndex, QLine, QRect
 )
-from PyQt6.QtCore import Qt, QEvent
 from PyQt6.QtGui import QFont, QColor, QPen, QPainter
+import functools
 import re
+from collections import defaultdict
+
+# Auto-generated phase names: Phase_1, Phase_2, ...
+_PHASE_NUMBER_RE = re.compile(r'^Phase_(\d+)$')
 
 
-class BranchTreeWidget(QTreeWidget):
-    """QTreeWidget that paints blue connector lines (├ └ │) between phases."""
+class BranchTreeView(QTreeView):
+    """QTreeView that paints blue connector lines (├ └ │) between phases."""
 
     _LINE_COLOR = QColor('#3B82F6')
     _LINE_WIDTH = 2
+    # Paint objects are immutable here, so build them once instead of per branch cell
+    _LINE_PEN = QPen(_LINE_COLOR)
+    _LINE_PEN.setWidth(_LINE_WIDTH)
+    _BACKGROUND = QColor('white')
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Per-item connector levels, rebuilt lazily after any change to the tree structure
+        self._branch_levels = {}
+
+    def setModel(self, model):
+        super().setModel(model)
+        self._branch_levels.clear()
+        for signal in (model.rowsInserted, model.rowsRemoved, model.rowsMoved,
+                       model.modelReset, model.layoutChanged):
+            signal.connect(self._branch_levels.clear)
+
+    def _levels_for(self, index):
+        """(row_in_parent, sibling_count) for each level below the root, cached per item"""
+        key = index.internalId()
+        levels = self._branch_levels.get(key)
+        if levels is None:
+            # Build depth info: for each level → (row_in_parent, sibling_count)
+            levels = []
+            idx = index
+            while idx.parent().isValid():
+                parent = idx.parent()
+                levels.append((idx.row(), self.model().rowCount(parent)))
+                idx = parent
+            levels.reverse()
+            self._branch_levels[key] = levels
+        return levels
 
     def drawBranches(self, painter, rect, index):
         """Override to draw blue branch connector lines."""
-        painter.fillRect(rect, QColor('white'))
+        # Nothing to paint outside the viewport or for hidden rows
+        if not self.viewport().rect().intersects(rect) or self.isRowHidden(index.row(), index.parent()):
+            return
+        painter.fillRect(rect, self._BACKGROUND)
 
         if not index.parent().isValid():
             return  # Top-level (root) — no lines needed
 
         indent = self.indentation()
         mid_y = (rect.top() + rect.bottom()) // 2
+        levels = self._levels_for(index)
 
-        # Build depth info: for each level → (row_in_parent, sibling_count)
-        levels = []
-        idx = index
-        while idx.parent().isValid():
-            parent = idx.parent()
-            levels.insert(0, (idx.row(), self.model().rowCount(parent)))
-            idx = parent
-
-        painter.save()
-        pen = QPen(self._LINE_COLOR)
-        pen.setWidth(self._LINE_WIDTH)
-        painter.setPen(pen)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
-
+        lines = []
         depth = len(levels)
         for i, (row, total) in enumerate(levels):
             x = rect.left() + indent * i + indent // 2
@@ -61,33 +91,474 @@ class BranchTreeWidget(QTreeWidget):
 
             if i == depth - 1:
                 # This item's own level — draw connector to item
-                painter.drawLine(x, mid_y, rect.right(), mid_y)
+                lines.append(QLine(x, mid_y, rect.right(), mid_y))
                 if has_more:
                     # ├── vertical top → bottom
-                    painter.drawLine(x, rect.top(), x, rect.bottom())
+                    lines.append(QLine(x, rect.top(), x, rect.bottom()))
                 else:
                     # └── vertical top → mid
-                    painter.drawLine(x, rect.top(), x, mid_y)
+                    lines.append(QLine(x, rect.top(), x, mid_y))
             else:
                 # Ancestor level — vertical continuation if siblings below
                 if has_more:
                     # │ full vertical line
-                    painter.drawLine(x, rect.top(), x, rect.bottom())
+                    lines.append(QLine(x, rect.top(), x, rect.bottom()))
 
+        painter.save()
+        painter.setPen(self._LINE_PEN)
+        if painter.testRenderHint(QPainter.RenderHint.Antialiasing):
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        painter.drawLines(lines)
         painter.restore()
 
 
+class PhaseNode:
+    """One staged-construction phase and its child phases."""
+
+    __slots__ = ('name', 'calc_type', 'pore_pressure', 'reset_disp',
+                 'calc_options', 'parent', 'children')
+
+    def __init__(self, name, calc_type='', pore_pressure='', reset_disp='', calc_options=()):
+        self.name = name
+        self.calc_type = calc_type
+        self.pore_pressure = pore_pressure
+        self.reset_disp = reset_disp
+        # Calculation Type choices (fixed when the phase is created: initial phase or not)
+        self.calc_options = calc_options
+        self.parent = None
+        self.children = []
+
+    def row(self):
+        """Position among the parent's children"""
+        return self.parent.children.index(self) if self.parent else 0
+
+    def add_child(self, child, row=None):
+        """Attach child at row (default: last)"""
+        child.parent = self
+        if row is None:
+            self.children.append(child)
+        else:
+            self.children.insert(row, child)
+        return child
+
+    def walk(self):
+        """This phase, then its descendants depth-first"""
+        # Explicit stack: phases are usually long chains, where nested generators cost O(depth) per step
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+
+class StagedModel(QAbstractItemModel):
+    """Phase hierarchy for the staged construction tree (columns: phase, calc, pore, reset)."""
+
+    _COLUMN_ATTRS = ('name', 'calc_type', 'pore_pressure', 'reset_disp')
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self.root = PhaseNode('')  # Invisible root; its children are the top-level phases
+
+    def node(self, index):
+        """PhaseNode for index (the invisible root for an invalid index)"""
+        return index.internalPointer() if index.isValid() else self.root
+
+    def index_of(self, node, column=0):
+        """Model index of node"""
+        if node is None or node is self.root:
+            return QModelIndex()
+        return self.createIndex(node.row(), column, node)
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self.node(parent).children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self.index_of(index.internalPointer().parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self.node(parent).children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return getattr(node, self._COLUMN_ATTRS[index.column()])
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() == 0:
+            # Tooltip: show parent connection
+            if node.parent is self.root:
+                return "Root phase"
+            return f"Parent: {node.parent.name}  (double-click to change)"
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        node = index.internalPointer()
+        attr = self._COLUMN_ATTRS[index.column()]
+        value = '' if value is None else str(value)
+        if getattr(node, attr) == value:
+            return False
+        setattr(node, attr, value)
+        # The pore pressure cell's enabled state follows the calculation type
+        last = index.siblingAtColumn(2) if index.column() == 1 else index
+        self.dataChanged.emit(index, last)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == 2 and index.internalPointer().calc_type == 'Safety':
+            return Qt.ItemFlag.ItemIsSelectable  # No pore pressure for Safety phases
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section] if section < len(self._headers) else None
+        return None
+
+    def set_roots(self, nodes):
+        """Replace the whole hierarchy with the given top-level phases"""
+        self.beginResetModel()
+        self.root.children = []
+        for node in nodes:
+            self.root.add_child(node)
+        self.endResetModel()
+
+    def add_phase(self, parent_node, node):
+        """Append node as the last child of parent_node"""
+        row = len(parent_node.children)
+        self.beginInsertRows(self.index_of(parent_node), row, row)
+        parent_node.add_child(node)
+        self.endInsertRows()
+        return self.index_of(node)
+
+    def remove_phase(self, node):
+        """Remove node and its subtree"""
+        row = node.row()
+        self.beginRemoveRows(self.index_of(node.parent), row, row)
+        del node.parent.children[row]
+        node.parent = None
+        self.endRemoveRows()
+
+    def moveRows(self, source_parent, source_row, count, destination_parent, destination_child):
+        # Moves count phases (with their subtrees) in one step; Qt rejects moves into themselves
+        if not self.beginMoveRows(source_parent, source_row, source_row + count - 1,
+                                  destination_parent, destination_child):
+            return False
+        source = self.node(source_parent)
+        destination = self.node(destination_parent)
+        moved = source.children[source_row:source_row + count]
+        del source.children[source_row:source_row + count]
+        if source is destination and destination_child > source_row:
+            destination_child -= count
+        for offset, node in enumerate(moved):
+            destination.add_child(node, destination_child + offset)
+        self.endMoveRows()
+        return True
+
+
+class LayerTableModel(QAbstractTableModel):
+    """Layer properties as rows of cell text (one list of strings per layer)."""
+
+    def __init__(self, headers, rows, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        # Shared with the owner (Module6PlaxisScripts.layers_data); only mutated in place
+        self.rows = rows
+        # Text the last edited cell held before setData, for dataChanged handlers
+        self.previous_value = ''
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        value = '' if value is None else str(value)
+        row = self.rows[index.row()]
+        if row[index.column()] == value:
+            return False  # Unchanged - no dataChanged, like QTableWidgetItem.setText
+        self.previous_value = row[index.column()]
+        row[index.column()] = value
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return str(section + 1)
+
+    def value(self, row, col):
+        """Cell text at (row, col)"""
+        return self.rows[row][col]
+
+    def set_value(self, row, col, value):
+        """Set one cell, emitting dataChanged if the text changed"""
+        return self.setData(self.index(row, col), value)
+
+    def set_rows(self, rows):
+        """Replace all rows at once (single model reset, no per-cell signals)"""
+        self.beginResetModel()
+        self.rows[:] = rows
+        self.endResetModel()
+
+    def insert_row(self, row, values):
+        """Insert one row of cell text before row"""
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rows.insert(row, list(values))
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        """Remove one row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.rows[row]
+        self.endRemoveRows()
+
+
+class OutputTableModel(QAbstractTableModel):
+    """
+    Output script rows, one dict per row in the saved format:
+    {'phase', 'name', 'scale_min', 'scale_max', 'scale_interval', 'scale': text,
+     'checks': {col: True}, 'type': text}
+    """
+
+    def __init__(self, fields, parent=None):
+        super().__init__(parent)
+        # fields[col]: row dict key of a text / dropdown column, None for a checkbox column
+        self._fields = fields
+        self.rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._fields)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        field = self._fields[index.column()]
+        row = self.rows[index.row()]
+        if field is None:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if row['checks'].get(index.column()) else Qt.CheckState.Unchecked
+        elif role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return row[field]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+        col = index.column()
+        field = self._fields[col]
+        row = self.rows[index.row()]
+        if field is None:
+            if role != Qt.ItemDataRole.CheckStateRole:
+                return False
+            if Qt.CheckState(value) == Qt.CheckState.Checked:
+                row['checks'][col] = True
+            else:
+                row['checks'].pop(col, None)
+        else:
+            if role != Qt.ItemDataRole.EditRole:
+                return False
+            value = '' if value is None else str(value)
+            if row[field] == value:
+                return False
+            row[field] = value
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if self._fields[index.column()] is None:
+            return Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+
+    def value(self, row, col):
+        """Text of a text / dropdown cell"""
+        return self.rows[row][self._fields[col]]
+
+    def is_checked(self, row, col):
+        """Check state of a checkbox cell"""
+        return bool(self.rows[row]['checks'].get(col))
+
+    def set_rows(self, rows):
+        """Replace all rows at once (single model reset)"""
+        self.beginResetModel()
+        self.rows = list(rows)
+        self.endResetModel()
+
+    def insert_row(self, row, data):
+        """Insert one row dict before row"""
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rows.insert(row, data)
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        """Remove one row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.rows[row]
+        self.endRemoveRows()
+
+
+class ComboCellDelegate(QStyledItemDelegate):
+    """
+    Paints dropdown cells (layer, output tables, staged tree) as combo boxes; a real
+    QComboBox is only created while a cell is being edited.
+    """
+
+    def __init__(self, options_for, style_combobox, parent=None):
+        super().__init__(parent)
+        # options_for(index) -> dropdown choices, or None for a plain text cell
+        self._options_for = options_for
+        self._style_combobox = style_combobox
+
+    def paint(self, painter, option, index):
+        if self._options_for(index) is None:
+            super().paint(painter, option, index)
+            return
+        combo_option = QStyleOptionComboBox()
+        combo_option.rect = option.rect.adjusted(1, 1, -1, -1)
+        combo_option.state = option.state
+        combo_option.palette = option.palette
+        combo_option.fontMetrics = option.fontMetrics
+        combo_option.currentText = index.data() or ''
+        combo_option.frame = True
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawComplexControl(QStyle.ComplexControl.CC_ComboBox, combo_option, painter, option.widget)
+        style.drawControl(QStyle.ControlElement.CE_ComboBoxLabel, combo_option, painter, option.widget)
+
+    def createEditor(self, parent, option, index):
+        options = self._options_for(index)
+        if options is None:
+            return super().createEditor(parent, option, index)
+        combo = QComboBox(parent)
+        combo.addItems(options)
+        self._style_combobox(combo)
+        # A pick commits straight away, as the always-on cell combos used to
+        combo.activated.connect(lambda _i, c=combo: self._commit_and_close(c))
+        QTimer.singleShot(0, combo.showPopup)
+        return combo
+
+    def _commit_and_close(self, combo):
+        self.commitData.emit(combo)
+        self.closeEditor.emit(combo)
+
+    def setEditorData(self, editor, index):
+        if isinstance(editor, QComboBox):
+            editor.setCurrentText(index.data() or '')
+        else:
+            super().setEditorData(editor, index)
+
+    def setModelData(self, editor, model, index):
+        if isinstance(editor, QComboBox):
+            model.setData(index, editor.currentText())
+        else:
+            super().setModelData(editor, model, index)
+
+
+class GroupedHeaderView(QHeaderView):
+    """
+    Horizontal header painted as several rows of merged group cells
+    (e.g. Stresses → Effective → σ'xx). Cells follow the table's section
+    positions, so they scroll and size with the columns.
+    """
+
+    _GRID_COLOR = QColor('#D1D1D6')
+    _CELL_COLOR = QColor('white')
+
+    def __init__(self, rows, row_height, font, parent=None):
+        super().__init__(Qt.Orientation.Horizontal, parent)
+        self._rows = rows
+        self._row_height = row_height
+        self._cells = []  # (row, col, row_span, col_span, text, QColor)
+        self._font = font
+        self.setSectionsClickable(False)
+        self.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+
+    def add_cell(self, row, col, text, row_span=1, col_span=1, background=None):
+        """Add a header cell covering row_span rows and col_span columns (background: QColor)"""
+        self._cells.append((row, col, row_span, col_span, text, background or self._CELL_COLOR))
+
+    def sizeHint(self):
+        size = super().sizeHint()
+        size.setHeight(self._rows * self._row_height + 2)
+        return size
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        painter.setFont(self._font)
+        painter.setPen(self._GRID_COLOR)
+        for row, col, row_span, col_span, text, background in self._cells:
+            x = self.sectionViewportPosition(col)
+            width = sum(self.sectionSize(c) for c in range(col, col + col_span))
+            if x + width < 0 or x > self.viewport().width():
+                continue
+            rect = QRect(x, row * self._row_height, width, row_span * self._row_height)
+            painter.fillRect(rect, background)
+            painter.drawRect(rect.adjusted(0, 0, -1, -1))
+            painter.setPen(Qt.GlobalColor.black)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+            painter.setPen(self._GRID_COLOR)
+        painter.end()
+
+
 class Module6PlaxisScripts(QWidget):
     """
     Module 6: Python Scripts for PLAXIS
     """
 
+    # Shared fonts (QFont is a value type, so widgets can all take the same instance)
+    _FONT_TITLE = QFont("SF Pro Display", 18, QFont.Weight.Bold)
+    _FONT_SUBTITLE = QFont("SF Pro Display", 12)
+    _FONT_GROUP = QFont("SF Pro Display", 11, QFont.Weight.Bold)
+    _FONT_BODY = QFont("SF Pro Display", 10)
+    _FONT_SMALL = QFont("SF Pro Display", 9)
+    _FONT_HEADER_CELL = QFont("SF Pro Display", 8, QFont.Weight.Bold)
+    _FONT_CODE = QFont("Consolas", 10)
+
     # PLAXIS dropdown options with code values
     SOIL_MODELS = {
         'None': 0,
         'Linear Elastic': 1,
         'Mohr-Coulomb': 2
     }
+    SOIL_MODELS_KEYS = tuple(SOIL_MODELS)
 
     DRAINAGE_TYPES = {
         'Drained': 0,
@@ -96,6 +567,7 @@ class Module6PlaxisScripts(QWidget):
         'Undrained C': 3,
         'Non-porous': 4,
     }
+    DRAINAGE_TYPES_KEYS = tuple(DRAINAGE_TYPES)
 
     # Classification: GroundwaterClassificationType
     CLASSIFICATION_TYPES = {
@@ -104,6 +576,7 @@ class Module6PlaxisScripts(QWidget):
         'USDA' : 2,
         'Staring': 3
     }
+    CLASSIFICATION_TYPES_KEYS = tuple(CLASSIFICATION_TYPES)
 
     # GroundwaterSoilClassUSDA (for USDA classification)
     USDA_SOIL_CLASSES = {
@@ -120,6 +593,7 @@ class Module6PlaxisScripts(QWidget):
         'Silty Clay': 10,
         'Clay': 11,
     }
+    USDA_SOIL_CLASSES_KEYS = tuple(USDA_SOIL_CLASSES)
 
     # GroundwaterSoilClassStandard (for Standard classification)
     STANDARD_SOIL_CLASSES = {
@@ -130,18 +604,21 @@ class Module6PlaxisScripts(QWidget):
         'Very fine': 4,
         'Organic': 5,
     }
+    STANDARD_SOIL_CLASSES_KEYS = tuple(STANDARD_SOIL_CLASSES)
     
     # GwDefaultsMethod
     DEFAULTS_METHODS = {
         'From data set': 0,
         'From grain size distribution': 1,
     }
+    DEFAULTS_METHODS_KEYS = tuple(DEFAULTS_METHODS)
 
     # K0 Determination
     K0_DETERMINATION = {
         'Automatic': 0,
         'Manual': 1,
     }
+    K0_DETERMINATION_KEYS = tuple(K0_DETERMINATION)
 
     # InterfaceStrengthDetermination
     INTERFACE_STRENGTH = {
@@ -155,6 +632,7 @@ class Module6PlaxisScripts(QWidget):
         'Field stress': 1,
         'Gravity loading': 2,
     }
+    INITIAL_PHASE_CALC_TYPE_KEYS = tuple(INITIAL_PHASE_CALC_TYPE)
 
     # Staged Construction - Phase Calculation Type
     PHASE_CALC_TYPE = {
@@ -162,6 +640,7 @@ class Module6PlaxisScripts(QWidget):
         'Consolidation': 1,
         'Safety': 2,
     }
+    PHASE_CALC_TYPE_KEYS = tuple(PHASE_CALC_TYPE)
 
     # Pore Pressure Calculation Type
     PORE_PRESSURE_CALC_TYPE = {
@@ -169,6 +648,9 @@ class Module6PlaxisScripts(QWidget):
         'Use pressures from previous phase': 1,
         'Steady state groundwater flow': 2,
     }
+    PORE_PRESSURE_CALC_TYPE_KEYS = tuple(PORE_PRESSURE_CALC_TYPE)
+    # Pore pressure dropdown: '-' (Safety phases) plus the calculation types
+    PORE_PRESSURE_OPTIONS = ('-',) + PORE_PRESSURE_CALC_TYPE_KEYS
 
     # Reset Displacements to Zero
     RESET_DISPLACEMENTS = {
@@ -176,6 +658,7 @@ class Module6PlaxisScripts(QWidget):
         'FALSE': False,
         '-': None,
     }
+    RESET_DISPLACEMENTS_KEYS = tuple(RESET_DISPLACEMENTS)
 
     def __init__(self, parent=None, module4=None):
         super().__init__(parent)
@@ -192,41 +675,65 @@ class Module6PlaxisScripts(QWidget):
 
         # Output script export folder (user-selectable)
         self._output_dir = r"C:\Users\Public\Documents\PLAXIS_Exports"
+        # Last generated output script, keyed by the table rows and folder it was built from
+        self._script_cache = (None, None)
+
+        # Layer table rules: changed column → updater(values, previous text of that column)
+        # of the columns that depend on it
+        self._layer_rules = {
+            6: self._update_gamma_unsat,
+            13: self._update_soil_class,
+            17: self._update_k0_manual,
+        }
+
+        # eventFilter dispatch by event type; each handler checks its own target object
+        self._event_handlers = {
+            QEvent.Type.MouseButtonDblClick: self._on_staged_double_click,
+            QEvent.Type.KeyPress: self._on_layer_key_press,
+        }
+        self._staged_viewport = None  # Set once the staged tree exists
 
         self._setup_ui()
 
     def eventFilter(self, obj, event):
         """Handle double-click on tree viewport and Enter key in tables"""
-        # Intercept double-click on staged tree column 0 → parent selection
-        if hasattr(self, 'staged_tree') and obj == self.staged_tree.viewport():
-            if event.type() == QEvent.Type.MouseButtonDblClick:
-                pos = event.position().toPoint()
-                index = self.staged_tree.indexAt(pos)
-                if index.isValid() and index.column() == 0:
-                    item = self.staged_tree.itemFromIndex(index)
-                    if item:
-                        if item.text(0).lower() == 'initial phase':
-                            QMessageBox.information(
-                                self, "Info",
-                                "Initial phase is always the root "
-                                "and cannot be reparented.")
-                        else:
-                            self._show_parent_selection_dialog(item)
-                        return True  # Consume event — prevent Qt editing
-
-        if event.type() == QEvent.Type.KeyPress:
-            if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-                if obj == self.layer_table:
-                    current_row = self.layer_table.currentRow()
-                    current_col = self.layer_table.currentColumn()
-                    # Move to next column, or next row if at end
-                    if current_col < self.layer_table.columnCount() - 1:
-                        self.layer_table.setCurrentCell(current_row, current_col + 1)
-                    elif current_row < self.layer_table.rowCount() - 1:
-                        self.layer_table.setCurrentCell(current_row + 1, 0)
-                    return True
+        handler = self._event_handlers.get(event.type())
+        if handler is not None and handler(obj, event):
+            return True
         return super().eventFilter(obj, event)
 
+    def _on_staged_double_click(self, obj, event):
+        """Double-click on staged tree column 0 → parent selection"""
+        if obj is not self._staged_viewport:
+            return False
+        index = self.staged_tree.indexAt(event.position().toPoint())
+        if not index.isValid() or index.column() != 0:
+            return False
+        node = self.staged_model.node(index)
+        if node.name.lower() == 'initial phase':
+            QMessageBox.information(
+                self, "Info",
+                "Initial phase is always the root "
+                "and cannot be reparented.")
+        else:
+            self._show_parent_selection_dialog(node)
+        return True  # Consume event — prevent Qt editing
+
+    def _on_layer_key_press(self, obj, event):
+        """Enter in the layer table moves to the next cell"""
+        if obj is not self.layer_table or event.key() not in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            return False
+        current = self.layer_table.currentIndex()
+        current_row = current.row()
+        current_col = current.column()
+        model = self.layer_model
+        # Move to next column, or next row if at end
+        if current_col < model.columnCount() - 1:
+            self.layer_table.setCurrentIndex(model.index(current_row, current_col + 1))
+        elif current_row < model.rowCount() - 1:
+            self.layer_table.setCurrentIndex(model.index(current_row + 1, 0))
+        return True
+
     def _style_combobox(self, combo):
         """Apply style to combobox - no scroll, show all items"""
         combo.setMaxVisibleItems(20)  # Show all items without scroll
@@ -244,7 +751,7 @@ class Module6PlaxisScripts(QWidget):
 
         # Sub-tab widget with 3 tabs
         self.sub_tabs = QTabWidget()
-        self.sub_tabs.setFont(QFont("SF Pro Display", 10))
+        self.sub_tabs.setFont(self._FONT_BODY)
         self.sub_tabs.setStyleSheet("""
             QTabWidget::pane {
                 border: 1px solid #D1D1D6;
@@ -288,7 +795,7 @@ class Module6PlaxisScripts(QWidget):
         tab1_btn_layout.addStretch()
         btn_load = QPushButton("Load from Module 4")
         btn_load.setToolTip("Load layer data from Module 4")
-        btn_load.setFont(QFont("SF Pro Display", 10))
+        btn_load.setFont(self._FONT_BODY)
         btn_load.clicked.connect(self._load_from_module4)
         tab1_btn_layout.addWidget(btn_load)
         tab1_layout.addLayout(tab1_btn_layout)
@@ -315,13 +822,13 @@ class Module6PlaxisScripts(QWidget):
         tab3_btn_layout.addStretch()
         btn_generate = QPushButton("Generate Script")
         btn_generate.setToolTip("Generate Python script from table data")
-        btn_generate.setFont(QFont("SF Pro Display", 10))
+        btn_generate.setFont(self._FONT_BODY)
         btn_generate.clicked.connect(self._run_code)
         tab3_btn_layout.addWidget(btn_generate)
 
         btn_save = QPushButton("Save .py")
         btn_save.setToolTip("Save Python script to file")
-        btn_save.setFont(QFont("SF Pro Display", 10))
+        btn_save.setFont(self._FONT_BODY)
         btn_save.clicked.connect(self._save_script)
         tab3_btn_layout.addWidget(btn_save)
         tab3_layout.addLayout(tab3_btn_layout)
@@ -342,12 +849,12 @@ class Module6PlaxisScripts(QWidget):
         # ── Left: folder picker ──
         btn_folder = QPushButton("Export Folder...")
         btn_folder.setToolTip("Select output folder for exported PNG files")
-        btn_folder.setFont(QFont("SF Pro Display", 10))
+        btn_folder.setFont(self._FONT_BODY)
         btn_folder.clicked.connect(self._pick_output_dir)
         out_btn_layout.addWidget(btn_folder)
 
         self._output_dir_label = QLabel(self._output_dir)
-        self._output_dir_label.setFont(QFont("SF Pro Display", 9))
+        self._output_dir_label.setFont(self._FONT_SMALL)
         self._output_dir_label.setStyleSheet("color: #6E6E73;")
         self._output_dir_label.setWordWrap(False)
         out_btn_layout.addWidget(self._output_dir_label, 1)
@@ -356,14 +863,14 @@ class Module6PlaxisScripts(QWidget):
 
         btn_gen_out = QPushButton("Generate Output Script")
         btn_gen_out.setToolTip("Generate Python script for PLAXIS Output")
-        btn_gen_out.setFont(QFont("SF Pro Display", 10))
+        btn_gen_out.setFont(self._FONT_BODY)
         btn_gen_out.setMaximumWidth(220)
         btn_gen_out.clicked.connect(self._run_output_code)
         out_btn_layout.addWidget(btn_gen_out)
 
         btn_save_out = QPushButton("Save Output .py")
         btn_save_out.setToolTip("Save output script to file")
-        btn_save_out.setFont(QFont("SF Pro Display", 10))
+        btn_save_out.setFont(self._FONT_BODY)
         btn_save_out.setMaximumWidth(150)
         btn_save_out.clicked.connect(self._save_output_script)
         out_btn_layout.addWidget(btn_save_out)
@@ -390,7 +897,7 @@ class Module6PlaxisScripts(QWidget):
 
         # Title
         title = QLabel("Module 6")
-        title.setFont(QFont("SF Pro Display", 18, QFont.Weight.Bold))
+        title.setFont(self._FONT_TITLE)
         layout.addWidget(title)
 
         # Separator
@@ -400,7 +907,7 @@ class Module6PlaxisScripts(QWidget):
 
         # Subtitle
         subtitle = QLabel("Python Scripts for PLAXIS")
-        subtitle.setFont(QFont("SF Pro Display", 12))
+        subtitle.setFont(self._FONT_SUBTITLE)
         subtitle.setStyleSheet("color: #6E6E73;")
         layout.addWidget(subtitle)
 
@@ -411,19 +918,18 @@ class Module6PlaxisScripts(QWidget):
     def _create_borehole_water_contour_section(self):
         """Create combined section with Borehole, Water Level, and Soil Contour in single horizontal line"""
         group = QGroupBox("Borehole, Water Level & Soil Contour")
-        group.setFont(QFont("SF Pro Display", 11, QFont.Weight.Bold))
+        group.setFont(self._FONT_GROUP)
         layout = QHBoxLayout()
         layout.setSpacing(15)
 
-        # Style for input fields
-        input_style = "padding: 4px; border: 1px solid #ccc; border-radius: 3px;"
+        # Style for input fields: one sheet on the group instead of one per field
+        group.setStyleSheet("QLineEdit { padding: 4px; border: 1px solid #ccc; border-radius: 3px; }")
         input_width = 60
 
         # ---- Borehole Position ----
         layout.addWidget(QLabel("Borehole (x):"))
         self.position_input = QLineEdit("0")
         self.position_input.setFixedWidth(input_width)
-        self.position_input.setStyleSheet(input_style)
         layout.addWidget(self.position_input)
 
         # Separator
@@ -435,14 +941,12 @@ class Module6PlaxisScripts(QWidget):
         layout.addWidget(QLabel("LWL:"))
         self.lwl_input = QLineEdit("")
         self.lwl_input.setFixedWidth(input_width)
-        self.lwl_input.setStyleSheet(input_style)
         self.lwl_input.setPlaceholderText("Y")
         layout.addWidget(self.lwl_input)
 
         layout.addWidget(QLabel("HWL:"))
         self.hwl_input = QLineEdit("")
         self.hwl_input.setFixedWidth(input_width)
-        self.hwl_input.setStyleSheet(input_style)
         self.hwl_input.setPlaceholderText("Y")
         layout.addWidget(self.hwl_input)
 
@@ -455,25 +959,21 @@ class Module6PlaxisScripts(QWidget):
         layout.addWidget(QLabel("Soil Contour  Xmin:"))
         self.xmin_input = QLineEdit("0")
         self.xmin_input.setFixedWidth(input_width)
-        self.xmin_input.setStyleSheet(input_style)
         layout.addWidget(self.xmin_input)
 
         layout.addWidget(QLabel("Xmax:"))
         self.xmax_input = QLineEdit("100")
         self.xmax_input.setFixedWidth(input_width)
-        self.xmax_input.setStyleSheet(input_style)
         layout.addWidget(self.xmax_input)
 
         layout.addWidget(QLabel("Ymin:"))
         self.ymin_input = QLineEdit("70")
         self.ymin_input.setFixedWidth(input_width)
-        self.ymin_input.setStyleSheet(input_style)
         layout.addWidget(self.ymin_input)
 
         layout.addWidget(QLabel("Ymax:"))
         self.ymax_input = QLineEdit("100")
         self.ymax_input.setFixedWidth(input_width)
-        self.ymax_input.setStyleSheet(input_style)
         layout.addWidget(self.ymax_input)
 
         layout.addStretch()
@@ -481,7 +981,7 @@ class Module6PlaxisScripts(QWidget):
         # ---- Export CSV ----
         btn_csv = QPushButton("Export CSV")
         btn_csv.setToolTip("Export layer table to CSV file")
-        btn_csv.setFont(QFont("SF Pro Display", 10))
+        btn_csv.setFont(self._FONT_BODY)
         btn_csv.clicked.connect(self._export_layer_csv)
         layout.addWidget(btn_csv)
 
@@ -498,24 +998,22 @@ class Module6PlaxisScripts(QWidget):
             return
         try:
             import csv
-            table = self.layer_table
-            ncols = table.columnCount()
-            nrows = table.rowCount()
+            model = self.layer_model
+            ncols = model.columnCount()
+            nrows = model.rowCount()
 
             # Collect headers from horizontal header
             headers = []
             for col in range(ncols):
-                item = table.horizontalHeaderItem(col)
-                headers.append(item.text() if item else f"Col{col}")
+                header = model.headerData(col, Qt.Orientation.Horizontal)
+                headers.append(header if header else f"Col{col}")
 
-            with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            # Model rows are already lists of cell text: hand them to csv in one call,
+            # through a 1 MiB buffer so the file is written in a few large chunks
+            with open(path, 'w', newline='', encoding='utf-8-sig', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 writer.writerow(headers)
-                for row in range(nrows):
-                    row_data = []
-                    for col in range(ncols):
-                        row_data.append(self._get_layer_cell_value(row, col))
-                    writer.writerow(row_data)
+                writer.writerows(model.rows)
 
             QMessageBox.information(self, "Export CSV",
                                     f"Exported {nrows} rows to:\n{path}")
@@ -525,13 +1023,12 @@ class Module6PlaxisScripts(QWidget):
     def _create_layer_table_section(self):
         """Create layer properties table matching PLAXIS requirements"""
         group = QGroupBox("Layer Properties")
-        group.setFont(QFont("SF Pro Display", 11, QFont.Weight.Bold))
+        group.setFont(self._FONT_GROUP)
         layout = QVBoxLayout()
 
         # Layer Table - 19 columns matching the image
         # Layer | Identification | Soil Model | Drainage Type | Property | Strength | Groundwater | Interfaces | Initial
-        self.layer_table = QTableWidget()
-        self.layer_table.setColumnCount(19)
+        # Model/view: cells are plain text in LayerTableModel; dropdown editors are made on demand
         headers = [
             'From', 'To', 'Name',                    # Layer info
             'Soil Model', 'Drainage Type',           # Model settings
@@ -540,24 +1037,28 @@ class Module6PlaxisScripts(QWidget):
             'Classification', 'Soil class',          # Groundwater
             'Defaults method', 'Rinter', 'K0', 'K0-manual'  # Interfaces & Initial
         ]
-        self.layer_table.setHorizontalHeaderLabels(headers)
-        self.layer_table.setRowCount(5)
-        self.layer_table.setFont(QFont("SF Pro Display", 9))
+        self.layer_model = LayerTableModel(headers, self.layers_data, self)
+        self.layer_table = QTableView()
+        self.layer_table.setModel(self.layer_model)
+        self.layer_table.setItemDelegate(ComboCellDelegate(
+            lambda index: self._layer_cell_options(index.row(), index.column()),
+            self._style_combobox, self.layer_table))
+        self.layer_table.setFont(self._FONT_SMALL)
 
         # Set row height for better visibility
         self.layer_table.verticalHeader().setDefaultSectionSize(32)
 
         # Style for table - no white background covering text
         self.layer_table.setStyleSheet("""
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: transparent;
                 color: black;
             }
-            QTableWidget::item:focus {
+            QTableView::item:focus {
                 background-color: transparent;
                 border: 1px solid #007AFF;
             }
-            QTableWidget QLineEdit {
+            QTableView QLineEdit {
                 border: none;
                 padding: 0px 2px;
                 background-color: white;
@@ -590,10 +1091,13 @@ class Module6PlaxisScripts(QWidget):
         for col, width in enumerate(col_widths):
             self.layer_table.setColumnWidth(col, width)
 
-        # Connect cell change signal for γsat → γunsat auto-calculation
-        self.layer_table.cellChanged.connect(self._on_layer_cell_changed)
+        # One click on a dropdown cell opens its editor
+        self.layer_table.clicked.connect(self._on_layer_cell_clicked)
 
-        # Initialize table with dropdowns
+        # Cell edits drive the dependent columns (γsat → γunsat, Classification → Soil class, K0 → K0-manual)
+        self.layer_model.dataChanged.connect(self._on_layer_data_changed)
+
+        # Initialize table with default rows
         self._init_layer_table()
 
         layout.addWidget(self.layer_table, 1)
@@ -603,12 +1107,12 @@ class Module6PlaxisScripts(QWidget):
         btn_layout.addStretch()
 
         add_row_btn = QPushButton("+ ROW")
-        add_row_btn.setFont(QFont("SF Pro Display", 10))
+        add_row_btn.setFont(self._FONT_BODY)
         add_row_btn.clicked.connect(self._add_layer_row)
         btn_layout.addWidget(add_row_btn)
 
         del_row_btn = QPushButton("- ROW")
-        del_row_btn.setFont(QFont("SF Pro Display", 10))
+        del_row_btn.setFont(self._FONT_BODY)
         del_row_btn.clicked.connect(self._delete_layer_row)
         btn_layout.addWidget(del_row_btn)
 
@@ -618,230 +1122,181 @@ class Module6PlaxisScripts(QWidget):
         return group
 
     def _init_layer_table(self):
-        """Initialize layer table with dropdowns and default values"""
+        """Initialize layer table with default values"""
         # Default depth ranges
         depth_ranges = [(100, 95), (95, 85), (85, 75), (75, 65), (65, 55)]
+        self.layer_model.set_rows([self._default_layer_row(depth_range) for depth_range in depth_ranges])
 
-        for row in range(self.layer_table.rowCount()):
-            self._setup_layer_row(row, depth_ranges[row] if row < len(depth_ranges) else (0, 0))
-
-    def _setup_layer_row(self, row, depth_range=(0, 0)):
-        """Setup a single row with appropriate widgets"""
+    def _default_layer_row(self, depth_range=(0, 0)):
+        """Cell text for a new layer row (dropdown columns at their default choice)"""
         from_val, to_val = depth_range
+        return [
+            str(from_val) if from_val else '',  # 0: From
+            str(to_val) if to_val else '',      # 1: To
+            '',                                 # 2: Name
+            'Mohr-Coulomb',                     # 3: Soil Model (dropdown)
+            'Drained',                          # 4: Drainage Type (dropdown)
+            '',                                 # 5: γunsat
+            '',                                 # 6: γsat
+            'Default',                          # 7: Void Ratio
+            '',                                 # 8: Eref
+            '',                                 # 9: ν(nu)
+            '',                                 # 10: Su
+            '',                                 # 11: cref
+            '',                                 # 12: phi
+            'USDA',                             # 13: Classification (dropdown)
+            'Sand',                             # 14: Soil class (dropdown - depends on Classification)
+            'From data set',                    # 15: Defaults method (dropdown)
+            '0.8',                              # 16: Rinter
+            'Automatic',                        # 17: K0 (dropdown: Automatic/Manual)
+            '-',                                # 18: K0-manual ("-" when Auto, empty when Manual)
+        ]
 
-        # Column 0: From
-        item = QTableWidgetItem(str(from_val) if from_val else '')
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 0, item)
-
-        # Column 1: To
-        item = QTableWidgetItem(str(to_val) if to_val else '')
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 1, item)
-
-        # Column 2: Name (editable text)
-        item = QTableWidgetItem('')
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 2, item)
-
-        # Column 3: Soil Model (dropdown)
-        combo = QComboBox()
-        combo.addItems(list(self.SOIL_MODELS.keys()))
-        combo.setCurrentText('Mohr-Coulomb')
-        self._style_combobox(combo)
-        self.layer_table.setCellWidget(row, 3, combo)
-
-        # Column 4: Drainage Type (dropdown)
-        combo = QComboBox()
-        combo.addItems(list(self.DRAINAGE_TYPES.keys()))
-        combo.setCurrentText('Drained')
-        self._style_combobox(combo)
-        self.layer_table.setCellWidget(row, 4, combo)
-
-        # Column 5: γunsat (editable)
-        item = QTableWidgetItem('')
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 5, item)
-
-        # Column 6: γsat (editable)
-        item = QTableWidgetItem('')
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 6, item)
-
-        # Column 7: Void Ratio (editable, default)
-        item = QTableWidgetItem('Default')
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 7, item)
-
-        # Column 8: Eref (editable)
-        item = QTableWidgetItem('')
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 8, item)
-
-        # Column 9: ν(nu) (editable)
-        item = QTableWidgetItem('')
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 9, item)
-
-        # Column 10: Su (editable)
-        item = QTableWidgetItem('')
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 10, item)
-
-        # Column 11: cref (editable)
-        item = QTableWidgetItem('')
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 11, item)
-
-        # Column 12: phi (editable)
-        item = QTableWidgetItem('')
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 12, item)
-
-        # Column 13: Classification (dropdown)
-        class_combo = QComboBox()
-        class_combo.addItems(list(self.CLASSIFICATION_TYPES.keys()))
-        class_combo.setCurrentText('USDA')
-        self._style_combobox(class_combo)
-        self.layer_table.setCellWidget(row, 13, class_combo)
-
-        # Column 14: Soil class (dropdown - changes based on Classification)
-        soil_class_combo = QComboBox()
-        soil_class_combo.addItems(list(self.USDA_SOIL_CLASSES.keys()))  # Default to USDA
-        soil_class_combo.setCurrentText('Sand')
-        self._style_combobox(soil_class_combo)
-        self.layer_table.setCellWidget(row, 14, soil_class_combo)
-
-        # Connect Classification change to update Soil class options
-        class_combo.currentTextChanged.connect(
-            lambda text, r=row: self._on_classification_changed(r, text)
-        )
+    def _layer_cell_options(self, row, col):
+        """Dropdown choices for a layer table cell, or None for a text cell"""
+        return self._layer_column_options(col, self.layer_model.value(row, 13) if col == 14 else None)
+
+    def _layer_column_options(self, col, classification=None):
+        """Dropdown choices for a layer column (Soil class needs the row's Classification)"""
+        if col == 3:
+            return self.SOIL_MODELS_KEYS
+        if col == 4:
+            return self.DRAINAGE_TYPES_KEYS
+        if col == 13:
+            return self.CLASSIFICATION_TYPES_KEYS
+        if col == 14:
+            # Soil class options follow the row's Classification (Hypres/Staring use Standard)
+            if classification == 'USDA':
+                return self.USDA_SOIL_CLASSES_KEYS
+            return self.STANDARD_SOIL_CLASSES_KEYS
+        if col == 15:
+            return self.DEFAULTS_METHODS_KEYS
+        if col == 17:
+            return self.K0_DETERMINATION_KEYS
+        return None
 
-        # Column 15: Defaults method (dropdown)
-        combo = QComboBox()
-        combo.addItems(list(self.DEFAULTS_METHODS.keys()))
-        combo.setCurrentText('From data set')
-        self._style_combobox(combo)
-        self.layer_table.setCellWidget(row, 15, combo)
-
-        # Column 16: Rinter (editable)
-        item = QTableWidgetItem('0.8')
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 16, item)
-
-        # Column 17: K0 (dropdown: Automatic/Manual)
-        k0_combo = QComboBox()
-        k0_combo.addItems(list(self.K0_DETERMINATION.keys()))
-        k0_combo.setCurrentText('Automatic')
-        self._style_combobox(k0_combo)
-        self.layer_table.setCellWidget(row, 17, k0_combo)
-
-        # Column 18: K0-manual (editable, shows "-" when Auto, empty when Manual)
-        k0_manual_item = QTableWidgetItem('-')
-        k0_manual_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layer_table.setItem(row, 18, k0_manual_item)
-
-        # Connect K0 dropdown change to update K0-manual
-        k0_combo.currentTextChanged.connect(
-            lambda text, r=row: self._on_k0_changed(r, text)
-        )
+    def _on_layer_cell_clicked(self, index):
+        """Open the dropdown editor of a combo cell on a single click"""
+        if self._layer_cell_options(index.row(), index.column()) is not None:
+            self.layer_table.edit(index)
+
+    def _on_layer_data_changed(self, top_left, bottom_right, roles=()):
+        """Apply the dependent-column rules to every changed cell"""
+        model = self.layer_model
+        for col in range(top_left.column(), bottom_right.column() + 1):
+            rule = self._layer_rules.get(col)
+            if rule is None:
+                continue
+            for row in range(top_left.row(), bottom_right.row() + 1):
+                values = list(model.rows[row])
+                # setData emits per cell, so previous_value belongs to this cell
+                rule(values, model.previous_value)
+                # Write back only what the rule changed (dependent columns have no rules)
+                for dep_col, value in enumerate(values):
+                    if value != model.rows[row][dep_col]:
+                        model.set_value(row, dep_col, value)
+
+    def _apply_layer_rule(self, values, col, previous):
+        """
+        Update the columns of one layer row (list of cell text) that depend on column col,
+        whose text was previous before the change
+        """
+        rule = self._layer_rules.get(col)
+        if rule is not None:
+            rule(values, previous)
 
-    def _on_k0_changed(self, row, k0_text):
+    def _update_k0_manual(self, values, previous):
         """Update K0-manual based on K0 selection"""
-        k0_manual_item = self.layer_table.item(row, 18)
-        if not k0_manual_item:
-            return
-
-        if k0_text == 'Automatic':
+        if values[17] == 'Automatic':
             # Show "-" and make read-only appearance
-            k0_manual_item.setText('-')
+            values[18] = '-'
         else:  # Manual
             # Show empty for user input
-            current_text = k0_manual_item.text()
-            if current_text == '-':
-                k0_manual_item.setText('')
-
-    def _on_layer_cell_changed(self, row, col):
-        """Handle cell changes - auto-calculate γunsat from γsat"""
-        # Column 6 is γsat, Column 5 is γunsat
-        if col == 6:  # γsat changed
-            gamma_sat_item = self.layer_table.item(row, 6)
-            gamma_unsat_item = self.layer_table.item(row, 5)
-
-            if gamma_sat_item and gamma_unsat_item:
-                gamma_sat_text = gamma_sat_item.text().strip()
-                gamma_unsat_text = gamma_unsat_item.text().strip()
-
-                # Only auto-calculate if γunsat is empty or was auto-calculated before
-                if gamma_sat_text:
-                    try:
-                        gamma_sat = float(gamma_sat_text)
-                        gamma_unsat = gamma_sat - 1
-
-                        # Only update if γunsat is empty or matches previous auto-calc
-                        if not gamma_unsat_text or gamma_unsat_text == str(gamma_sat):
-                            # Block signals to prevent recursion
-                            self.layer_table.blockSignals(True)
-                            gamma_unsat_item.setText(str(gamma_unsat))
-                            self.layer_table.blockSignals(False)
-                    except ValueError:
-                        pass  # Invalid number, skip
+            if values[18] == '-':
+                values[18] = ''
 
-    def _on_classification_changed(self, row, classification_text):
-        """Update Soil class dropdown based on Classification selection"""
-        soil_class_combo = self.layer_table.cellWidget(row, 14)
-        if not soil_class_combo:
-            return
+    def _update_gamma_unsat(self, values, previous):
+        """Auto-calculate γunsat (column 5) from γsat (column 6; previous = its old text)"""
+        gamma_sat_text = values[6].strip()
+        gamma_unsat_text = values[5].strip()
+
+        # Only auto-calculate if γunsat is empty or was auto-calculated before
+        if gamma_sat_text:
+            try:
+                gamma_unsat = float(gamma_sat_text) - 1
+            except ValueError:
+                return  # Invalid number, skip
 
-        # Save current selection if possible
-        current_text = soil_class_combo.currentText()
+            # Only update if γunsat is empty or still holds the previous γsat - 1
+            if not gamma_unsat_text or self._is_auto_gamma_unsat(gamma_unsat_text, previous):
+                values[5] = f"{gamma_unsat:g}"
 
-        # Clear and repopulate based on classification
-        soil_class_combo.clear()
+    @staticmethod
+    def _is_auto_gamma_unsat(gamma_unsat_text, gamma_sat_text):
+        """True if γunsat equals γsat - 1 (compared as :g text, so "18.0" matches "18")"""
+        try:
+            return f"{float(gamma_unsat_text):g}" == f"{float(gamma_sat_text) - 1:g}"
+        except ValueError:
+            return False
+
+    def _update_soil_class(self, values, previous):
+        """Update Soil class based on Classification selection"""
+        classification_text = values[13]
+        current_text = values[14]
 
         if classification_text == 'USDA':
-            soil_class_combo.addItems(list(self.USDA_SOIL_CLASSES.keys()))
-            # Try to restore selection or default to Sand
-            if current_text in self.USDA_SOIL_CLASSES:
-                soil_class_combo.setCurrentText(current_text)
-            else:
-                soil_class_combo.setCurrentText('Sand')
+            # Try to keep the selection or default to Sand
+            values[14] = current_text if current_text in self.USDA_SOIL_CLASSES else 'Sand'
         elif classification_text == 'Standard':
-            soil_class_combo.addItems(list(self.STANDARD_SOIL_CLASSES.keys()))
-            # Try to restore selection or default to Medium
-            if current_text in self.STANDARD_SOIL_CLASSES:
-                soil_class_combo.setCurrentText(current_text)
-            else:
-                soil_class_combo.setCurrentText('Medium')
-        elif classification_text == 'Hypres':
-            # Hypres uses same classes as Standard
-            soil_class_combo.addItems(list(self.STANDARD_SOIL_CLASSES.keys()))
-            soil_class_combo.setCurrentText('Medium')
-        elif classification_text == 'Staring':
-            # Staring uses same classes as Standard
-            soil_class_combo.addItems(list(self.STANDARD_SOIL_CLASSES.keys()))
-            soil_class_combo.setCurrentText('Medium')
+            # Try to keep the selection or default to Medium
+            values[14] = current_text if current_text in self.STANDARD_SOIL_CLASSES else 'Medium'
+        elif classification_text in ('Hypres', 'Staring'):
+            # Hypres/Staring use the same classes as Standard
+            values[14] = 'Medium'
+
+    def _layer_row_from_values(self, row_data):
+        """
+        Build a layer row from saved cell text, applied over the defaults in column
+        order with the same validation and dependent-column rules as cell edits
+        """
+        values = self._default_layer_row()
+        for col, value in enumerate(row_data[:len(values)]):
+            value = '' if value is None else str(value)
+            options = self._layer_column_options(col, values[13])
+            # Dropdown cells ignore values not in their choices; unchanged cells trigger no rule
+            if (options is not None and value not in options) or values[col] == value:
+                continue
+            previous, values[col] = values[col], value
+            self._apply_layer_rule(values, col, previous)
+        return values
 
     def _create_staged_construction_section(self):
-        """Create staged construction with QTreeWidget for phase hierarchy"""
+        """Create staged construction with a tree view over the phase hierarchy"""
         group = QGroupBox("Staged Construction")
-        group.setFont(QFont("SF Pro Display", 11, QFont.Weight.Bold))
+        group.setFont(self._FONT_GROUP)
         layout = QVBoxLayout()
 
         # Hint label
         hint = QLabel("Double-click phase to change parent  |  F2 to rename")
-        hint.setFont(QFont("SF Pro Display", 9))
+        hint.setFont(self._FONT_SMALL)
         hint.setStyleSheet("color: #8E8E93;")
         layout.addWidget(hint)
 
-        # QTreeWidget with blue branch connector lines
-        self.staged_tree = BranchTreeWidget()
-        self.staged_tree.setColumnCount(4)
-        self.staged_tree.setHeaderLabels([
+        # Tree view with blue branch connector lines; dropdown editors are made on demand
+        self.staged_model = StagedModel([
             'Phase', 'Calculation Type',
             'Pore pressure calculation', 'Reset displacements to zero'
-        ])
-        self.staged_tree.setFont(QFont("SF Pro Display", 10))
+        ], self)
+        self.staged_tree = BranchTreeView()
+        self.staged_tree.setModel(self.staged_model)
+        self.staged_tree.setItemDelegate(ComboCellDelegate(
+            self._staged_cell_options, self._style_combobox, self.staged_tree))
+        self.staged_tree.setFont(self._FONT_BODY)
+        # Every phase row has the same height: lets the view skip per-row size hints
+        self.staged_tree.setUniformRowHeights(True)
+        # Expand/collapse in one repaint; double-click belongs to the parent dialog / editors
+        self.staged_tree.setAnimated(False)
+        self.staged_tree.setExpandsOnDoubleClick(False)
 
         # Column widths
         self.staged_tree.setColumnWidth(0, 200)
@@ -856,16 +1311,16 @@ class Module6PlaxisScripts(QWidget):
 
         # Styling
         self.staged_tree.setStyleSheet("""
-            QTreeWidget {
+            QTreeView {
                 background-color: white;
                 border: 1px solid #D1D1D6;
                 border-radius: 4px;
             }
-            QTreeWidget::item {
+            QTreeView::item {
                 padding: 4px;
                 min-height: 28px;
             }
-            QTreeWidget::item:selected {
+            QTreeView::item:selected {
                 background-color: #E3F2FD;
                 color: black;
             }
@@ -884,7 +1339,14 @@ class Module6PlaxisScripts(QWidget):
         """)
 
         # Intercept double-click via viewport event filter (prevents Qt edit conflicts)
-        self.staged_tree.viewport().installEventFilter(self)
+        self._staged_viewport = self.staged_tree.viewport()
+        self._staged_viewport.installEventFilter(self)
+
+        # One click on a dropdown cell opens its editor
+        self.staged_tree.clicked.connect(self._on_staged_cell_clicked)
+
+        # Calculation Type drives the Pore pressure cell
+        self.staged_model.dataChanged.connect(self._on_staged_data_changed)
 
         # Initialize with sample data
         self._init_staged_tree()
@@ -896,12 +1358,12 @@ class Module6PlaxisScripts(QWidget):
         btn_layout.addStretch()
 
         add_row_btn = QPushButton("+ ROW")
-        add_row_btn.setFont(QFont("SF Pro Display", 10))
+        add_row_btn.setFont(self._FONT_BODY)
         add_row_btn.clicked.connect(self._add_staged_phase)
         btn_layout.addWidget(add_row_btn)
 
         del_row_btn = QPushButton("- ROW")
-        del_row_btn.setFont(QFont("SF Pro Display", 10))
+        del_row_btn.setFont(self._FONT_BODY)
         del_row_btn.clicked.connect(self._delete_staged_phase)
         btn_layout.addWidget(del_row_btn)
 
@@ -926,83 +1388,60 @@ class Module6PlaxisScripts(QWidget):
         ]
         self._build_tree_from_flat_data(sample_data)
 
-    def _setup_tree_item(self, parent, phase_name,
-                         calc_type='Plastic', pore_pressure='Phreatic',
-                         reset_disp='-'):
-        """Create a QTreeWidgetItem with QComboBox widgets for columns 1-3.
-
-        Args:
-            parent: QTreeWidget (for top-level) or QTreeWidgetItem (for child)
-        Returns:
-            The newly created QTreeWidgetItem
-        """
-        item = QTreeWidgetItem(parent)
-        item.setText(0, phase_name)
-        item.setFont(0, QFont("SF Pro Display", 10))
-
-        # Tooltip: show parent connection
-        if isinstance(parent, QTreeWidgetItem):
-            item.setToolTip(0, f"Parent: {parent.text(0)}  (double-click to change)")
-        else:
-            item.setToolTip(0, "Root phase")
-
-        # Column 0: editable via F2
-        item.setFlags(
-            item.flags()
-            | Qt.ItemFlag.ItemIsEditable
-            | Qt.ItemFlag.ItemIsSelectable
-            | Qt.ItemFlag.ItemIsEnabled
-        )
-
+    def _new_phase(self, phase_name, calc_type='Plastic', pore_pressure='Phreatic', reset_disp='-'):
+        """Create a PhaseNode with its dropdown values checked against the PLAXIS options"""
         # Column 1: Calculation Type
-        calc_combo = QComboBox()
         if phase_name.lower() == 'initial phase':
-            calc_combo.addItems(list(self.INITIAL_PHASE_CALC_TYPE.keys()))
-            calc_combo.setCurrentText(
-                calc_type if calc_type in self.INITIAL_PHASE_CALC_TYPE else 'K0 procedure')
+            calc_options = self.INITIAL_PHASE_CALC_TYPE_KEYS
+            calc_type = calc_type if calc_type in self.INITIAL_PHASE_CALC_TYPE else 'K0 procedure'
         else:
-            calc_combo.addItems(list(self.PHASE_CALC_TYPE.keys()))
-            calc_combo.setCurrentText(
-                calc_type if calc_type in self.PHASE_CALC_TYPE else 'Plastic')
-        self._style_combobox(calc_combo)
-        self.staged_tree.setItemWidget(item, 1, calc_combo)
-
-        # Column 2: Pore pressure
-        pore_combo = QComboBox()
-        pore_combo.addItem('-')
-        pore_combo.addItems(list(self.PORE_PRESSURE_CALC_TYPE.keys()))
+            calc_options = self.PHASE_CALC_TYPE_KEYS
+            calc_type = calc_type if calc_type in self.PHASE_CALC_TYPE else 'Plastic'
+
+        # Column 2: Pore pressure ('-' and disabled for Safety)
         if calc_type == 'Safety':
-            pore_combo.setCurrentText('-')
-            pore_combo.setEnabled(False)
-        else:
-            pore_combo.setCurrentText(
-                pore_pressure if pore_pressure in self.PORE_PRESSURE_CALC_TYPE else 'Phreatic')
-        self._style_combobox(pore_combo)
-        self.staged_tree.setItemWidget(item, 2, pore_combo)
-
-        # Connect calc_type → pore_pressure update
-        calc_combo.currentTextChanged.connect(
-            lambda text, itm=item: self._on_calc_type_changed_tree(itm, text)
-        )
+            pore_pressure = '-'
+        elif pore_pressure not in self.PORE_PRESSURE_CALC_TYPE:
+            pore_pressure = 'Phreatic'
 
         # Column 3: Reset displacements
-        reset_combo = QComboBox()
-        reset_combo.addItems(list(self.RESET_DISPLACEMENTS.keys()))
-        reset_combo.setCurrentText(
-            reset_disp if reset_disp in self.RESET_DISPLACEMENTS else '-')
-        self._style_combobox(reset_combo)
-        self.staged_tree.setItemWidget(item, 3, reset_combo)
+        if reset_disp not in self.RESET_DISPLACEMENTS:
+            reset_disp = '-'
+
+        return PhaseNode(phase_name, calc_type, pore_pressure, reset_disp, calc_options)
+
+    def _staged_cell_options(self, index):
+        """Dropdown choices for a staged tree cell, or None for the phase name"""
+        col = index.column()
+        if col == 1:
+            return self.staged_model.node(index).calc_options
+        if col == 2:
+            return self.PORE_PRESSURE_OPTIONS
+        if col == 3:
+            return self.RESET_DISPLACEMENTS_KEYS
+        return None
 
-        return item
+    def _on_staged_cell_clicked(self, index):
+        """Open the dropdown editor of a combo cell on a single click"""
+        if (self._staged_cell_options(index) is not None
+                and index.flags() & Qt.ItemFlag.ItemIsEditable):
+            self.staged_tree.edit(index)
+
+    def _on_staged_data_changed(self, top_left, bottom_right, roles=()):
+        """Apply the Calculation Type → Pore pressure rule to changed phases"""
+        if top_left.column() <= 1 <= bottom_right.column():
+            for row in range(top_left.row(), bottom_right.row() + 1):
+                index = top_left.sibling(row, 1)
+                self._on_calc_type_changed_tree(index, index.data())
 
     def _build_tree_from_flat_data(self, flat_data):
         """Build tree hierarchy from flat list [[phase, link, calc, pore, reset], ...]"""
-        self.staged_tree.clear()
         if not flat_data:
+            self.staged_model.set_roots([])
             return
 
         # Build parent→children mapping
-        children_map = {}  # parent_name → [child_row_data, ...]
+        children_map = defaultdict(list)  # parent_name → [child_row_data, ...]
         root_data = None
 
         for row in flat_data:
@@ -1013,136 +1452,122 @@ class Module6PlaxisScripts(QWidget):
             if not link or link.strip() == '':
                 root_data = row
             else:
-                children_map.setdefault(link, []).append(row)
+                children_map[link].append(row)
 
         if not root_data:
             root_data = flat_data[0]
 
-        def add_children(parent_item, parent_name):
+        def add_children(parent_node, parent_name):
             for child_row in children_map.get(parent_name, []):
                 child_name = child_row[0]
                 calc = child_row[2] if len(child_row) > 2 else 'Plastic'
                 pore = child_row[3] if len(child_row) > 3 else 'Phreatic'
                 reset = child_row[4] if len(child_row) > 4 else '-'
-                child_item = self._setup_tree_item(
-                    parent_item, child_name, calc, pore, reset)
-                add_children(child_item, child_name)
+                child_node = parent_node.add_child(
+                    self._new_phase(child_name, calc, pore, reset))
+                add_children(child_node, child_name)
 
         # Create root
         root_name = root_data[0]
         root_calc = root_data[2] if len(root_data) > 2 else 'K0 procedure'
         root_pore = root_data[3] if len(root_data) > 3 else 'Phreatic'
         root_reset = root_data[4] if len(root_data) > 4 else '-'
-        root_item = self._setup_tree_item(
-            self.staged_tree, root_name, root_calc, root_pore, root_reset)
-        add_children(root_item, root_name)
+        root_node = self._new_phase(root_name, root_calc, root_pore, root_reset)
+        add_children(root_node, root_name)
 
+        # Install the whole hierarchy in one model reset
+        self.staged_model.set_roots([root_node])
         self.staged_tree.expandAll()
 
     def _collect_phases_from_tree(self):
         """Depth-first traversal → list of dicts for script generation & save."""
         result = []
-
-        def walk(item, parent_name):
-            phase_name = item.text(0)
-            calc_combo = self.staged_tree.itemWidget(item, 1)
-            pore_combo = self.staged_tree.itemWidget(item, 2)
-            reset_combo = self.staged_tree.itemWidget(item, 3)
-
+        for node in self.staged_model.root.walk():
+            if node is self.staged_model.root:
+                continue
             result.append({
-                'name': phase_name,
-                'link': parent_name,
-                'calc_type': calc_combo.currentText() if calc_combo else '',
-                'pore_pressure': pore_combo.currentText() if pore_combo else '',
-                'reset_disp': reset_combo.currentText() if reset_combo else '',
+                'name': node.name,
+                'link': '' if node.parent is self.staged_model.root else node.parent.name,
+                'calc_type': node.calc_type,
+                'pore_pressure': node.pore_pressure,
+                'reset_disp': node.reset_disp,
             })
-            for i in range(item.childCount()):
-                walk(item.child(i), phase_name)
-
-        for i in range(self.staged_tree.topLevelItemCount()):
-            walk(self.staged_tree.topLevelItem(i), '')
-
         return result
 
+    # Stylesheet of the parent-selection dialog tree (built on every double-click)
+    _PARENT_DIALOG_TREE_STYLE = """
+        QTreeWidget {
+            background-color: white;
+            border: 1px solid #D1D1D6;
+            border-radius: 4px;
+        }
+        QTreeWidget::item {
+            padding: 4px 8px;
+            min-height: 26px;
+        }
+        QTreeWidget::item:selected {
+            background-color: #007AFF;
+            color: white;
+        }
+        QTreeWidget::item:hover:!selected {
+            background-color: #E3F2FD;
+        }
+        QTreeWidget::branch { background: white; }
+    """
+
     # ── Interaction methods ────────────────────────────────────────
 
-    def _show_parent_selection_dialog(self, item):
+    def _show_parent_selection_dialog(self, node):
         """Popup dialog with a tree view to select a new parent phase.
 
         Shows the full phase hierarchy.  Self + descendants are greyed out
         and cannot be selected.  OK is disabled when nothing valid is
         highlighted — so Cancel / OK are always safe (no data loss).
         """
+        root = self.staged_model.root
         dialog = QDialog(self)
-        dialog.setWindowTitle(f"Select Parent for '{item.text(0)}'")
+        dialog.setWindowTitle(f"Select Parent for '{node.name}'")
         dialog.setMinimumSize(400, 420)
         dlg_layout = QVBoxLayout(dialog)
 
         # Current parent info
-        current_parent = item.parent()
-        current_parent_name = current_parent.text(0) if current_parent else "(root)"
+        current_parent = node.parent if node.parent is not root else None
+        current_parent_name = current_parent.name if current_parent else "(root)"
         info_label = QLabel(
-            f"<b>{item.text(0)}</b>  →  current parent: "
+            f"<b>{node.name}</b>  →  current parent: "
             f"<span style='color:#007AFF'>{current_parent_name}</span>")
-        info_label.setFont(QFont("SF Pro Display", 10))
+        info_label.setFont(self._FONT_BODY)
         dlg_layout.addWidget(info_label)
 
         hint = QLabel("Click to select a new parent phase:")
-        hint.setFont(QFont("SF Pro Display", 9))
+        hint.setFont(self._FONT_SMALL)
         hint.setStyleSheet("color: #8E8E93;")
         dlg_layout.addWidget(hint)
 
         # ── Dialog tree (mirrors main tree hierarchy) ──
         dialog_tree = QTreeWidget()
+        dialog_tree.setAnimated(False)
         dialog_tree.setHeaderHidden(True)
-        dialog_tree.setFont(QFont("SF Pro Display", 10))
+        dialog_tree.setFont(self._FONT_BODY)
         dialog_tree.setSelectionMode(
             QAbstractItemView.SelectionMode.SingleSelection)
-        dialog_tree.setStyleSheet("""
-            QTreeWidget {
-                background-color: white;
-                border: 1px solid #D1D1D6;
-                border-radius: 4px;
-            }
-            QTreeWidget::item {
-                padding: 4px 8px;
-                min-height: 26px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #007AFF;
-                color: white;
-            }
-            QTreeWidget::item:hover:!selected {
-                background-color: #E3F2FD;
-            }
-            QTreeWidget::branch { background: white; }
-        """)
+        dialog_tree.setStyleSheet(self._PARENT_DIALOG_TREE_STYLE)
         dlg_layout.addWidget(dialog_tree)
 
         # Excluded: self + all descendants (cannot be parents)
-        excluded = {item.text(0)}
-        excluded.update(self._get_all_descendants(item))
+        excluded = {n.name for n in node.walk()}
 
-        # Map dialog-tree items → main-tree items
-        main_items = {}   # phase_name → main QTreeWidgetItem
+        # Map dialog-tree items → phase nodes
+        main_nodes = {}   # phase_name → PhaseNode
 
-        def collect_main(tree_item):
-            main_items[tree_item.text(0)] = tree_item
-            for i in range(tree_item.childCount()):
-                collect_main(tree_item.child(i))
-
-        for i in range(self.staged_tree.topLevelItemCount()):
-            collect_main(self.staged_tree.topLevelItem(i))
-
-        # Build mirror tree in dialog
-        dialog_item_map = {}  # phase_name → dialog QTreeWidgetItem
+        # Build mirror tree detached from the dialog, then insert it in one step
         pre_select_item = None
 
-        def build_mirror(source_item, dialog_parent):
+        def build_mirror(source_node):
             nonlocal pre_select_item
-            name = source_item.text(0)
-            d_item = QTreeWidgetItem(dialog_parent)
-            dialog_item_map[name] = d_item
+            name = source_node.name
+            main_nodes[name] = source_node
+            d_item = QTreeWidgetItem()
 
             if name in excluded:
                 # Grey out — enabled (so children stay expandable) but NOT selectable
@@ -1156,14 +1581,13 @@ class Module6PlaxisScripts(QWidget):
                     | Qt.ItemFlag.ItemIsSelectable)
 
             # Pre-select current parent
-            if current_parent and name == current_parent.text(0):
+            if source_node is current_parent:
                 pre_select_item = d_item
 
-            for i in range(source_item.childCount()):
-                build_mirror(source_item.child(i), d_item)
+            d_item.addChildren([build_mirror(child) for child in source_node.children])
+            return d_item
 
-        for i in range(self.staged_tree.topLevelItemCount()):
-            build_mirror(self.staged_tree.topLevelItem(i), dialog_tree)
+        dialog_tree.addTopLevelItems([build_mirror(top) for top in root.children])
 
         dialog_tree.expandAll()
 
@@ -1207,135 +1631,96 @@ class Module6PlaxisScripts(QWidget):
         if raw_name in excluded:
             return  # Extra guard
 
-        new_parent_item = main_items.get(raw_name)
-        if not new_parent_item:
+        new_parent = main_nodes.get(raw_name)
+        if not new_parent:
             return
 
         # Skip if same parent (no-op)
-        if new_parent_item == current_parent:
+        if new_parent is current_parent:
             return
 
-        self._reparent_item(item, new_parent_item)
+        self._reparent_item(node, new_parent)
 
-    def _reparent_item(self, item, new_parent_item):
-        """Move item (and its subtree) under a new parent.
+    def _reparent_item(self, node, new_parent):
+        """Move node (and its subtree) under a new parent.
 
-        Strategy: collect ALL data → change the one link → rebuild entire tree.
-        This avoids takeChild / setItemWidget issues that lose children.
+        The subtree is moved in one model step; it is placed among the new
+        siblings in depth-first order, as it would be after a rebuild.
         """
-        phase_name = item.text(0)
-        new_parent_name = new_parent_item.text(0)
-
-        # 1. Snapshot every phase in the tree
-        all_phases = self._collect_phases_from_tree()
-
-        # 2. Change only the moved phase's parent link
-        for entry in all_phases:
-            if entry['name'] == phase_name:
-                entry['link'] = new_parent_name
-                break
-
-        # 3. Convert to flat format and rebuild the whole tree
-        flat_data = [
-            [p['name'], p['link'], p['calc_type'],
-             p['pore_pressure'], p['reset_disp']]
-            for p in all_phases
-        ]
-        self._build_tree_from_flat_data(flat_data)
+        model = self.staged_model
+        order = {id(n): i for i, n in enumerate(model.root.walk())}
+        dest_row = sum(1 for child in new_parent.children
+                       if order[id(child)] < order[id(node)])
+        model.moveRows(model.index_of(node.parent), node.row(), 1,
+                       model.index_of(new_parent), dest_row)
+        self.staged_tree.expand(model.index_of(new_parent))
 
     # ── Helper methods ─────────────────────────────────────────────
 
-    def _on_calc_type_changed_tree(self, item, calc_type):
-        """Update Pore pressure combo based on Calculation Type for a tree item"""
-        pore_combo = self.staged_tree.itemWidget(item, 2)
-        if not pore_combo:
-            return
+    def _on_calc_type_changed_tree(self, index, calc_type):
+        """Update Pore pressure based on Calculation Type for a tree row"""
+        pore_index = index.siblingAtColumn(2)
         if calc_type == 'Safety':
-            pore_combo.setCurrentText('-')
-            pore_combo.setEnabled(False)
-        else:
-            pore_combo.setEnabled(True)
-            if pore_combo.currentText() == '-':
-                pore_combo.setCurrentText('Phreatic')
+            self.staged_model.setData(pore_index, '-')
+        elif pore_index.data() == '-':
+            self.staged_model.setData(pore_index, 'Phreatic')
 
-    def _get_all_descendants(self, item):
+    def _get_all_descendants(self, node):
         """Return set of all descendant phase names"""
-        descendants = set()
-        for i in range(item.childCount()):
-            child = item.child(i)
-            descendants.add(child.text(0))
-            descendants.update(self._get_all_descendants(child))
-        return descendants
-
-    def _count_descendants(self, item):
+        return {n.name for n in node.walk() if n is not node}
+
+    def _count_descendants(self, node):
         """Count total descendants recursively"""
-        count = item.childCount()
-        for i in range(item.childCount()):
-            count += self._count_descendants(item.child(i))
-        return count
+        return sum(1 for _ in node.walk()) - 1
 
     def _get_next_phase_number(self):
         """Find highest Phase_N number in tree and return N+1"""
         max_num = 0
-
-        def scan(item):
-            nonlocal max_num
-            match = re.match(r'^Phase_(\d+)$', item.text(0))
+        for node in self.staged_model.root.walk():
+            match = _PHASE_NUMBER_RE.match(node.name)
             if match:
                 max_num = max(max_num, int(match.group(1)))
-            for i in range(item.childCount()):
-                scan(item.child(i))
-
-        for i in range(self.staged_tree.topLevelItemCount()):
-            scan(self.staged_tree.topLevelItem(i))
         return max_num + 1
 
     def _find_item_by_name(self, name):
-        """Search tree for item with matching phase name"""
-        def search(item):
-            if item.text(0) == name:
-                return item
-            for i in range(item.childCount()):
-                found = search(item.child(i))
-                if found:
-                    return found
-            return None
-
-        for i in range(self.staged_tree.topLevelItemCount()):
-            found = search(self.staged_tree.topLevelItem(i))
-            if found:
-                return found
+        """Search tree for the phase node with matching name"""
+        for node in self.staged_model.root.walk():
+            if node is not self.staged_model.root and node.name == name:
+                return node
         return None
 
     # ── Add / Delete phase ─────────────────────────────────────────
 
     def _add_staged_phase(self):
         """Add a new phase as child of selected node (or root if none selected)"""
-        selected = self.staged_tree.currentItem()
+        model = self.staged_model
+        current = self.staged_tree.currentIndex()
 
-        if selected is None:
-            if self.staged_tree.topLevelItemCount() == 0:
+        if current.isValid():
+            selected = model.node(current)
+        else:
+            if not model.root.children:
                 # Empty tree — create Initial phase as root
-                self._setup_tree_item(
-                    self.staged_tree, 'Initial phase',
-                    'K0 procedure', 'Phreatic', '-')
+                model.add_phase(model.root, self._new_phase(
+                    'Initial phase', 'K0 procedure', 'Phreatic', '-'))
                 self.staged_tree.expandAll()
                 return
-            selected = self.staged_tree.topLevelItem(0)
+            selected = model.root.children[0]
 
         phase_name = f"Phase_{self._get_next_phase_number()}"
-        new_item = self._setup_tree_item(selected, phase_name, 'Plastic', 'Phreatic', '-')
-        selected.setExpanded(True)
-        self.staged_tree.setCurrentItem(new_item)
+        new_index = model.add_phase(selected, self._new_phase(phase_name, 'Plastic', 'Phreatic', '-'))
+        self.staged_tree.expand(model.index_of(selected))
+        self.staged_tree.setCurrentIndex(new_index)
 
     def _delete_staged_phase(self):
         """Delete selected phase and all its children"""
-        selected = self.staged_tree.currentItem()
-        if not selected:
+        current = self.staged_tree.currentIndex()
+        if not current.isValid():
             QMessageBox.information(self, "Info", "Please select a phase to delete.")
             return
+        selected = self.staged_model.node(current)
 
-        if selected.text(0).lower() == 'initial phase':
+        if selected.name.lower() == 'initial phase':
             QMessageBox.warning(
                 self, "Warning",
                 "Cannot delete the Initial phase.")
@@ -1345,18 +1730,13 @@ class Module6PlaxisScripts(QWidget):
         if child_count > 0:
             reply = QMessageBox.question(
                 self, "Confirm Delete",
-                f"'{selected.text(0)}' has {child_count} child phase(s).\n"
+                f"'{selected.name}' has {child_count} child phase(s).\n"
                 f"All children will also be deleted. Continue?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
             if reply != QMessageBox.StandardButton.Yes:
                 return
 
-        parent = selected.parent()
-        if parent:
-            parent.removeChild(selected)
-        else:
-            idx = self.staged_tree.indexOfTopLevelItem(selected)
-            self.staged_tree.takeTopLevelItem(idx)
+        self.staged_model.remove_phase(selected)
 
     # ── Output Script table ──────────────────────────────────────
 
@@ -1394,7 +1774,30 @@ class Module6PlaxisScripts(QWidget):
     # Text-editable: Phase(0), Name(13), Min(19), Max(20), Interval(21), Scale(22)
     # Dropdown: Type(14)
 
-    # Column widths (shared between header table and data table)
+    # Per column: row data key of text / dropdown cells, None for checkboxes (kept in row['checks'])
+    _OUTPUT_FIELDS = tuple(
+        {
+            0: 'phase',
+            13: 'name',
+            14: 'type',
+            19: 'scale_min',
+            20: 'scale_max',
+            21: 'scale_interval',
+            22: 'scale',
+        }.get(col)
+        for col in range(len(OUTPUT_COLUMNS))
+    )
+    # Checkbox column → key of its flag in the _collect_output_rows dicts
+    _OUTPUT_CHECK_KEYS = {
+        1: 'u_tot', 2: 'ux', 3: 'uy', 4: 'total_strain',
+        5: 'sig_xx_eff', 6: 'sig_yy_eff', 7: 'sig_xx_tot', 8: 'sig_yy_tot',
+        9: 'sig_xy', 10: 'rel_shear', 11: 'p_excess', 12: 'p_active',
+        15: 'M', 16: 'Q', 17: 'N', 18: 'scaling_auto',
+    }
+    # Type dropdown: empty option + material types
+    _OUTPUT_TYPE_OPTIONS = ('',) + tuple(OUTPUT_MATERIAL_TYPES)
+
+    # Column widths (output table columns)
     _OUTPUT_COL_WIDTHS = [
         200,           # 0   Phase
         50, 50, 50,     # 1-3   |u|, ux, uy
@@ -1420,39 +1823,40 @@ class Module6PlaxisScripts(QWidget):
 
         # Hint
         hint = QLabel("Name = PLAXIS element name (e.g. Plate_1, EmbeddedBeam_7)  |  ใส่ '-' สำหรับ Soil plot")
-        hint.setFont(QFont("SF Pro Display", 9))
+        hint.setFont(self._FONT_SMALL)
         hint.setStyleSheet("color: #8E8E93; margin-bottom: 4px;")
         layout.addWidget(hint)
 
-        # ── Multi-level group header (separate read-only table) ──
-        self._output_header_tbl = self._build_output_header()
-        layout.addWidget(self._output_header_tbl)
-
-        # ── Data table (horizontal header hidden, replaced by header table) ──
-        self.output_table = QTableWidget()
-        self.output_table.setColumnCount(len(self.OUTPUT_COLUMNS))
-        self.output_table.setFont(QFont("SF Pro Display", 9))
-        self.output_table.horizontalHeader().setVisible(False)
+        # ── Data table with a multi-level group header ──
+        self.output_model = OutputTableModel(self._OUTPUT_FIELDS, self)
+        self.output_table = QTableView()
+        self.output_table.setHorizontalHeader(self._build_output_header())
+        self.output_table.setModel(self.output_model)
+        self.output_table.setItemDelegate(ComboCellDelegate(
+            lambda index: self._OUTPUT_TYPE_OPTIONS if index.column() == 14 else None,
+            self._style_combobox, self.output_table))
+        self.output_table.setFont(self._FONT_SMALL)
         self.output_table.verticalHeader().setVisible(False)
         self.output_table.verticalHeader().setDefaultSectionSize(30)
+        self.output_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
 
         for col, w in enumerate(self._OUTPUT_COL_WIDTHS):
             self.output_table.setColumnWidth(col, w)
 
         # Table styling
         self.output_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border-top: none;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: transparent;
                 color: black;
             }
-            QTableWidget::item:focus {
+            QTableView::item:focus {
                 background-color: transparent;
                 border: 1px solid #007AFF;
             }
-            QTableWidget QLineEdit {
+            QTableView QLineEdit {
                 border: none;
                 padding: 0px 2px;
                 background-color: white;
@@ -1492,16 +1896,12 @@ class Module6PlaxisScripts(QWidget):
              'checks': {1: True, 4: True, 7: True, 18: True}, 'scale': '1600x900'},
         ]
 
-        self.output_table.setRowCount(len(sample_rows))
-        for row, data in enumerate(sample_rows):
-            self._setup_output_row(row, data)
+        self._fill_output_rows(sample_rows)
 
-        layout.addWidget(self.output_table, 1)
+        # One click on the Type cell opens its dropdown
+        self.output_table.clicked.connect(self._on_output_cell_clicked)
 
-        # Sync horizontal scroll between header and data table
-        self.output_table.horizontalScrollBar().valueChanged.connect(
-            self._output_header_tbl.horizontalScrollBar().setValue
-        )
+        layout.addWidget(self.output_table, 1)
 
         # Buttons row
         btn_layout = QHBoxLayout()
@@ -1509,12 +1909,12 @@ class Module6PlaxisScripts(QWidget):
         btn_layout.addStretch()
 
         add_btn = QPushButton("+ ROW")
-        add_btn.setFont(QFont("SF Pro Display", 10))
+        add_btn.setFont(self._FONT_BODY)
         add_btn.clicked.connect(self._add_output_row)
         btn_layout.addWidget(add_btn)
 
         del_btn = QPushButton("- ROW")
-        del_btn.setFont(QFont("SF Pro Display", 10))
+        del_btn.setFont(self._FONT_BODY)
         del_btn.clicked.connect(self._delete_output_row)
         btn_layout.addWidget(del_btn)
 
@@ -1523,7 +1923,7 @@ class Module6PlaxisScripts(QWidget):
         return container
 
     def _build_output_header(self):
-        """Build a 3-row merged header table for the output table.
+        """Build the 3-row merged group header for the output table.
 
         Col layout (23 cols):
         0:Phase | 1-3:Deformations | 4:γₛ | 5-10:Stresses | 11-12:PorePressure
@@ -1533,41 +1933,17 @@ class Module6PlaxisScripts(QWidget):
         Row 1:           | |u| ux uy (2r)   |        | Effective(2c) Total(2c) τxy(2r) Rel.τ(2r) | PEx(2r) PAc(2r) | Name(2r) Type(2r) | M Q N(2r) | Auto(2r) Manual(3c) |
         Row 2:           |                   |        | σ'xx σ'yy | σxx σyy |   |   |   |   |   |   |   |   |          | Min Max Interval |
         """
-        ncols = len(self.OUTPUT_COLUMNS)
-        tbl = QTableWidget(3, ncols)
-        tbl.horizontalHeader().setVisible(False)
-        tbl.verticalHeader().setVisible(False)
-        tbl.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        tbl.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        tbl.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        tbl.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        tbl.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
         row_h = 22
-        tbl.verticalHeader().setDefaultSectionSize(row_h)
-        tbl.setFixedHeight(3 * row_h + 2)
-
-        for col, w in enumerate(self._OUTPUT_COL_WIDTHS):
-            tbl.setColumnWidth(col, w)
-
-        # Styles
-        grp = "background-color:#E8E8ED; font-weight:bold;"
-        sub = "background-color:#F2F2F7;"
-        leaf = "background-color:#F8F8FA;"
+        header = GroupedHeaderView(3, row_h, self._FONT_HEADER_CELL)
 
-        def cell(text, style=""):
-            item = QTableWidgetItem(text)
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            item.setFont(QFont("SF Pro Display", 8, QFont.Weight.Bold))
-            if style:
-                item.setBackground(QColor(style.split(':')[1].split(';')[0]))
-            return item
+        # Styles (one QColor per header level, shared by its cells)
+        grp = QColor('#E8E8ED')
+        sub = QColor('#F2F2F7')
+        leaf = QColor('#F8F8FA')
 
         def put(r, c, text, rs=1, cs=1, st=grp):
             """Place a header cell with optional span"""
-            if rs > 1 or cs > 1:
-                tbl.setSpan(r, c, rs, cs)
-            tbl.setItem(r, c, cell(text, st))
+            header.add_cell(r, c, text, rs, cs, st)
 
         # ── Row 0: Top-level group headers ──
         put(0, 0, "Phase", 3, 1, grp)            # col 0
@@ -1607,91 +1983,45 @@ class Module6PlaxisScripts(QWidget):
         put(2, 20, "Max.", 1, 1, leaf)            # col 20
         put(2, 21, "Interval", 1, 1, leaf)        # col 21
 
-        # Overall style
-        tbl.setStyleSheet("""
-            QTableWidget {
-                border: 1px solid #D1D1D6;
-                border-bottom: none;
-                gridline-color: #D1D1D6;
-            }
-        """)
+        return header
+
+    def _output_row_from_data(self, data=None):
+        """Output table row dict from row data (sample, saved or empty), with defaults filled in"""
+        data = data or {}
+        type_text = data.get('type', '')
+        return {
+            'phase': data.get('phase', ''),
+            'name': data.get('name', ''),
+            'scale_min': data.get('scale_min', ''),
+            'scale_max': data.get('scale_max', ''),
+            'scale_interval': data.get('scale_interval', ''),
+            'scale': data.get('scale', '1600x900'),
+            'checks': {col: True for col, checked in data.get('checks', {}).items()
+                       if checked and col in self.OUTPUT_CHECK_COLS},
+            # The dropdown only holds known types
+            'type': type_text if type_text in self._OUTPUT_TYPE_OPTIONS else '',
+        }
 
-        return tbl
-
-    def _setup_output_row(self, row, data=None):
-        """Setup a single row in the output table with checkboxes and dropdown"""
-        if data is None:
-            data = {'phase': '', 'name': '', 'type': '', 'checks': {},
-                    'scale_min': '', 'scale_max': '', 'scale_interval': '',
-                    'scale': '1600x900'}
-
-        for col in range(len(self.OUTPUT_COLUMNS)):
-            if col in self.OUTPUT_CHECK_COLS:
-                # Checkbox column (includes col 13 = Automation)
-                item = QTableWidgetItem()
-                item.setFlags(
-                    Qt.ItemFlag.ItemIsUserCheckable
-                    | Qt.ItemFlag.ItemIsEnabled
-                    | Qt.ItemFlag.ItemIsSelectable
-                )
-                checked = data.get('checks', {}).get(col, False)
-                item.setCheckState(
-                    Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
-                )
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.output_table.setItem(row, col, item)
-
-            elif col == 0:  # Phase
-                item = QTableWidgetItem(data.get('phase', ''))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.output_table.setItem(row, col, item)
-
-            elif col == 13:  # Name
-                item = QTableWidgetItem(data.get('name', ''))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.output_table.setItem(row, col, item)
-
-            elif col == 14:  # Type (dropdown)
-                combo = QComboBox()
-                combo.addItem('')  # Empty option
-                combo.addItems(self.OUTPUT_MATERIAL_TYPES)
-                combo.setCurrentText(data.get('type', ''))
-                self._style_combobox(combo)
-                self.output_table.setCellWidget(row, col, combo)
-
-            elif col == 19:  # Min. (Manual Scaling)
-                item = QTableWidgetItem(data.get('scale_min', ''))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.output_table.setItem(row, col, item)
-
-            elif col == 20:  # Max. (Manual Scaling)
-                item = QTableWidgetItem(data.get('scale_max', ''))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.output_table.setItem(row, col, item)
-
-            elif col == 21:  # Interval (Manual Scaling)
-                item = QTableWidgetItem(data.get('scale_interval', ''))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.output_table.setItem(row, col, item)
-
-            elif col == 22:  # Scale (image size)
-                item = QTableWidgetItem(data.get('scale', '1600x900'))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.output_table.setItem(row, col, item)
+    def _fill_output_rows(self, rows):
+        """Replace the output table contents with rows (one data dict per row)"""
+        self.output_model.set_rows([self._output_row_from_data(data) for data in rows])
+
+    def _on_output_cell_clicked(self, index):
+        """Open the Type dropdown on a single click"""
+        if index.column() == 14:
+            self.output_table.edit(index)
 
     def _add_output_row(self):
         """Add new row to output table"""
-        row = self.output_table.rowCount()
-        self.output_table.insertRow(row)
-        self._setup_output_row(row)
+        self.output_model.insert_row(self.output_model.rowCount(), self._output_row_from_data())
 
     def _delete_output_row(self):
         """Delete selected row from output table"""
-        current = self.output_table.currentRow()
+        current = self.output_table.currentIndex().row()
         if current >= 0:
-            self.output_table.removeRow(current)
-        elif self.output_table.rowCount() > 0:
-            self.output_table.removeRow(self.output_table.rowCount() - 1)
+            self.output_model.remove_row(current)
+        elif self.output_model.rowCount() > 0:
+            self.output_model.remove_row(self.output_model.rowCount() - 1)
 
     def _create_output_preview_section(self):
         """Create preview area for the generated output script"""
@@ -1700,22 +2030,14 @@ class Module6PlaxisScripts(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
 
         hint = QLabel("Generated PLAXIS Output script preview")
-        hint.setFont(QFont("SF Pro Display", 9))
+        hint.setFont(self._FONT_SMALL)
         hint.setStyleSheet("color: #8E8E93; margin-bottom: 4px;")
         layout.addWidget(hint)
 
-        self.output_preview_text = QTextEdit()
-        self.output_preview_text.setFont(QFont("Consolas", 10))
+        self.output_preview_text = QPlainTextEdit()
+        self.output_preview_text.setFont(self._FONT_CODE)
         self.output_preview_text.setReadOnly(True)
-        self.output_preview_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                border: 1px solid #333;
-                border-radius: 6px;
-                padding: 12px;
-            }
-        """)
+        self.output_preview_text.setStyleSheet(self._CODE_PREVIEW_STYLE)
         self.output_preview_text.setPlaceholderText(
             "# Output script will be generated here...\n"
             "# Click 'Generate Output Script' to preview")
@@ -1753,53 +2075,17 @@ class Module6PlaxisScripts(QWidget):
 
     # ── Output table data helpers ──────────────────────────────────
 
-    def _get_output_cell_value(self, row, col):
-        """Get value from output table cell (handles items and widgets)"""
-        widget = self.output_table.cellWidget(row, col)
-        if widget and isinstance(widget, QComboBox):
-            return widget.currentText()
-        item = self.output_table.item(row, col)
-        return item.text() if item else ""
-
-    def _is_output_checked(self, row, col):
-        """Check if a checkbox column is checked in output table"""
-        item = self.output_table.item(row, col)
-        if item:
-            return item.checkState() == Qt.CheckState.Checked
-        return False
-
     def _collect_output_rows(self):
         """Collect all output table rows as list of dicts"""
         rows = []
-        for row in range(self.output_table.rowCount()):
-            phase = self._get_output_cell_value(row, 0).strip()
-            if not phase:
+        for data in self.output_model.rows:
+            if not data['phase'].strip():
                 continue
-            rows.append({
-                'phase': phase,
-                'u_tot': self._is_output_checked(row, 1),
-                'ux': self._is_output_checked(row, 2),
-                'uy': self._is_output_checked(row, 3),
-                'total_strain': self._is_output_checked(row, 4),
-                'sig_xx_eff': self._is_output_checked(row, 5),
-                'sig_yy_eff': self._is_output_checked(row, 6),
-                'sig_xx_tot': self._is_output_checked(row, 7),
-                'sig_yy_tot': self._is_output_checked(row, 8),
-                'sig_xy': self._is_output_checked(row, 9),
-                'rel_shear': self._is_output_checked(row, 10),
-                'p_excess': self._is_output_checked(row, 11),
-                'p_active': self._is_output_checked(row, 12),
-                'name': self._get_output_cell_value(row, 13).strip(),
-                'type': self._get_output_cell_value(row, 14).strip(),
-                'M': self._is_output_checked(row, 15),
-                'Q': self._is_output_checked(row, 16),
-                'N': self._is_output_checked(row, 17),
-                'scaling_auto': self._is_output_checked(row, 18),
-                'scale_min': self._get_output_cell_value(row, 19).strip(),
-                'scale_max': self._get_output_cell_value(row, 20).strip(),
-                'scale_interval': self._get_output_cell_value(row, 21).strip(),
-                'scale': self._get_output_cell_value(row, 22).strip() or '1600x900',
-            })
+            checks = data['checks']
+            row = {field: data[field].strip() for field in self._OUTPUT_FIELDS if field}
+            row.update((key, bool(checks.get(col))) for col, key in self._OUTPUT_CHECK_KEYS.items())
+            row['scale'] = row['scale'] or '1600x900'
+            rows.append(row)
         return rows
 
     # ── Generate Output Script ─────────────────────────────────────
@@ -1850,82 +2136,210 @@ class Module6PlaxisScripts(QWidget):
         'p_active':     'PActive',
     }
 
+    # Fixed parts of the output script; only the LEGEND entries, phases and
+    # per-row plot blocks between them depend on the table
+    _OUTPUT_HEADER_TMPL = '''\
+# ============================================================
+# PLAXIS Output Script
+# Generated by GeoTech v3.0
+# ============================================================
+
+from plxscripting.easy import *
+import os
+
+try:
+    # ------------------------------------------------------------
+    # 1. Connect to PLAXIS Output
+    # ------------------------------------------------------------
+    password = os.getenv("PLAXIS_PASSWORD")
+    s_o, g_o = new_server("localhost", 10001, password=password)
+    print(">>> Connected to PLAXIS Output")
+
+    # ------------------------------------------------------------
+    # 2. Setup
+    # ------------------------------------------------------------
+    output_dir = r"{output_dir}"
+    os.makedirs(output_dir, exist_ok=True)
+
+    # ------------------------------------------------------------
+    # 3. Legend Settings Config
+    # ------------------------------------------------------------
+    # None = Auto (PLAXIS default per phase)
+    # value = Manual (set Min/Max)
+    LEGEND = {{'''
+
+    _OUTPUT_HELPERS_TMPL = '''\
+    # ------------------------------------------------------------
+    # 4. Helper functions
+    # ------------------------------------------------------------
+    def apply_legend(plot, key):
+        \"\"\"Apply legend settings: None=Auto, value=Manual\"\"\"
+        cfg = LEGEND.get(key)
+        if cfg is None:
+            return
+        if cfg["min"] is None and cfg["max"] is None:
+            return
+        try:
+            if cfg["min"] is not None:
+                plot.LegendSettings.MinValue = cfg["min"]
+            if cfg["max"] is not None:
+                plot.LegendSettings.MaxValue = cfg["max"]
+        except Exception as e:
+            print(f"  NOTE: LegendSettings error ({e})")
+
+    def export_plot(plot, filename, legend_key=None, img_w=1600, img_h=900):
+        if legend_key:
+            apply_legend(plot, legend_key)
+        filepath = os.path.join(output_dir, f"{filename}.png")
+        try:
+            plot.export(filepath, img_w, img_h)
+            cfg = LEGEND.get(legend_key, {})
+            mode = "Auto" if (cfg.get("min") is None and cfg.get("max") is None) else f"Manual [{cfg['min']} ~ {cfg['max']}]"
+            print(f"  OK {filename}.png  [{mode}]")
+            return True
+        except Exception as e:
+            print(f"  FAIL {filename}: {e}")
+            return False
+
+    def find_phase(name):
+        \"\"\"Find phase by Identification (partial match)\"\"\"
+        for p in g_o.Phases:
+            if name in str(p.Identification):
+                return p
+        return None
+
+    def find_elements(name, collection):
+        \"\"\"Find elements whose Name contains the given name.
+        e.g. name='EmbeddedBeam_6' matches 'EmbeddedBeam_6_1'
+        \"\"\"
+        results = []
+        for elem in collection:
+            if name in str(elem.Name):
+                results.append(elem)
+        return results
+'''
+
+    _OUTPUT_FOOTER_TMPL = r'''    # ============================================================
+    # Summary
+    # ============================================================
+    print("\n" + "=" * 50)
+    print("SUMMARY")
+    print("=" * 50)
+    print(f"Output folder: {output_dir}")
+
+    png_files = sorted(f for f in os.listdir(output_dir) if f.endswith('.png'))
+    print(f"\nTotal PNG: {len(png_files)}")
+
+    for f in png_files:
+        size = os.path.getsize(os.path.join(output_dir, f))
+        print(f"  {f} ({size:,} bytes)")
+
+except Exception as e:
+    print(f"\n!!! ERROR: {e}")
+    import traceback
+    traceback.print_exc()
+
+print("\n" + "=" * 50)
+input("Press Enter to close...")'''
+
+    # Per-row blocks of the output script; each ends with a blank line. The
+    # *_LINE templates are joined into the {soil_lines}/{force_lines} slots.
+    _PHASE_HEADER_TMPL = '''\
+    # ══════════════════════════════════════════════════
+    # PHASE: {phase}
+    # ══════════════════════════════════════════════════
+    print("\\n" + "=" * 50)
+    print("PHASE: {phase}")
+    print("=" * 50)
+'''
+
+    _SOIL_BLOCK_TMPL = '''\
+    print("\\n[Soil Results]")
+    try:
+        soil_plot = g_o.Plots[0]
+        soil_plot.Phase = {phase_var}
+
+{soil_lines}    except Exception as e:
+        print(f"  FAIL: {{e}}")
+'''
+
+    _SOIL_LINE_TMPL = '''\
+        soil_plot.ResultType = g_o.ResultTypes.Soil.{result_attr}
+        export_plot(soil_plot, "{fname}", "{fname}", {img_w}, {img_h})
+
+'''
+
+    _STRUCT_BLOCK_TMPL = '''\
+    # --- {elem_name} ({struct_type}) ---
+    print("\\n[{elem_name} - {struct_type}]")
+    try:
+        elems = find_elements("{elem_name}", g_o.{collection_name})
+        if not elems:
+            print("  WARNING: {elem_name} not found")
+        for _i, _elem in enumerate(elems):
+            _suffix = f'_{{_i+1}}' if len(elems) > 1 else ''
+            _plot = g_o.structureplot(_elem)
+            _plot.Phase = {phase_var}
+
+{force_lines}    except Exception as e:
+        print(f"  FAIL: {{e}}")
+'''
+
+    _FORCE_LINE_TMPL = '''\
+            _plot.ResultType = g_o.ResultTypes.{rt_prefix}.{suffix}
+            export_plot(_plot, f"{phase}_{elem_name}{{_suffix}}_{force_key}", "{phase}_{elem_name}_{force_key}", {img_w}, {img_h})
+
+'''
+
     def _generate_output_script(self):
         """Generate PLAXIS Output Python script from the output table"""
         rows = self._collect_output_rows()
         if not rows:
             return "# No output rows configured."
 
+        cache_key = (self._output_dir, tuple(tuple(r.items()) for r in rows))
+        if cache_key == self._script_cache[0]:
+            return self._script_cache[1]
+
         # Indent helper for try block
         I = "    "  # 4-space indent inside try block
 
-        L = []  # script lines
+        L = [self._OUTPUT_HEADER_TMPL.format(output_dir=self._output_dir)]  # script lines
         a = L.append
 
-        # ─── Header ───
-        a("# ============================================================")
-        a("# PLAXIS Output Script")
-        a("# Generated by GeoTech v3.0")
-        a("# ============================================================")
-        a("")
-        a("from plxscripting.easy import *")
-        a("import os")
-        a("")
-        a("try:")
-
-        # ─── Connection ───
-        a(f"{I}# ------------------------------------------------------------")
-        a(f"{I}# 1. Connect to PLAXIS Output")
-        a(f"{I}# ------------------------------------------------------------")
-        a(f'{I}password = os.getenv("PLAXIS_PASSWORD")')
-        a(f'{I}s_o, g_o = new_server("localhost", 10001, password=password)')
-        a(f'{I}print(">>> Connected to PLAXIS Output")')
-        a("")
-
-        # ─── Setup ───
-        a(f"{I}# ------------------------------------------------------------")
-        a(f"{I}# 2. Setup")
-        a(f"{I}# ------------------------------------------------------------")
-        a(f'{I}output_dir = r"{self._output_dir}"')
-        a(f"{I}os.makedirs(output_dir, exist_ok=True)")
-        a("")
+        # Per-row values shared by the LEGEND and plot sections
+        prepared = []
+        for r in rows:
+            name_raw = r['name']
+            scale = r['scale'].lower()
 
-        # ─── Helper: Legend Settings ───
-        a(f"{I}# ------------------------------------------------------------")
-        a(f"{I}# 3. Legend Settings Config")
-        a(f"{I}# ------------------------------------------------------------")
-        a(f"{I}# None = Auto (PLAXIS default per phase)")
-        a(f"{I}# value = Manual (set Min/Max)")
-        a(f"{I}LEGEND = {{")
+            # Parse image size
+            if 'x' in scale:
+                parts = scale.split('x')
+                img_size = (parts[0].strip(), parts[1].strip())
+            else:
+                img_size = ('1600', '900')
+
+            prepared.append({
+                'phase': r['phase'],
+                'is_soil': not name_raw or name_raw == '-' or not r['type'],
+                'elem_name': name_raw.strip('"'),
+                'type': r['type'],
+                'soil_keys': [k for k in self._SOIL_RESULTS if r[k]],
+                'force_keys': [k for k in ('M', 'Q', 'N') if r[k]],
+                'legend': (r['scale_min'] or None, r['scale_max'] or None),
+                'img_size': img_size,
+            })
 
-        # Build LEGEND dict from all rows
+        # Build LEGEND dict: soil rows → one key per result type, structure rows → one per force
         legend_entries = {}
-        for r in rows:
-            phase_name = r['phase']
-            name_raw = r['name']
-            struct_type = r['type']
-            is_soil = (not name_raw or name_raw == '-' or not struct_type)
-            scale_min = r.get('scale_min', '')
-            scale_max = r.get('scale_max', '')
-
-            if is_soil:
-                # Soil results → legend key per result type
-                for key in self._SOIL_RESULTS:
-                    if r.get(key):
-                        label = self._SOIL_LABELS[key]
-                        legend_key = f"{phase_name}_{label}"
-                        min_v = scale_min if scale_min else None
-                        max_v = scale_max if scale_max else None
-                        legend_entries[legend_key] = (min_v, max_v)
+        for p in prepared:
+            if p['is_soil']:
+                for key in p['soil_keys']:
+                    legend_entries[f"{p['phase']}_{self._SOIL_LABELS[key]}"] = p['legend']
             else:
-                # Structure results → legend key per force
-                elem_name = name_raw.strip('"')
-                for fk in ('M', 'Q', 'N'):
-                    if r.get(fk):
-                        legend_key = f"{phase_name}_{elem_name}_{fk}"
-                        min_v = scale_min if scale_min else None
-                        max_v = scale_max if scale_max else None
-                        legend_entries[legend_key] = (min_v, max_v)
+                for fk in p['force_keys']:
+                    legend_entries[f"{p['phase']}_{p['elem_name']}_{fk}"] = p['legend']
 
         for lk, (mn, mx) in legend_entries.items():
             mn_s = mn if mn else 'None'
@@ -1934,61 +2348,7 @@ class Module6PlaxisScripts(QWidget):
         a(f"{I}}}")
         a("")
 
-        # ─── Helper functions ───
-        a(f"{I}# ------------------------------------------------------------")
-        a(f"{I}# 4. Helper functions")
-        a(f"{I}# ------------------------------------------------------------")
-        a(f"{I}def apply_legend(plot, key):")
-        a(f'{I}    """Apply legend settings: None=Auto, value=Manual"""')
-        a(f"{I}    cfg = LEGEND.get(key)")
-        a(f"{I}    if cfg is None:")
-        a(f"{I}        return")
-        a(f'{I}    if cfg["min"] is None and cfg["max"] is None:')
-        a(f"{I}        return")
-        a(f"{I}    try:")
-        a(f'{I}        if cfg["min"] is not None:')
-        a(f'{I}            plot.LegendSettings.MinValue = cfg["min"]')
-        a(f'{I}        if cfg["max"] is not None:')
-        a(f'{I}            plot.LegendSettings.MaxValue = cfg["max"]')
-        a(f"{I}    except Exception as e:")
-        a(f'{I}        print(f"  NOTE: LegendSettings error ({{e}})")')
-        a("")
-
-        a(f"{I}def export_plot(plot, filename, legend_key=None, img_w=1600, img_h=900):")
-        a(f"{I}    if legend_key:")
-        a(f"{I}        apply_legend(plot, legend_key)")
-        a(f'{I}    filepath = os.path.join(output_dir, f"{{filename}}.png")')
-        a(f"{I}    try:")
-        a(f"{I}        plot.export(filepath, img_w, img_h)")
-        a(f"{I}        cfg = LEGEND.get(legend_key, {{}})")
-        a(f'{I}        mode = "Auto" if (cfg.get("min") is None and cfg.get("max") is None) else f"Manual [{{cfg[\'min\']}} ~ {{cfg[\'max\']}}]"')
-        a(f'{I}        print(f"  OK {{filename}}.png  [{{mode}}]")')
-        a(f"{I}        return True")
-        a(f"{I}    except Exception as e:")
-        a(f'{I}        print(f"  FAIL {{filename}}: {{e}}")')
-        a(f"{I}        return False")
-        a("")
-
-        # ─── Helper: find phase ───
-        a(f"{I}def find_phase(name):")
-        a(f'{I}    """Find phase by Identification (partial match)"""')
-        a(f"{I}    for p in g_o.Phases:")
-        a(f"{I}        if name in str(p.Identification):")
-        a(f"{I}            return p")
-        a(f"{I}    return None")
-        a("")
-
-        # ─── Helper: find structure elements by PLAXIS name ───
-        a(f"{I}def find_elements(name, collection):")
-        a(f'{I}    """Find elements whose Name contains the given name.')
-        a(f"{I}    e.g. name='EmbeddedBeam_6' matches 'EmbeddedBeam_6_1'")
-        a(f'{I}    """')
-        a(f"{I}    results = []")
-        a(f"{I}    for elem in collection:")
-        a(f"{I}        if name in str(elem.Name):")
-        a(f"{I}            results.append(elem)")
-        a(f"{I}    return results")
-        a("")
+        a(self._OUTPUT_HELPERS_TMPL)
 
         # ─── Collect unique phases ───
         unique_phases = []
@@ -2014,116 +2374,50 @@ class Module6PlaxisScripts(QWidget):
         a("")
 
         current_phase = None
-        for r in rows:
-            phase_name = r['phase']
+        for p in prepared:
+            phase_name = p['phase']
             phase_var = self._phase_var_name(phase_name)
-            name_raw = r['name']
-            struct_type = r['type']
-            scale = r['scale']
-
-            # Parse image size
-            if 'x' in scale.lower():
-                parts = scale.lower().split('x')
-                img_w, img_h = parts[0].strip(), parts[1].strip()
-            else:
-                img_w, img_h = '1600', '900'
+            img_w, img_h = p['img_size']
 
             # Phase header
             if phase_name != current_phase:
                 current_phase = phase_name
-                a(f"{I}# ══════════════════════════════════════════════════")
-                a(f"{I}# PHASE: {phase_name}")
-                a(f"{I}# ══════════════════════════════════════════════════")
-                a(f'{I}print("\\n" + "=" * 50)')
-                a(f'{I}print("PHASE: {phase_name}")')
-                a(f'{I}print("=" * 50)')
-                a("")
+                a(self._PHASE_HEADER_TMPL.format(phase=phase_name))
 
             # ── Case A: Soil result (no material / Name is "-" or empty) ──
-            is_soil = (not name_raw or name_raw == '-' or not struct_type)
-            has_soil_checks = any(r[k] for k in self._SOIL_RESULTS)
-
-            if is_soil and has_soil_checks:
-                a(f'{I}print("\\n[Soil Results]")')
-                a(f"{I}try:")
-                a(f"{I}    soil_plot = g_o.Plots[0]")
-                a(f"{I}    soil_plot.Phase = {phase_var}")
-                a("")
-
-                for key, result_attr in self._SOIL_RESULTS.items():
-                    if r.get(key):
-                        label = self._SOIL_LABELS[key]
-                        fname = f"{phase_name}_{label}"
-                        legend_key = f"{phase_name}_{label}"
-                        a(f"{I}    soil_plot.ResultType = g_o.ResultTypes.Soil.{result_attr}")
-                        a(f'{I}    export_plot(soil_plot, "{fname}", "{legend_key}", {img_w}, {img_h})')
-                        a("")
-
-                a(f"{I}except Exception as e:")
-                a(f'{I}    print(f"  FAIL: {{e}}")')
-                a("")
+            if p['is_soil'] and p['soil_keys']:
+                soil_lines = ''.join(
+                    self._SOIL_LINE_TMPL.format(
+                        result_attr=self._SOIL_RESULTS[key],
+                        fname=f"{phase_name}_{self._SOIL_LABELS[key]}",
+                        img_w=img_w, img_h=img_h)
+                    for key in p['soil_keys'])
+                a(self._SOIL_BLOCK_TMPL.format(phase_var=phase_var, soil_lines=soil_lines))
 
             # ── Case B: Structural result (material specified) ──
-            has_force = r['M'] or r['Q'] or r['N']
-
-            if not is_soil and has_force and struct_type:
-                elem_name = name_raw.strip('"')
+            if not p['is_soil'] and p['force_keys']:
+                elem_name = p['elem_name']
                 collection_name, rt_prefix = self._STRUCT_MAP.get(
-                    struct_type, ('Plates', 'Plate'))
-
-                a(f'{I}# --- {elem_name} ({struct_type}) ---')
-                a(f'{I}print("\\n[{elem_name} - {struct_type}]")')
-                a(f"{I}try:")
-                a(f'{I}    elems = find_elements("{elem_name}", g_o.{collection_name})')
-                a(f"{I}    if not elems:")
-                a(f'{I}        print("  WARNING: {elem_name} not found")')
-                a(f"{I}    for _i, _elem in enumerate(elems):")
-                a(f"{I}        _suffix = f'_{{_i+1}}' if len(elems) > 1 else ''")
-                a(f"{I}        _plot = g_o.structureplot(_elem)")
-                a(f"{I}        _plot.Phase = {phase_var}")
-                a("")
-
-                for force_key in ('M', 'Q', 'N'):
-                    if r[force_key]:
-                        suffix = self._FORCE_SUFFIX[force_key]
-                        legend_key = f"{phase_name}_{elem_name}_{force_key}"
-                        a(f"{I}        _plot.ResultType = g_o.ResultTypes.{rt_prefix}.{suffix}")
-                        a(f'{I}        export_plot(_plot, f"{phase_name}_{elem_name}{{_suffix}}_{force_key}", "{legend_key}", {img_w}, {img_h})')
-                        a("")
-
-                a(f"{I}except Exception as e:")
-                a(f'{I}    print(f"  FAIL: {{e}}")')
-                a("")
-
-        # ─── Summary ───
-        a(f"{I}# ============================================================")
-        a(f"{I}# Summary")
-        a(f"{I}# ============================================================")
-        a(f'{I}print("\\n" + "=" * 50)')
-        a(f'{I}print("SUMMARY")')
-        a(f'{I}print("=" * 50)')
-        a(f'{I}print(f"Output folder: {{output_dir}}")')
-        a("")
-        a(f"{I}png_files = sorted(f for f in os.listdir(output_dir) if f.endswith('.png'))")
-        a(f'{I}print(f"\\nTotal PNG: {{len(png_files)}}")')
-        a("")
-        a(f"{I}for f in png_files:")
-        a(f"{I}    size = os.path.getsize(os.path.join(output_dir, f))")
-        a(f'{I}    print(f"  {{f}} ({{size:,}} bytes)")')
-
-        # ─── Outer except + finally ───
-        a("")
-        a("except Exception as e:")
-        a('    print(f"\\n!!! ERROR: {e}")')
-        a("    import traceback")
-        a("    traceback.print_exc()")
-        a("")
-        a('print("\\n" + "=" * 50)')
-        a('input("Press Enter to close...")')
-
-        return '\n'.join(L)
+                    p['type'], ('Plates', 'Plate'))
+                force_lines = ''.join(
+                    self._FORCE_LINE_TMPL.format(
+                        phase=phase_name, elem_name=elem_name, force_key=force_key,
+                        rt_prefix=rt_prefix, suffix=self._FORCE_SUFFIX[force_key],
+                        img_w=img_w, img_h=img_h)
+                    for force_key in p['force_keys'])
+                a(self._STRUCT_BLOCK_TMPL.format(
+                    elem_name=elem_name, struct_type=p['type'],
+                    collection_name=collection_name, phase_var=phase_var,
+                    force_lines=force_lines))
+
+        a(self._OUTPUT_FOOTER_TMPL)
+
+        script = '\n'.join(L)
+        self._script_cache = (cache_key, script)
+        return script
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _phase_var_name(phase_name):
         """Convert phase name to a valid Python variable name"""
         var = phase_name.replace(' ', '_').replace('-', '_')
@@ -2132,6 +2426,17 @@ class Module6PlaxisScripts(QWidget):
             var = 'p_' + var
         return f"phase_{var}"
 
+    # Dark code-editor look shared by the input and output script previews
+    _CODE_PREVIEW_STYLE = """
+        QPlainTextEdit {
+            background-color: #1e1e1e;
+            color: #d4d4d4;
+            border: 1px solid #333;
+            border-radius: 6px;
+            padding: 12px;
+        }
+    """
+
     def _create_preview_section(self):
         """Create preview section for Python script"""
         container = QWidget()
@@ -2140,23 +2445,15 @@ class Module6PlaxisScripts(QWidget):
 
         # Hint label
         hint = QLabel("Click 'Generate Script' to preview the PLAXIS Python script")
-        hint.setFont(QFont("SF Pro Display", 9))
+        hint.setFont(self._FONT_SMALL)
         hint.setStyleSheet("color: #8E8E93; margin-bottom: 4px;")
         layout.addWidget(hint)
 
         # Preview text area
-        self.preview_text = QTextEdit()
-        self.preview_text.setFont(QFont("Consolas", 10))
+        self.preview_text = QPlainTextEdit()
+        self.preview_text.setFont(self._FONT_CODE)
         self.preview_text.setReadOnly(True)
-        self.preview_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                border: 1px solid #333;
-                border-radius: 6px;
-                padding: 12px;
-            }
-        """)
+        self.preview_text.setStyleSheet(self._CODE_PREVIEW_STYLE)
         self.preview_text.setPlaceholderText("# Python script will be generated here...\n# Click 'Generate Script' in the top bar to preview")
         layout.addWidget(self.preview_text, 1)
 
@@ -2185,11 +2482,9 @@ class Module6PlaxisScripts(QWidget):
                 QMessageBox.warning(self, "Warning", "No data found in Module 4.\nPlease enter data in Module 4 first.")
                 return
 
-            # Set row count in layer table
-            self.layer_table.setRowCount(len(valid_rows))
-
             # Column mapping from Module 4: From(0), To(1), SPT(2), γsat(3), Su(4), ϕ'(5), E/E'(6), K0(7), Soil Type(8), Consistency(9)
 
+            rows = []
             for idx, m4_row in enumerate(valid_rows):
                 # Get values from Module 4
                 from_val = line_table.item(m4_row, 0).text() if line_table.item(m4_row, 0) else ''
@@ -2225,66 +2520,66 @@ class Module6PlaxisScripts(QWidget):
                 # Determine permeability class based on soil type
                 perm_class = 'Clay' if soil_type == 'Clay' else 'Sand'
 
-                # Setup the row with widgets first
-                self._setup_layer_row(idx, (0, 0))
+                # Start from the default row, then set values
+                row = self._default_layer_row()
 
-                # Now set values
                 # Column 0: From
-                self.layer_table.item(idx, 0).setText(from_val)
+                row[0] = from_val
 
                 # Column 1: To
-                self.layer_table.item(idx, 1).setText(to_val)
+                row[1] = to_val
 
                 # Column 2: Name
-                self.layer_table.item(idx, 2).setText(layer_name)
+                row[2] = layer_name
 
                 # Column 3: Soil Model (dropdown) - keep default Mohr-Coulomb
 
                 # Column 4: Drainage Type (dropdown)
-                drainage_combo = self.layer_table.cellWidget(idx, 4)
-                if drainage_combo:
-                    drainage_combo.setCurrentText(drainage)
+                row[4] = drainage
 
-                # Column 6: γsat (set first, then γunsat will auto-calculate)
-                self.layer_table.item(idx, 6).setText(gamma_sat)
+                # Column 6: γsat
+                row[6] = gamma_sat
 
                 # Column 5: γunsat (auto-calculated from γsat - 1)
                 if gamma_sat:
                     try:
                         gamma_unsat = float(gamma_sat) - 1
-                        self.layer_table.item(idx, 5).setText(str(gamma_unsat))
+                        row[5] = f"{gamma_unsat:g}"
                     except ValueError:
                         pass
 
                 # Column 7: Void Ratio - keep Default
 
                 # Column 8: Eref
-                self.layer_table.item(idx, 8).setText(e_val)
+                row[8] = e_val
 
                 # Column 9: ν(nu) - leave empty for user
 
                 # Column 10: Su
-                self.layer_table.item(idx, 10).setText(su_val)
+                row[10] = su_val
 
                 # Column 11: cref - leave empty for user
 
                 # Column 12: phi
-                self.layer_table.item(idx, 12).setText(phi_val)
+                row[12] = phi_val
 
                 # Column 13: Classification - keep USDA
 
                 # Column 14: Permeabilities (dropdown)
-                perm_combo = self.layer_table.cellWidget(idx, 14)
-                if perm_combo:
-                    perm_combo.setCurrentText(perm_class)
+                row[14] = perm_class
 
                 # Column 15: Defaults method - keep From grain size
 
                 # Column 16: Rinter
-                self.layer_table.item(idx, 16).setText(rinter)
+                row[16] = rinter
 
                 # Column 17: K0 - keep Automatic
 
+                rows.append(row)
+
+            # Replace the table contents in one model reset
+            self.layer_model.set_rows(rows)
+
             QMessageBox.information(self, "Success", f"Loaded {len(valid_rows)} layers from Module 4.\nγunsat auto-calculated from γsat.\nPlease fill in remaining values (ν, cref, etc.)")
 
         except Exception as e:
@@ -2292,24 +2587,31 @@ class Module6PlaxisScripts(QWidget):
 
     def _add_layer_row(self):
         """Add new row to layer table"""
-        row_count = self.layer_table.rowCount()
-        self.layer_table.insertRow(row_count)
-        self._setup_layer_row(row_count, (0, 0))
+        row_count = self.layer_model.rowCount()
+        self.layer_model.insert_row(row_count, self._default_layer_row())
 
     def _delete_layer_row(self):
         """Delete selected row from layer table"""
-        current_row = self.layer_table.currentRow()
+        current_row = self.layer_table.currentIndex().row()
         if current_row >= 0:
-            self.layer_table.removeRow(current_row)
+            self.layer_model.remove_row(current_row)
         else:
             # Delete last row if no selection
-            if self.layer_table.rowCount() > 1:
-                self.layer_table.removeRow(self.layer_table.rowCount() - 1)
+            if self.layer_model.rowCount() > 1:
+                self.layer_model.remove_row(self.layer_model.rowCount() - 1)
 
     def _add_staged_row(self):
         """Legacy method — delegates to new tree-based add"""
         self._add_staged_phase()
 
+    # Layer table columns, in order, as keys of the per-layer dicts used by _generate_script
+    _LAYER_FIELDS = (
+        'from', 'to', 'name', 'soil_model', 'drainage_type',
+        'gamma_unsat', 'gamma_sat', 'void_ratio', 'eref', 'nu',
+        'su', 'cref', 'phi', 'classification', 'soil_class',
+        'defaults_method', 'rinter', 'k0_determination', 'k0_manual',
+    )
+
     def _generate_script(self):
         """Generate PLAXIS Python script from table data"""
         lines = []
@@ -2337,35 +2639,13 @@ class Module6PlaxisScripts(QWidget):
         # Collect layer data
         # ============================================================
         layers = []
-        for row in range(self.layer_table.rowCount()):
-            from_val = self._get_layer_cell_value(row, 0)
-            to_val = self._get_layer_cell_value(row, 1)
-
+        for row, values in enumerate(self.layer_model.rows):
             # Skip empty rows
-            if not from_val or not to_val:
+            if not values[0] or not values[1]:
                 continue
 
-            layer_data = {
-                'from': from_val,
-                'to': to_val,
-                'name': self._get_layer_cell_value(row, 2) or f"Layer_{row+1}",
-                'soil_model': self._get_layer_cell_value(row, 3),
-                'drainage_type': self._get_layer_cell_value(row, 4),
-                'gamma_unsat': self._get_layer_cell_value(row, 5),
-                'gamma_sat': self._get_layer_cell_value(row, 6),
-                'void_ratio': self._get_layer_cell_value(row, 7),
-                'eref': self._get_layer_cell_value(row, 8),
-                'nu': self._get_layer_cell_value(row, 9),
-                'su': self._get_layer_cell_value(row, 10),
-                'cref': self._get_layer_cell_value(row, 11),
-                'phi': self._get_layer_cell_value(row, 12),
-                'classification': self._get_layer_cell_value(row, 13),
-                'soil_class': self._get_layer_cell_value(row, 14),
-                'defaults_method': self._get_layer_cell_value(row, 15),
-                'rinter': self._get_layer_cell_value(row, 16),
-                'k0_determination': self._get_layer_cell_value(row, 17),
-                'k0_manual': self._get_layer_cell_value(row, 18),
-            }
+            layer_data = dict(zip(self._LAYER_FIELDS, values))
+            layer_data['name'] = layer_data['name'] or f"Layer_{row+1}"
             layers.append(layer_data)
 
         # ============================================================
@@ -2695,33 +2975,22 @@ class Module6PlaxisScripts(QWidget):
                 QMessageBox.critical(self, "Error", f"Failed to save script:\n{str(e)}")
 
     def _get_layer_cell_value(self, row, col):
-        """Get value from layer table cell (handles both items and widgets)"""
-        widget = self.layer_table.cellWidget(row, col)
-        if widget and isinstance(widget, QComboBox):
-            return widget.currentText()
-        item = self.layer_table.item(row, col)
-        return item.text() if item else ""
+        """Get value from layer table cell"""
+        return self.layer_model.value(row, col)
 
     def _set_layer_cell_value(self, row, col, value):
-        """Set value in layer table cell (handles both items and widgets)"""
-        widget = self.layer_table.cellWidget(row, col)
-        if widget and isinstance(widget, QComboBox):
-            widget.setCurrentText(value)
-        else:
-            item = self.layer_table.item(row, col)
-            if item:
-                item.setText(value)
+        """Set value in layer table cell (dropdown cells ignore values not in their choices)"""
+        options = self._layer_cell_options(row, col)
+        if options is not None and value not in options:
+            return
+        self.layer_model.set_value(row, col, value)
 
     def get_project_data(self):
         """Get all data for project save"""
         # Get layer table data (including dropdown values)
         layer_data = []
-        for row in range(self.layer_table.rowCount()):
-            row_data = []
-            for col in range(self.layer_table.columnCount()):
-                value = self._get_layer_cell_value(row, col)
-                row_data.append(value)
-            layer_data.append(row_data)
+        for row_data in self.layer_model.rows:
+            layer_data.append(list(row_data))
 
         # Get staged construction data from tree (backward-compatible flat format)
         staged_data = []
@@ -2731,27 +3000,9 @@ class Module6PlaxisScripts(QWidget):
                 phase['pore_pressure'], phase['reset_disp']
             ])
 
-        # Get output table data
-        output_data = []
-        for row in range(self.output_table.rowCount()):
-            row_dict = {
-                'phase': self.output_table.item(row, 0).text() if self.output_table.item(row, 0) else '',
-                'name': self.output_table.item(row, 13).text() if self.output_table.item(row, 13) else '',
-                'scale_min': self.output_table.item(row, 19).text() if self.output_table.item(row, 19) else '',
-                'scale_max': self.output_table.item(row, 20).text() if self.output_table.item(row, 20) else '',
-                'scale_interval': self.output_table.item(row, 21).text() if self.output_table.item(row, 21) else '',
-                'scale': self.output_table.item(row, 22).text() if self.output_table.item(row, 22) else '',
-                'checks': {},
-            }
-            # Type dropdown
-            type_combo = self.output_table.cellWidget(row, 14)
-            row_dict['type'] = type_combo.currentText() if type_combo else ''
-            # Checkboxes
-            for col in self.OUTPUT_CHECK_COLS:
-                item = self.output_table.item(row, col)
-                if item and item.checkState() == Qt.CheckState.Checked:
-                    row_dict['checks'][col] = True
-            output_data.append(row_dict)
+        # Get output table data (rows are kept in the saved format)
+        output_data = [dict(row, checks={col: True for col in sorted(row['checks'])})
+                       for row in self.output_model.rows]
 
         return {
             'borehole_position': self.position_input.text(),
@@ -2780,14 +3031,8 @@ class Module6PlaxisScripts(QWidget):
 
             # Load layer table (with dropdowns)
             layer_data = data.get('layer_data', [])
-            self.layer_table.setRowCount(len(layer_data))
-            for row, row_data in enumerate(layer_data):
-                # Setup row with widgets first
-                self._setup_layer_row(row, (0, 0))
-                # Then set values
-                for col, value in enumerate(row_data):
-                    if col < self.layer_table.columnCount():
-                        self._set_layer_cell_value(row, col, value)
+            # Build every row first, then replace the table in a single model reset
+            self.layer_model.set_rows([self._layer_row_from_values(row_data) for row_data in layer_data])
 
             # Load staged construction (build tree from flat data)
             staged_data = data.get('staged_data', [])
@@ -2797,15 +3042,16 @@ class Module6PlaxisScripts(QWidget):
             # Load output table data
             output_data = data.get('output_data', [])
             if output_data:
-                self.output_table.setRowCount(len(output_data))
-                for row, row_dict in enumerate(output_data):
+                rows = []
+                for row_dict in output_data:
                     # Convert string keys back to int for checks
                     checks = {}
                     for k, v in row_dict.get('checks', {}).items():
                         checks[int(k)] = v
                     row_dict_fixed = dict(row_dict)
                     row_dict_fixed['checks'] = checks
-                    self._setup_output_row(row, row_dict_fixed)
+                    rows.append(row_dict_fixed)
+                self._fill_output_rows(rows)
 
         except Exception as e:
             print(f"Error loading Module 6 data: {e}")